@@ -61,6 +61,136 @@ class Config:
         """Get Supabase service role key"""
         return os.getenv("SUPABASE_SERVICE_ROLE_KEY")
 
+    @property
+    def sqlite_path(self) -> str:
+        """Get the database file used by DATA_MODE=sqlite"""
+        return os.getenv("SQLITE_PATH", str(Path(__file__).parent.parent / "data" / "agent_factory.db"))
+
+    @property
+    def db_pool_size(self) -> int:
+        """Get the number of concurrent database calls (worker threads and HTTP connections)"""
+        return int(os.getenv("DB_POOL_SIZE", "16"))
+
+    @property
+    def db_request_timeout(self) -> float:
+        """Get the timeout in seconds for a single database HTTP request"""
+        return float(os.getenv("DB_REQUEST_TIMEOUT", "30"))
+
+    @property
+    def db_http2(self) -> bool:
+        """Whether the Supabase HTTP pool negotiates HTTP/2 (needs httpx[http2])"""
+        return os.getenv("DB_HTTP2", "true").lower() == "true"
+
+    @property
+    def db_keepalive_expiry(self) -> float:
+        """Get how long an idle pooled database connection is kept open, in seconds"""
+        return float(os.getenv("DB_KEEPALIVE_EXPIRY", "60"))
+
+    @property
+    def db_bulk_chunk_size(self) -> int:
+        """Get the number of rows written per request by bulk create endpoints"""
+        return int(os.getenv("DB_BULK_CHUNK_SIZE", "500"))
+
+    @property
+    def db_purge_batch_size(self) -> int:
+        """Get the number of rows deleted per request by clear-all and purge jobs"""
+        return int(os.getenv("DB_PURGE_BATCH_SIZE", "1000"))
+
+    @property
+    def db_in_chunk_size(self) -> int:
+        """Get the number of ids per in() query for batched lookups by id"""
+        return int(os.getenv("DB_IN_CHUNK_SIZE", "100"))
+
+    @property
+    def db_count_mode(self) -> str:
+        """Get the PostgREST count mode for list totals: exact, planned or estimated"""
+        return os.getenv("DB_COUNT_MODE", "exact")
+
+    @property
+    def db_keyset_total_ttl(self) -> float:
+        """Get how long a list total is reused for the cursor pages after it, in seconds"""
+        return float(os.getenv("DB_KEYSET_TOTAL_TTL", "30"))
+
+    @property
+    def db_health_ttl(self) -> float:
+        """Get how long a cached database health check stays valid, in seconds"""
+        return float(os.getenv("DB_HEALTH_TTL", "30"))
+
+    @property
+    def db_health_interval(self) -> float:
+        """Get the interval between background database health probes, in seconds"""
+        return float(os.getenv("DB_HEALTH_INTERVAL", "15"))
+
+    @property
+    def db_retry_attempts(self) -> int:
+        """Get the maximum attempts for a database call that fails transiently"""
+        return int(os.getenv("DB_RETRY_ATTEMPTS", "3"))
+
+    @property
+    def db_retry_base_delay(self) -> float:
+        """Get the smallest backoff between database retries, in seconds"""
+        return float(os.getenv("DB_RETRY_BASE_DELAY", "0.1"))
+
+    @property
+    def db_retry_max_delay(self) -> float:
+        """Get the largest backoff between database retries, in seconds"""
+        return float(os.getenv("DB_RETRY_MAX_DELAY", "2"))
+
+    @property
+    def db_call_deadline(self) -> float:
+        """Get the total time budget for a database call including retries, in seconds"""
+        return float(os.getenv("DB_CALL_DEADLINE", "10"))
+
+    @property
+    def db_breaker_threshold(self) -> int:
+        """Get the consecutive transient failures that open the database circuit breaker"""
+        return int(os.getenv("DB_BREAKER_THRESHOLD", "5"))
+
+    @property
+    def db_breaker_reset(self) -> float:
+        """Get how long the open circuit breaker fails fast before a trial call, in seconds"""
+        return float(os.getenv("DB_BREAKER_RESET", "30"))
+
+    @property
+    def cache_enabled(self) -> bool:
+        """Whether data manager reads go through the entity cache"""
+        return os.getenv("CACHE_ENABLED", "true").lower() == "true"
+
+    @property
+    def cache_max_entries(self) -> int:
+        """Get the size of the in-process entity cache"""
+        return int(os.getenv("CACHE_MAX_ENTRIES", "1024"))
+
+    @property
+    def cache_ttl_prds(self) -> float:
+        """Get how long a cached PRD stays valid, in seconds"""
+        return float(os.getenv("CACHE_TTL_PRDS", "60"))
+
+    @property
+    def cache_ttl_agents(self) -> float:
+        """Get how long a cached agent stays valid, in seconds"""
+        return float(os.getenv("CACHE_TTL_AGENTS", "30"))
+
+    @property
+    def cache_ttl_devin_tasks(self) -> float:
+        """Get how long a cached Devin task stays valid, in seconds"""
+        return float(os.getenv("CACHE_TTL_DEVIN_TASKS", "15"))
+
+    @property
+    def cache_ttl_queries(self) -> float:
+        """Get how long a cached list page stays valid, in seconds"""
+        return float(os.getenv("CACHE_TTL_QUERIES", "5"))
+
+    @property
+    def cache_ttl_counts(self) -> float:
+        """Get how long cached per-status/type counts stay valid, in seconds"""
+        return float(os.getenv("CACHE_TTL_COUNTS", "10"))
+
+    @property
+    def redis_url(self) -> Optional[str]:
+        """Get the Redis URL for the shared cache tier (optional)"""
+        return os.getenv("REDIS_URL")
+
     @property
     def openai_api_key(self) -> Optional[str]:
         """Get OpenAI API key"""
@@ -89,6 +219,71 @@ class Config:
         """Whether to enforce strict PRD validation"""
         return os.getenv("STRICT_PRD", "true").lower() == "true"
 
+    @property
+    def prd_upload_max_bytes(self) -> int:
+        """Get the largest PRD file accepted by the upload endpoint, in bytes"""
+        return int(os.getenv("PRD_UPLOAD_MAX_BYTES", str(5 * 1024 * 1024)))
+
+    @property
+    def prd_upload_chunk_size(self) -> int:
+        """Get how many bytes of an upload are read and parsed at a time"""
+        return int(os.getenv("PRD_UPLOAD_CHUNK_SIZE", str(64 * 1024)))
+
+    @property
+    def prd_parse_cache_size(self) -> int:
+        """Get how many parsed uploads are kept, keyed by content hash"""
+        return int(os.getenv("PRD_PARSE_CACHE_SIZE", "256"))
+
+    @property
+    def prd_parse_cache_ttl(self) -> float:
+        """Get how long a parsed upload is reused, in seconds"""
+        return float(os.getenv("PRD_PARSE_CACHE_TTL", "3600"))
+
+    @property
+    def prd_parse_workers(self) -> int:
+        """Get the number of worker processes parsing batch uploads (0 parses inline)"""
+        return int(os.getenv("PRD_PARSE_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+    @property
+    def prd_batch_max_files(self) -> int:
+        """Get the most PRD files accepted by one batch upload, archives expanded"""
+        return int(os.getenv("PRD_BATCH_MAX_FILES", "500"))
+
+    @property
+    def prd_batch_max_bytes(self) -> int:
+        """Get the largest total (uncompressed) size of one batch upload, in bytes"""
+        return int(os.getenv("PRD_BATCH_MAX_BYTES", str(100 * 1024 * 1024)))
+
+    @property
+    def prd_batch_write_size(self) -> int:
+        """Get how many parsed PRDs are inserted per batched write during a batch upload"""
+        return int(os.getenv("PRD_BATCH_WRITE_SIZE", "50"))
+
+    @property
+    def prd_search_enabled(self) -> bool:
+        """Get whether the in-process PRD full-text search index is maintained"""
+        return os.getenv("PRD_SEARCH_ENABLED", "true").lower() == "true"
+
+    @property
+    def prd_index_load_page_size(self) -> int:
+        """Get how many PRDs are read per query while loading the search and duplicate indexes"""
+        return int(os.getenv("PRD_INDEX_LOAD_PAGE_SIZE", "500"))
+
+    @property
+    def prd_duplicate_detection(self) -> bool:
+        """Get whether new PRDs are checked against a MinHash index for near-duplicates"""
+        return os.getenv("PRD_DUPLICATE_DETECTION", "true").lower() == "true"
+
+    @property
+    def prd_duplicate_threshold(self) -> float:
+        """Get the estimated Jaccard similarity at which two PRDs count as near-duplicates"""
+        return float(os.getenv("PRD_DUPLICATE_THRESHOLD", "0.7"))
+
+    @property
+    def prd_duplicate_policy(self) -> str:
+        """Get what happens to a new PRD with near-duplicates: allow, reject or merge"""
+        return os.getenv("PRD_DUPLICATE_POLICY", "allow").lower()
+
     def validate_config(self) -> dict:
         """Validate configuration and return status"""
         required_vars = [
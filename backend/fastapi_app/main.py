@@ -1,15 +1,22 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Query
 from fastapi.middleware.cors import CORSMiddleware
 
 # Import configuration
 from .config import config
 
 # Import routers
-from .routers import agents, prds, health, devin_integration, mcp_integration
+from .routers import agents, prds, health, devin_integration, mcp_integration, stats, purge
 
-# Import services for clear all endpoint
-from .services.agent_service import agent_service
-from .services.prd_service import prd_service
+# Import the purge service for the clear all endpoint
+from .models.purge import PurgeRequest, PurgeJobStatus
+from .services.purge_service import purge_service
+
+# Import the in-process PRD indexes (search, duplicates), loaded at startup
+from .services.prd_service import PRD_INDEXES
+
+# Import the data manager for background health monitoring
+from .utils.simple_data_manager import data_manager
+from .utils.parse_pool import parse_pool
 
 app = FastAPI(
     title="AI Agent Factory",
@@ -33,6 +40,31 @@ app.include_router(agents.router, prefix="/api/v1", tags=["agents"])
 app.include_router(prds.router, prefix="/api/v1", tags=["prds"])
 app.include_router(devin_integration.router, prefix="/api/v1", tags=["devin"])
 app.include_router(mcp_integration.router, prefix="/api/v1", tags=["mcp"])
+app.include_router(stats.router, prefix="/api/v1", tags=["stats"])
+app.include_router(purge.router, prefix="/api/v1", tags=["purge"])
+
+
+@app.on_event("startup")
+async def start_health_monitors():
+    """Start background database connection monitoring."""
+    data_manager.start_health_monitor()
+
+
+@app.on_event("startup")
+async def load_prd_indexes():
+    """Load the PRD search and duplicate indexes in the background."""
+    for index in PRD_INDEXES:
+        index.start_load()
+
+
+@app.on_event("shutdown")
+async def stop_health_monitors():
+    """Stop background database connection monitoring."""
+    await data_manager.stop_health_monitor()
+    for index in PRD_INDEXES:
+        await index.stop()
+    data_manager.close()
+    parse_pool.shutdown(wait=False)
 
 
 @app.get("/")
@@ -46,25 +78,34 @@ async def root():
 
 
 @app.delete("/api/v1/clear-all")
-async def clear_all_data():
-    """Clear all agents and PRDs from the system."""
-    try:
-        # Clear agents first (to avoid foreign key constraints)
-        agents_result = await agent_service.clear_all_agents()
-        
-        # Then clear PRDs
-        prds_result = await prd_service.clear_all_prds()
-        
+async def clear_all_data(
+    wait: bool = Query(True, description="Wait for the purge to finish instead of returning the job"),
+    skip_audit: bool = Query(False, description="Do not audit each deleted row (Supabase only)")
+):
+    """Clear all agents and PRDs from the system in bounded batches."""
+    # Children first, to avoid foreign key constraints. Devin tasks are left to
+    # the database (ON DELETE CASCADE from their PRD) as before; purge them
+    # explicitly with POST /api/v1/purge.
+    job = purge_service.start_purge(PurgeRequest(tables=["agents", "prds"], skip_audit=skip_audit))
+    if not wait:
         return {
-            "message": "All data cleared successfully",
-            "agents": agents_result,
-            "prds": prds_result
+            "message": "Purge started",
+            "job": job
         }
-    except Exception as e:
+
+    job = await purge_service.wait(job.job_id)
+    if job.status == PurgeJobStatus.FAILED.value:
         return {
-            "message": f"Error clearing data: {str(e)}",
-            "error": True
+            "message": f"Error clearing data: {job.error}",
+            "error": True,
+            "job": job
         }
+    return {
+        "message": "All data cleared successfully",
+        "agents": {"deleted": job.deleted["agents"]},
+        "prds": {"deleted": job.deleted["prds"]},
+        "job": job
+    }
 
 if __name__ == "__main__":
     import uvicorn
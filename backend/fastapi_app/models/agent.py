@@ -66,6 +66,15 @@ class AgentRegistration(BaseModel):
         return v.strip()
 
 
+class AgentBulkRegistration(BaseModel):
+    """Model for registering or upserting many agents in one request."""
+    agents: List[Dict[str, Any]] = Field(
+        ..., min_length=1, max_length=1000,
+        description="Agents in AgentRegistration format; an optional 'id' is kept (required to upsert)")
+    upsert: bool = Field(
+        False, description="Replace agents whose id already exists instead of failing them")
+
+
 class AgentResponse(BaseModel):
     """Model for agent API responses."""
     id: str = Field(..., description="Agent ID")
@@ -109,6 +118,7 @@ class AgentListResponse(BaseModel):
     page: int = Field(..., description="Current page number")
     size: int = Field(..., description="Page size")
     has_next: bool = Field(..., description="Whether there are more pages")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page (keyset pagination)")
 
 
 class AgentHealthResponse(BaseModel):
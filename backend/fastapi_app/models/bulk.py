@@ -0,0 +1,35 @@
+"""
+Bulk operation data models shared by the PRD and agent bulk endpoints.
+"""
+from typing import List, Optional
+from pydantic import BaseModel, Field
+from enum import Enum
+
+
+class BulkItemStatus(str, Enum):
+    """Outcome of a single item in a bulk request."""
+    CREATED = "created"
+    UPSERTED = "upserted"
+    EXISTING = "existing"
+    INVALID = "invalid"
+    FAILED = "failed"
+
+
+class BulkItemResult(BaseModel):
+    """Model for the result of one item in a bulk request."""
+    index: int = Field(..., description="Position of the item in the request")
+    id: Optional[str] = Field(None, description="ID of the written record")
+    status: BulkItemStatus = Field(..., description="Item outcome")
+    error: Optional[str] = Field(None, description="Validation or write error")
+
+    class Config:
+        """Pydantic configuration."""
+        use_enum_values = True
+
+
+class BulkOperationResponse(BaseModel):
+    """Model for bulk create/upsert API responses."""
+    total: int = Field(..., description="Number of items in the request")
+    succeeded: int = Field(..., description="Number of items written")
+    failed: int = Field(..., description="Number of invalid or failed items")
+    results: List[BulkItemResult] = Field(..., description="Per-item results, in request order")
@@ -73,6 +73,7 @@ class DevinTaskListResponse(BaseModel):
     page: int = Field(..., description="Current page number")
     size: int = Field(..., description="Page size")
     has_next: bool = Field(..., description="Whether there are more pages")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page (keyset pagination)")
 
 
 class DevinTaskComplete(BaseModel):
@@ -1,11 +1,13 @@
 """
 PRD (Product Requirements Document) data models.
 """
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field, validator
 from datetime import datetime
 from enum import Enum
 
+from .bulk import BulkItemStatus
+
 
 class PRDType(str, Enum):
     """PRD type enumeration."""
@@ -39,6 +41,13 @@ class PRDEffort(str, Enum):
     EPIC = "epic"
 
 
+class PRDDuplicatePolicy(str, Enum):
+    """What happens to a new PRD that has near-duplicates."""
+    ALLOW = "allow"
+    REJECT = "reject"
+    MERGE = "merge"
+
+
 class PRDCreate(BaseModel):
     """Model for creating a new PRD."""
     title: str = Field(..., min_length=1, max_length=200,
@@ -110,6 +119,29 @@ class PRDCreate(BaseModel):
         return v.strip()
 
 
+class PRDBulkCreate(BaseModel):
+    """Model for creating or upserting many PRDs in one request."""
+    prds: List[Dict[str, Any]] = Field(
+        ..., min_length=1, max_length=1000,
+        description="PRDs in PRDCreate format; an optional 'id' is kept (required to upsert)")
+    upsert: bool = Field(
+        False, description="Replace PRDs whose id already exists instead of failing them")
+
+
+class PRDUploadResult(BaseModel):
+    """Model for one line of a batch upload's NDJSON response."""
+    index: int = Field(..., description="Position of the document in the batch, archives expanded")
+    filename: str = Field(..., description="Uploaded file or archive member name")
+    status: BulkItemStatus = Field(..., description="Document outcome")
+    id: Optional[str] = Field(None, description="ID of the created (or existing) PRD")
+    title: Optional[str] = Field(None, description="Parsed PRD title")
+    error: Optional[str] = Field(None, description="Read, validation or write error")
+
+    class Config:
+        """Pydantic configuration."""
+        use_enum_values = True
+
+
 class PRDUpdate(BaseModel):
     """Model for updating an existing PRD."""
     title: Optional[str] = Field(None, min_length=1, max_length=200)
@@ -144,6 +176,16 @@ class PRDUpdate(BaseModel):
     assignee: Optional[str] = None
     target_sprint: Optional[str] = None
 
+    file_content: Optional[str] = Field(
+        None, description="New document; its changed sections are re-parsed into their columns")
+
+
+class PRDDuplicate(BaseModel):
+    """Model for an existing PRD that is a likely near-duplicate."""
+    id: str = Field(..., description="PRD ID")
+    title: str = Field(..., description="PRD title")
+    similarity: float = Field(..., description="Estimated Jaccard similarity of the PRD texts (0-1)")
+
 
 class PRDResponse(BaseModel):
     """Model for PRD API responses."""
@@ -187,6 +229,44 @@ class PRDResponse(BaseModel):
     # File upload fields
     original_filename: Optional[str] = None
     file_content: Optional[str] = None
+    content_hash: Optional[str] = None
+
+    # Set on create responses when duplicate detection ran; not stored
+    duplicates: Optional[List[PRDDuplicate]] = Field(
+        None, description="Likely near-duplicates of the submitted PRD, most similar first")
+
+    class Config:
+        """Pydantic configuration."""
+        use_enum_values = True
+        json_encoders = {
+            datetime: lambda v: v.isoformat()
+        }
+
+
+class PRDSummary(BaseModel):
+    """Model for PRD list views: the columns a card or roadmap row renders."""
+    id: str = Field(..., description="PRD ID")
+    title: str = Field(..., description="PRD title")
+    description: str = Field(..., description="PRD description")
+    requirements: Optional[List[str]] = Field(
+        None, description="List of requirements (cards fall back on the first)")
+    prd_type: PRDType = Field(..., description="Type of PRD")
+    status: PRDStatus = Field(..., description="PRD status")
+    github_repo_url: Optional[str] = Field(
+        None, description="GitHub repository URL")
+    created_at: datetime = Field(..., description="Creation timestamp")
+    updated_at: Optional[datetime] = Field(
+        None, description="Last update timestamp")
+
+    # Roadmap-specific fields
+    category: Optional[str] = None
+    priority: Optional[PRDPriority] = None
+    effort_estimate: Optional[PRDEffort] = None
+    business_value: Optional[int] = None
+    technical_complexity: Optional[int] = None
+    assignee: Optional[str] = None
+    target_sprint: Optional[str] = None
+    original_filename: Optional[str] = None
 
     class Config:
         """Pydantic configuration."""
@@ -196,6 +276,16 @@ class PRDResponse(BaseModel):
         }
 
 
+# Columns fetched for PRDSummary; keeps file_content and the TEXT[] sections out of list
+# queries, except requirements (dashboard cards fall back on the first one)
+PRD_SUMMARY_COLUMNS = (
+    "id", "title", "description", "requirements", "prd_type", "status", "github_repo_url",
+    "created_at", "updated_at", "category", "priority", "effort_estimate",
+    "business_value", "technical_complexity", "assignee", "target_sprint",
+    "original_filename"
+)
+
+
 class PRDListResponse(BaseModel):
     """Model for PRD list API responses."""
     prds: List[PRDResponse] = Field(..., description="List of PRDs")
@@ -203,6 +293,37 @@ class PRDListResponse(BaseModel):
     page: int = Field(..., description="Current page number")
     size: int = Field(..., description="Page size")
     has_next: bool = Field(..., description="Whether there are more pages")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page (keyset pagination)")
+
+
+class PRDSummaryListResponse(BaseModel):
+    """Model for PRD summary list API responses."""
+    prds: List[PRDSummary] = Field(..., description="List of PRD summaries")
+    total: int = Field(..., description="Total number of PRDs")
+    page: int = Field(..., description="Current page number")
+    size: int = Field(..., description="Page size")
+    has_next: bool = Field(..., description="Whether there are more pages")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page (keyset pagination)")
+
+
+class PRDSearchSnippet(BaseModel):
+    """Model for a highlighted excerpt of a search hit."""
+    field: str = Field(..., description="PRD field the excerpt comes from")
+    snippet: str = Field(..., description="HTML-escaped excerpt with query terms wrapped in <mark>")
+
+
+class PRDSearchHit(BaseModel):
+    """Model for one ranked search result."""
+    prd: PRDSummary = Field(..., description="Matching PRD")
+    score: float = Field(..., description="BM25 relevance score")
+    snippets: List[PRDSearchSnippet] = Field(default_factory=list, description="Excerpts containing query terms")
+
+
+class PRDSearchResponse(BaseModel):
+    """Model for PRD search API responses."""
+    query: str = Field(..., description="Search query")
+    results: List[PRDSearchHit] = Field(..., description="Matching PRDs, best first")
+    count: int = Field(..., description="Number of results returned")
 
 
 class PRDMarkdownResponse(BaseModel):
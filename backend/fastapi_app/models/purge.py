@@ -0,0 +1,63 @@
+"""
+Bulk purge job data models.
+"""
+from typing import Dict, List, Optional
+from pydantic import BaseModel, Field
+from datetime import datetime
+from enum import Enum
+
+
+class PurgeTable(str, Enum):
+    """Tables a purge job may clear."""
+    AGENTS = "agents"
+    DEVIN_TASKS = "devin_tasks"
+    PRDS = "prds"
+    AUDIT_LOGS = "audit_logs"
+    SYSTEM_METRICS = "system_metrics"
+
+
+class PurgeJobStatus(str, Enum):
+    """Purge job status enumeration."""
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class PurgeRequest(BaseModel):
+    """Model for starting a purge job."""
+    # Defaults are not validated, so they are given as values like use_enum_values produces
+    tables: List[PurgeTable] = Field(
+        default_factory=lambda: [PurgeTable.AGENTS.value, PurgeTable.PRDS.value],
+        description="Tables to clear, in order (children before the PRDs they reference); "
+                    "defaults to agents and PRDs, like clear-all")
+    batch_size: Optional[int] = Field(
+        None, ge=1, le=10000, description="Rows deleted per request (default DB_PURGE_BATCH_SIZE)")
+    skip_audit: bool = Field(
+        False, description="Do not write an audit_logs row per deleted record (Supabase only)")
+
+    class Config:
+        """Pydantic configuration."""
+        use_enum_values = True
+
+
+class PurgeJobResponse(BaseModel):
+    """Model for purge job API responses."""
+    job_id: str = Field(..., description="Job ID to poll")
+    status: PurgeJobStatus = Field(..., description="Job status")
+    tables: List[str] = Field(..., description="Tables being cleared, in order")
+    current_table: Optional[str] = Field(None, description="Table being cleared now")
+    deleted: Dict[str, int] = Field(..., description="Rows deleted so far per table")
+    total_deleted: int = Field(..., description="Rows deleted so far")
+    batches: int = Field(..., description="Delete requests completed")
+    skip_audit: bool = Field(..., description="Whether auditing is skipped")
+    created_at: datetime = Field(..., description="When the job was started")
+    finished_at: Optional[datetime] = Field(None, description="When the job finished")
+    error: Optional[str] = Field(None, description="Error that stopped the job")
+
+    class Config:
+        """Pydantic configuration."""
+        use_enum_values = True
+        json_encoders = {
+            datetime: lambda v: v.isoformat()
+        }
@@ -0,0 +1,32 @@
+"""
+Dashboard statistics data models.
+"""
+from typing import Dict
+from pydantic import BaseModel, Field
+from datetime import datetime
+
+
+class EntityCounts(BaseModel):
+    """Model for the row counts of one entity, broken down by column."""
+    total: int = Field(..., description="Total number of records")
+    by_status: Dict[str, int] = Field(..., description="Record count per status")
+    by_type: Dict[str, int] = Field(
+        default_factory=dict,
+        description="Record count per type (PRDs only)")
+    by_health_status: Dict[str, int] = Field(
+        default_factory=dict,
+        description="Record count per health status (agents only)")
+
+
+class StatsResponse(BaseModel):
+    """Model for dashboard statistics API responses."""
+    prds: EntityCounts = Field(..., description="PRD counts by status and PRD type")
+    agents: EntityCounts = Field(..., description="Agent counts by status and health status")
+    devin_tasks: EntityCounts = Field(..., description="Devin task counts by status")
+    generated_at: datetime = Field(..., description="When the counts were read")
+
+    class Config:
+        """Pydantic configuration."""
+        json_encoders = {
+            datetime: lambda v: v.isoformat()
+        }
@@ -6,9 +6,12 @@ from fastapi import APIRouter, HTTPException, Query
 
 from ..models.agent import (
     AgentRegistration, AgentResponse, AgentStatus, AgentHealthStatus,
-    AgentListResponse, AgentHealthResponse, AgentMetricsResponse
+    AgentListResponse, AgentHealthResponse, AgentMetricsResponse,
+    AgentBulkRegistration
 )
+from ..models.bulk import BulkOperationResponse
 from ..services.agent_service import agent_service
+from ..utils.pagination import parse_ids_param
 
 router = APIRouter()
 
@@ -19,15 +22,26 @@ async def create_agent(agent_data: AgentRegistration):
     return await agent_service.create_agent(agent_data)
 
 
+@router.post("/agents/bulk", response_model=BulkOperationResponse)
+async def bulk_create_agents(bulk_data: AgentBulkRegistration):
+    """Register (or upsert) up to 1000 agents with batched writes; reports per-item results."""
+    return await agent_service.bulk_create_agents(bulk_data)
+
+
 @router.get("/agents", response_model=AgentListResponse)
 async def get_agents(
     skip: int = Query(0, ge=0, description="Number of agents to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of agents to return"),
     status: Optional[AgentStatus] = Query(None, description="Filter by agent status"),
-    prd_id: Optional[str] = Query(None, description="Filter by PRD ID")
+    prd_id: Optional[str] = Query(None, description="Filter by PRD ID"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor; takes precedence over skip"),
+    ids: Optional[str] = Query(None, description="Comma-separated agent IDs to fetch in one batched lookup; filters and paging are ignored")
 ):
     """Get a list of agents with optional filtering and pagination."""
-    return await agent_service.get_agents(skip=skip, limit=limit, status=status, prd_id=prd_id)
+    agent_ids = parse_ids_param(ids)
+    if agent_ids is not None:
+        return await agent_service.get_agents_by_ids(agent_ids)
+    return await agent_service.get_agents(skip=skip, limit=limit, status=status, prd_id=prd_id, cursor=cursor)
 
 
 @router.get("/agents/{agent_id}", response_model=AgentResponse)
@@ -9,6 +9,7 @@ from ..models.devin import (
     DevinTaskListResponse, DevinTaskComplete, DevinTaskExecuteResponse
 )
 from ..services.devin_service import devin_service
+from ..utils.pagination import parse_ids_param
 
 router = APIRouter()
 
@@ -24,10 +25,15 @@ async def get_devin_tasks(
     skip: int = Query(0, ge=0, description="Number of tasks to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of tasks to return"),
     status: Optional[DevinTaskStatus] = Query(None, description="Filter by task status"),
-    prd_id: Optional[str] = Query(None, description="Filter by PRD ID")
+    prd_id: Optional[str] = Query(None, description="Filter by PRD ID"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor; takes precedence over skip"),
+    ids: Optional[str] = Query(None, description="Comma-separated task IDs to fetch in one batched lookup; filters and paging are ignored")
 ):
     """Get a list of Devin tasks with optional filtering and pagination."""
-    return await devin_service.get_tasks(skip=skip, limit=limit, status=status, prd_id=prd_id)
+    task_ids = parse_ids_param(ids)
+    if task_ids is not None:
+        return await devin_service.get_tasks_by_ids(task_ids)
+    return await devin_service.get_tasks(skip=skip, limit=limit, status=status, prd_id=prd_id, cursor=cursor)
 
 
 @router.get("/devin/tasks/{task_id}", response_model=DevinTaskResponse)
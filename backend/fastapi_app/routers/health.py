@@ -5,6 +5,12 @@ import sys
 import platform
 from pathlib import Path
 from ..config import config
+from ..utils.simple_data_manager import data_manager
+from ..utils.resilience import db_retry_policy
+from ..utils.db_pool import pool_stats
+from ..utils.parse_pool import parse_pool
+from ..services.prd_search_service import prd_search_service
+from ..services.prd_duplicate_service import prd_duplicate_service
 
 router = APIRouter()
 
@@ -76,6 +82,19 @@ async def detailed_health_check():
             "google_cloud": "configured" if config.google_cloud_project_id else "not_configured"
         }
 
+        # Cached database connection state (no round-trip)
+        health_data["database"] = {
+            "data_manager": data_manager.connection_status(),
+            # Shared worker threads and HTTP keep-alive pool for every table
+            "pool": pool_stats(),
+            # Shared retry policy and circuit breaker for Supabase calls
+            "resilience": db_retry_policy.status()
+        }
+        health_data["cache"] = _cache_stats()
+        health_data["parse_pool"] = parse_pool.stats()
+        health_data["search_index"] = prd_search_service.stats()
+        health_data["duplicate_index"] = prd_duplicate_service.stats()
+
         return health_data
     except Exception as e:
         raise HTTPException(
@@ -92,3 +111,28 @@ async def get_configuration():
         raise HTTPException(
             status_code=500,
             detail=f"Configuration check failed: {str(e)}")
+
+
+def _cache_stats():
+    """Get entity cache counters, or None when the cache is disabled."""
+    return data_manager.cache_stats() if hasattr(data_manager, "cache_stats") else None
+
+
+@router.get("/health/cache")
+async def cache_health():
+    """Entity cache hit/miss/eviction counters for tuning size and TTLs"""
+    return {
+        "enabled": config.cache_enabled,
+        "timestamp": datetime.utcnow().isoformat(),
+        "stats": _cache_stats()
+    }
+
+
+@router.get("/health/pool")
+async def pool_health():
+    """Database worker and HTTP connection pool utilization for tuning DB_POOL_SIZE"""
+    return {
+        "mode": data_manager.mode,
+        "timestamp": datetime.utcnow().isoformat(),
+        "stats": pool_stats()
+    }
@@ -1,34 +1,64 @@
 """
 Refactored PRD router with proper separation of concerns.
 """
-from typing import List, Optional
+from typing import List, Optional, Union
 from fastapi import APIRouter, HTTPException, UploadFile, File, Query
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 
 from ..models.prd import (
     PRDCreate, PRDUpdate, PRDResponse, PRDType, PRDStatus,
-    PRDListResponse, PRDMarkdownResponse
+    PRDListResponse, PRDMarkdownResponse, PRDSummaryListResponse, PRDBulkCreate,
+    PRDSearchResponse, PRDDuplicatePolicy
 )
+from ..models.bulk import BulkOperationResponse
 from ..services.prd_service import prd_service
+from ..utils.pagination import parse_ids_param
 
 router = APIRouter()
 
 
 @router.post("/prds", response_model=PRDResponse)
-async def create_prd(prd_data: PRDCreate):
-    """Create a new PRD."""
-    return await prd_service.create_prd(prd_data)
+async def create_prd(
+    prd_data: PRDCreate,
+    on_duplicate: Optional[PRDDuplicatePolicy] = Query(None, description="What to do when near-duplicates exist (defaults to PRD_DUPLICATE_POLICY)")
+):
+    """Create a new PRD; likely near-duplicates are listed in the response."""
+    return await prd_service.create_prd(prd_data, on_duplicate=on_duplicate)
+
+
+@router.post("/prds/bulk", response_model=BulkOperationResponse)
+async def bulk_create_prds(bulk_data: PRDBulkCreate):
+    """Create (or upsert) up to 1000 PRDs with batched writes; reports per-item results."""
+    return await prd_service.bulk_create_prds(bulk_data)
 
 
-@router.get("/prds", response_model=PRDListResponse)
+@router.get("/prds", response_model=Union[PRDListResponse, PRDSummaryListResponse])
 async def get_prds(
     skip: int = Query(0, ge=0, description="Number of PRDs to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of PRDs to return"),
     prd_type: Optional[PRDType] = Query(None, description="Filter by PRD type"),
-    status: Optional[PRDStatus] = Query(None, description="Filter by PRD status")
+    status: Optional[PRDStatus] = Query(None, description="Filter by PRD status"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor; takes precedence over skip"),
+    view: str = Query("full", pattern="^(full|summary)$", description="'summary' returns only the list columns (no file content or section arrays)"),
+    ids: Optional[str] = Query(None, description="Comma-separated PRD IDs to fetch in one batched lookup; filters and paging are ignored")
 ):
     """Get a list of PRDs with optional filtering and pagination."""
-    return await prd_service.get_prds(skip=skip, limit=limit, prd_type=prd_type, status=status)
+    prd_ids = parse_ids_param(ids)
+    if prd_ids is not None:
+        return await prd_service.get_prds_by_ids(prd_ids, summary=view == "summary")
+    if view == "summary":
+        return await prd_service.get_prd_summaries(skip=skip, limit=limit, prd_type=prd_type, status=status, cursor=cursor)
+    return await prd_service.get_prds(skip=skip, limit=limit, prd_type=prd_type, status=status, cursor=cursor)
+
+
+@router.get("/prds/search", response_model=PRDSearchResponse)
+async def search_prds(
+    q: str = Query(..., min_length=1, max_length=500, description="Free-text query over title, description, problem statement, requirements, user stories and acceptance criteria"),
+    limit: int = Query(20, ge=1, le=100, description="Number of results to return"),
+    prd_type: Optional[PRDType] = Query(None, description="Filter by PRD type")
+):
+    """Search PRDs by relevance, with highlighted snippets."""
+    return await prd_service.search_prds(q, limit=limit, prd_type=prd_type)
 
 
 # Devin AI workflow endpoints (must come before /prds/{prd_id} to avoid routing conflicts)
@@ -37,7 +67,7 @@ async def get_prds_ready_for_devin():
     """Get all PRDs that are ready for Devin AI processing."""
     from ..models.prd import PRDStatus
     
-    prds_response = await prd_service.get_prds(status=PRDStatus.READY_FOR_DEVIN, limit=1000)
+    prds_response = await prd_service.get_prd_summaries(status=PRDStatus.READY_FOR_DEVIN, limit=1000)
     
     return {
         "message": "PRDs ready for Devin AI",
@@ -71,9 +101,29 @@ async def clear_all_prds():
 
 
 @router.post("/prds/upload", response_model=PRDResponse)
-async def upload_prd_file(file: UploadFile = File(...)):
-    """Upload a PRD file (.md or .txt)."""
-    return await prd_service.upload_prd_file(file)
+async def upload_prd_file(
+    file: UploadFile = File(...),
+    return_existing: bool = Query(False, description="Return the existing PRD with identical content instead of creating a duplicate"),
+    on_duplicate: Optional[PRDDuplicatePolicy] = Query(None, description="What to do when near-duplicates exist (defaults to PRD_DUPLICATE_POLICY)")
+):
+    """Upload a PRD file (.md or .txt); likely near-duplicates are listed in the response."""
+    return await prd_service.upload_prd_file(file, return_existing=return_existing, on_duplicate=on_duplicate)
+
+
+@router.put("/prds/{prd_id}/upload", response_model=PRDResponse)
+async def reupload_prd_file(prd_id: str, file: UploadFile = File(...)):
+    """Replace a PRD's document with a new version; only changed sections are re-parsed."""
+    return await prd_service.reupload_prd_file(prd_id, file)
+
+
+@router.post("/prds/upload/batch")
+async def upload_prd_files(
+    files: List[UploadFile] = File(...),
+    return_existing: bool = Query(False, description="Report documents matching an existing PRD instead of creating duplicates")
+):
+    """Upload many PRD files or .zip/.tar archives; streams one NDJSON result per document."""
+    results = await prd_service.upload_prd_files(files, return_existing=return_existing)
+    return StreamingResponse(results, media_type="application/x-ndjson")
 
 
 @router.get("/prds/{prd_id}/markdown", response_model=PRDMarkdownResponse)
@@ -120,7 +170,7 @@ async def get_roadmap_priorities():
 async def get_roadmap():
     """Get the complete roadmap with all PRDs organized by category and status."""
     roadmap_data = prd_service.get_roadmap_data()
-    prds_response = await prd_service.get_prds(limit=1000)  # Get all PRDs
+    prds_response = await prd_service.get_prd_summaries(limit=1000)  # Get all PRDs
     
     return {
         "categories": roadmap_data["categories"],
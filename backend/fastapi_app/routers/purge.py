@@ -0,0 +1,21 @@
+"""
+Bulk purge router: clear tables as background jobs.
+"""
+from fastapi import APIRouter
+
+from ..models.purge import PurgeRequest, PurgeJobResponse
+from ..services.purge_service import purge_service
+
+router = APIRouter()
+
+
+@router.post("/purge", response_model=PurgeJobResponse, status_code=202)
+async def start_purge(request: PurgeRequest):
+    """Start clearing tables in bounded batches; poll the returned job for progress."""
+    return purge_service.start_purge(request)
+
+
+@router.get("/purge/{job_id}", response_model=PurgeJobResponse)
+async def get_purge_job(job_id: str):
+    """Get the progress of a purge job."""
+    return purge_service.get_job(job_id)
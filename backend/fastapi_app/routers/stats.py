@@ -0,0 +1,15 @@
+"""
+Dashboard statistics router.
+"""
+from fastapi import APIRouter
+
+from ..models.stats import StatsResponse
+from ..services.stats_service import stats_service
+
+router = APIRouter()
+
+
+@router.get("/stats", response_model=StatsResponse)
+async def get_stats():
+    """Get PRD, agent and Devin task counts by status and type (cached briefly, reset on writes)."""
+    return await stats_service.get_stats()
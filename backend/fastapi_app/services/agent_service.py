@@ -8,9 +8,15 @@ from fastapi import HTTPException
 
 from ..models.agent import (
     AgentRegistration, AgentResponse, AgentStatus, AgentHealthStatus,
-    AgentListResponse, AgentHealthResponse, AgentMetricsResponse
+    AgentListResponse, AgentHealthResponse, AgentMetricsResponse,
+    AgentBulkRegistration
 )
+from ..models.bulk import BulkOperationResponse
 from ..utils.simple_data_manager import data_manager
+from ..utils.query_spec import QuerySpec
+from ..utils.pagination import next_cursor, parse_cursor_param
+from ..utils.bulk import BulkResults, validate_items
+from ..utils.row_decoder import decode_row, decode_rows
 
 
 class AgentService:
@@ -26,9 +32,50 @@ class AgentService:
             agent_data: AgentRegistration) -> AgentResponse:
         """Create a new agent."""
         agent_id = str(uuid.uuid4())
+        agent_dict = self._build_agent_dict(agent_id, agent_data, datetime.now(timezone.utc))
+
+        # Use simplified data manager
+        saved_agent = await data_manager.create_agent(agent_dict)
+        
+        # Update PRD status to "completed" when agent is successfully created
+        if agent_data.prd_id:
+            try:
+                await self._update_prd_status_to_completed(agent_data.prd_id)
+            except Exception as e:
+                print(f"Failed to update PRD status: {e}")
+        
+        return decode_row(AgentResponse, saved_agent)
+
+    async def bulk_create_agents(self, bulk_data: AgentBulkRegistration) -> BulkOperationResponse:
+        """Validate many agents and write them with batched inserts (or upserts)."""
+        results = BulkResults(len(bulk_data.agents), upsert=bulk_data.upsert)
         now = datetime.now(timezone.utc)
+        valid = validate_items(bulk_data.agents, AgentRegistration, results)
+        rows = [self._build_agent_dict(agent_id, agent_data, now) for _, agent_id, agent_data in valid]
+
+        errors = await data_manager.bulk_write("agents", rows, upsert=bulk_data.upsert)
+
+        completed_prd_ids = set()
+        for (index, agent_id, agent_data), error in zip(valid, errors):
+            results.written(index, agent_id, error)
+            if error is None and agent_data.prd_id:
+                completed_prd_ids.add(agent_data.prd_id)
+
+        # Update each PRD once, however many of its agents were created
+        for prd_id in completed_prd_ids:
+            await self._update_prd_status_to_completed(prd_id)
 
-        agent_dict = {
+        response = results.response()
+        print(f"📦 Bulk agent write: {response.succeeded}/{response.total} succeeded")
+        return response
+
+    def _build_agent_dict(
+            self,
+            agent_id: str,
+            agent_data: AgentRegistration,
+            now: datetime) -> Dict[str, Any]:
+        """Build the stored agent record for a registration request."""
+        return {
             "id": agent_id,
             "name": agent_data.name,
             "description": agent_data.description,
@@ -49,25 +96,6 @@ class AgentService:
             "updated_at": now.isoformat()
         }
 
-        # Use simplified data manager
-        saved_agent = await data_manager.create_agent(agent_dict)
-        
-        # Update PRD status to "completed" when agent is successfully created
-        if agent_data.prd_id:
-            try:
-                await self._update_prd_status_to_completed(agent_data.prd_id)
-            except Exception as e:
-                print(f"Failed to update PRD status: {e}")
-        
-        # Convert datetime strings back to datetime objects for response
-        if saved_agent:
-            saved_agent["created_at"] = datetime.fromisoformat(saved_agent["created_at"].replace('Z', '+00:00'))
-            saved_agent["updated_at"] = datetime.fromisoformat(saved_agent["updated_at"].replace('Z', '+00:00'))
-            if saved_agent.get("last_health_check"):
-                saved_agent["last_health_check"] = datetime.fromisoformat(saved_agent["last_health_check"].replace('Z', '+00:00'))
-        
-        return AgentResponse(**saved_agent)
-
     async def _update_prd_status_to_completed(self, prd_id: str):
         """Update PRD status to completed when agent is created."""
         try:
@@ -92,12 +120,7 @@ class AgentService:
             if data_manager.is_connected():
                 agent_data = await data_manager.get_agent(agent_id)
                 if agent_data:
-                    # Convert datetime strings back to datetime objects
-                    agent_data["created_at"] = datetime.fromisoformat(agent_data["created_at"].replace('Z', '+00:00'))
-                    agent_data["updated_at"] = datetime.fromisoformat(agent_data["updated_at"].replace('Z', '+00:00'))
-                    if agent_data.get("last_health_check"):
-                        agent_data["last_health_check"] = datetime.fromisoformat(agent_data["last_health_check"].replace('Z', '+00:00'))
-                    return AgentResponse(**agent_data)
+                    return decode_row(AgentResponse, agent_data)
         except Exception as e:
             print(f"Database get failed, trying in-memory storage: {e}")
         
@@ -105,32 +128,47 @@ class AgentService:
         if agent_id not in self._agents_db:
             raise HTTPException(status_code=404, detail="Agent not found")
 
-        return AgentResponse(**self._agents_db[agent_id])
+        return decode_row(AgentResponse, self._agents_db[agent_id])
 
     async def get_agents(
         self,
         skip: int = 0,
         limit: int = 100,
         status: Optional[AgentStatus] = None,
-        prd_id: Optional[str] = None
+        prd_id: Optional[str] = None,
+        cursor: Optional[str] = None
     ) -> AgentListResponse:
-        """Get a list of agents with optional filtering."""
-        # Use simplified data manager
-        agents_data = await data_manager.get_agents(skip, limit)
-        
-        # Apply filters
-        filtered_agents = agents_data
-        if status:
-            filtered_agents = [a for a in filtered_agents if a["status"] == status.value]
-        if prd_id:
-            filtered_agents = [a for a in filtered_agents if a.get("prd_id") == prd_id]
+        """Get a list of agents with optional filtering.
+
+        A cursor from a previous response switches from offset to keyset paging.
+        """
+        # Filters and paging are applied by the storage layer
+        spec = QuerySpec(
+            filters={"status": status.value if status else None, "prd_id": prd_id},
+            offset=skip,
+            limit=limit,
+            after=parse_cursor_param(cursor))
+        result = await data_manager.query_agents(spec)
         
         return AgentListResponse(
-            agents=[AgentResponse(**agent) for agent in filtered_agents],
-            total=len(filtered_agents),
+            agents=decode_rows(AgentResponse, result.rows),
+            total=result.total,
             page=skip // limit + 1,
             size=limit,
-            has_next=len(filtered_agents) == limit
+            has_next=result.has_next,
+            next_cursor=next_cursor(result, spec)
+        )
+
+    async def get_agents_by_ids(self, agent_ids: List[str]) -> AgentListResponse:
+        """Get many agents by id with one batched lookup, in request order."""
+        rows = await data_manager.get_agents_by_ids(agent_ids)
+
+        return AgentListResponse(
+            agents=decode_rows(AgentResponse, rows),
+            total=len(rows),
+            page=1,
+            size=len(agent_ids),
+            has_next=False
         )
 
     async def update_agent_status(
@@ -145,7 +183,7 @@ class AgentService:
         agent_dict["status"] = status.value
         agent_dict["updated_at"] = datetime.now(timezone.utc).isoformat()
 
-        return AgentResponse(**agent_dict)
+        return decode_row(AgentResponse, agent_dict)
 
     async def delete_agent(self, agent_id: str) -> Dict[str, str]:
         """Delete an agent."""
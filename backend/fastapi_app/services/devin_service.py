@@ -3,7 +3,7 @@ Devin AI service for business logic operations.
 """
 import uuid
 import re
-from typing import Optional, Dict, Any
+from typing import List, Optional, Dict, Any
 from datetime import datetime
 from fastapi import HTTPException
 
@@ -13,7 +13,11 @@ from ..models.devin import (
 )
 from ..services.agent_service import agent_service
 from ..services.prd_service import prd_service
-from ..utils.database import db_manager
+from ..utils.simple_data_manager import data_manager
+from ..utils.query_spec import QuerySpec
+from ..utils.memory_store import query_rows
+from ..utils.pagination import next_cursor, parse_cursor_param
+from ..utils.row_decoder import decode_row, decode_rows
 
 
 class DevinService:
@@ -50,39 +54,25 @@ class DevinService:
 
         # Try to save to database, fallback to in-memory if database fails
         try:
-            if db_manager.is_connected():
-                saved_task = await db_manager.create_devin_task(task_dict)
+            if data_manager.is_connected():
+                saved_task = await data_manager.create_devin_task(task_dict)
                 if saved_task:
-                    # Convert datetime strings back to datetime objects for response
-                    saved_task["created_at"] = datetime.fromisoformat(saved_task["created_at"].replace('Z', '+00:00'))
-                    saved_task["updated_at"] = datetime.fromisoformat(saved_task["updated_at"].replace('Z', '+00:00'))
-                    if saved_task.get("started_at"):
-                        saved_task["started_at"] = datetime.fromisoformat(saved_task["started_at"].replace('Z', '+00:00'))
-                    if saved_task.get("completed_at"):
-                        saved_task["completed_at"] = datetime.fromisoformat(saved_task["completed_at"].replace('Z', '+00:00'))
-                    return DevinTaskResponse(**saved_task)
+                    return decode_row(DevinTaskResponse, saved_task)
         except Exception as e:
             print(f"Database save failed, using in-memory storage: {e}")
         
         # Fallback to in-memory storage
         self._tasks_db[task_id] = task_dict
-        return DevinTaskResponse(**task_dict)
+        return decode_row(DevinTaskResponse, task_dict)
 
     async def get_task(self, task_id: str) -> DevinTaskResponse:
         """Get a Devin task by ID."""
         # Try to get from database first
         try:
-            if db_manager.is_connected():
-                task_data = await db_manager.get_devin_task(task_id)
+            if data_manager.is_connected():
+                task_data = await data_manager.get_devin_task(task_id)
                 if task_data:
-                    # Convert datetime strings back to datetime objects
-                    task_data["created_at"] = datetime.fromisoformat(task_data["created_at"].replace('Z', '+00:00'))
-                    task_data["updated_at"] = datetime.fromisoformat(task_data["updated_at"].replace('Z', '+00:00'))
-                    if task_data.get("started_at"):
-                        task_data["started_at"] = datetime.fromisoformat(task_data["started_at"].replace('Z', '+00:00'))
-                    if task_data.get("completed_at"):
-                        task_data["completed_at"] = datetime.fromisoformat(task_data["completed_at"].replace('Z', '+00:00'))
-                    return DevinTaskResponse(**task_data)
+                    return decode_row(DevinTaskResponse, task_data)
         except Exception as e:
             print(f"Database get failed, trying in-memory storage: {e}")
         
@@ -90,69 +80,75 @@ class DevinService:
         if task_id not in self._tasks_db:
             raise HTTPException(status_code=404, detail="Devin task not found")
 
-        return DevinTaskResponse(**self._tasks_db[task_id])
+        return decode_row(DevinTaskResponse, self._tasks_db[task_id])
 
     async def get_tasks(
         self,
         skip: int = 0,
         limit: int = 100,
         status: Optional[DevinTaskStatus] = None,
-        prd_id: Optional[str] = None
+        prd_id: Optional[str] = None,
+        cursor: Optional[str] = None
     ) -> DevinTaskListResponse:
-        """Get a list of Devin tasks with optional filtering."""
+        """Get a list of Devin tasks with optional filtering.
+
+        A cursor from a previous response switches from offset to keyset paging.
+        """
+        # Filters and paging are applied by the storage layer
+        spec = QuerySpec(
+            filters={"status": status.value if status else None, "prd_id": prd_id},
+            offset=skip,
+            limit=limit,
+            after=parse_cursor_param(cursor))
+
         # Try to get from database first
         try:
-            if db_manager.is_connected():
-                tasks_data = await db_manager.get_devin_tasks(skip, limit)
-                if tasks_data:
-                    # Convert datetime strings back to datetime objects
-                    for task in tasks_data:
-                        task["created_at"] = datetime.fromisoformat(task["created_at"].replace('Z', '+00:00'))
-                        task["updated_at"] = datetime.fromisoformat(task["updated_at"].replace('Z', '+00:00'))
-                        if task.get("started_at"):
-                            task["started_at"] = datetime.fromisoformat(task["started_at"].replace('Z', '+00:00'))
-                        if task.get("completed_at"):
-                            task["completed_at"] = datetime.fromisoformat(task["completed_at"].replace('Z', '+00:00'))
-                    
-                    # Apply filters
-                    filtered_tasks = tasks_data
-                    if status:
-                        filtered_tasks = [t for t in filtered_tasks if t["status"] == status.value]
-                    if prd_id:
-                        filtered_tasks = [t for t in filtered_tasks if t["prd_id"] == prd_id]
-                    
+            if data_manager.is_connected():
+                result = await data_manager.query_devin_tasks(spec)
+                if result.total:
                     return DevinTaskListResponse(
-                        tasks=[DevinTaskResponse(**task) for task in filtered_tasks],
-                        total=len(filtered_tasks),
+                        tasks=decode_rows(DevinTaskResponse, result.rows),
+                        total=result.total,
                         page=skip // limit + 1,
                         size=limit,
-                        has_next=len(filtered_tasks) == limit
+                        has_next=result.has_next,
+                        next_cursor=next_cursor(result, spec)
                     )
         except Exception as e:
             print(f"Database get_tasks failed, using in-memory storage: {e}")
         
         # Fallback to in-memory storage
-        tasks = list(self._tasks_db.values())
-
-        # Apply filters
-        if status:
-            tasks = [t for t in tasks if t["status"] == status.value]
-        if prd_id:
-            tasks = [t for t in tasks if t["prd_id"] == prd_id]
-
-        # Sort by created_at descending
-        tasks.sort(key=lambda x: x["created_at"], reverse=True)
-
-        # Apply pagination
-        total = len(tasks)
-        tasks = tasks[skip:skip + limit]
+        result = query_rows(self._tasks_db.values(), spec)
 
         return DevinTaskListResponse(
-            tasks=[DevinTaskResponse(**task) for task in tasks],
-            total=total,
+            tasks=decode_rows(DevinTaskResponse, result.rows),
+            total=result.total,
             page=skip // limit + 1,
             size=limit,
-            has_next=skip + limit < total
+            has_next=result.has_next,
+            next_cursor=next_cursor(result, spec)
+        )
+
+    async def get_tasks_by_ids(self, task_ids: List[str]) -> DevinTaskListResponse:
+        """Get many Devin tasks by id with one batched lookup, in request order."""
+        rows = []
+        try:
+            if data_manager.is_connected():
+                rows = await data_manager.get_devin_tasks_by_ids(task_ids)
+        except Exception as e:
+            print(f"Database get_tasks_by_ids failed, using in-memory storage: {e}")
+            rows = []
+        
+        if not rows:
+            # Fallback to in-memory storage
+            rows = [self._tasks_db[task_id] for task_id in task_ids if task_id in self._tasks_db]
+
+        return DevinTaskListResponse(
+            tasks=decode_rows(DevinTaskResponse, rows),
+            total=len(rows),
+            page=1,
+            size=len(task_ids),
+            has_next=False
         )
 
     async def execute_task(self, task_id: str) -> DevinTaskExecuteResponse:
@@ -165,9 +161,10 @@ class DevinService:
                 detail=f"Task is not in pending status. Current status: {task.status}")
 
         # Update task status to in_devin
-        task_dict = self._tasks_db[task_id]
-        task_dict["status"] = DevinTaskStatus.IN_DEVIN.value
-        task_dict["updated_at"] = datetime.utcnow()
+        task_dict = await self._update_task(task_id, {
+            "status": DevinTaskStatus.IN_DEVIN.value,
+            "updated_at": datetime.utcnow().isoformat()
+        })
 
         # Load PRD data into MCP server cache
         await self._load_prd_to_mcp(task_dict.get("prd_id"))
@@ -188,8 +185,8 @@ class DevinService:
         
         # Try to update in database first
         try:
-            if db_manager.is_connected():
-                task_data = await db_manager.get_devin_task(task_id)
+            if data_manager.is_connected():
+                task_data = await data_manager.get_devin_task(task_id)
                 if task_data and task_data["status"] == DevinTaskStatus.IN_DEVIN.value:
                     # Mock completion
                     update_data = {
@@ -199,7 +196,7 @@ class DevinService:
                         "devin_output": f"Mock agent created for task {task_id}",
                         "agent_code": f"# Mock agent code for {task_data['title']}\n# This is a placeholder implementation"
                     }
-                    await db_manager.update_devin_task(task_id, update_data)
+                    await data_manager.update_devin_task(task_id, update_data)
                     
                     # Create a mock agent
                     try:
@@ -270,17 +267,28 @@ class DevinService:
             )
 
         # Update task
-        task_dict = self._tasks_db[task_id]
-        task_dict["status"] = DevinTaskStatus.COMPLETED.value
-        task_dict["devin_output"] = completion_data.devin_output
-        task_dict["agent_code"] = completion_data.agent_code
-        task_dict["updated_at"] = datetime.utcnow()
+        task_dict = await self._update_task(task_id, {
+            "status": DevinTaskStatus.COMPLETED.value,
+            "devin_output": completion_data.devin_output,
+            "agent_code": completion_data.agent_code,
+            "updated_at": datetime.utcnow().isoformat()
+        })
 
         # Create agent from completed task
         if completion_data.deployment_method == "mcp_automatic":
             await self._create_agent_from_task(task_id)
 
-        return DevinTaskResponse(**task_dict)
+        return decode_row(DevinTaskResponse, task_dict)
+
+    async def _update_task(self, task_id: str, update_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply an update to a task in whichever storage holds it."""
+        if task_id in self._tasks_db:
+            self._tasks_db[task_id].update(update_data)
+            return self._tasks_db[task_id]
+        task_dict = await data_manager.update_devin_task(task_id, update_data)
+        if task_dict is None:
+            raise HTTPException(status_code=404, detail="Devin task not found")
+        return task_dict
 
     async def _create_agent_from_task(self, task_id: str) -> None:
         """Create an agent from a completed Devin task with hybrid repository strategy."""
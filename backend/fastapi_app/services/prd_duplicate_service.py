@@ -0,0 +1,109 @@
+"""
+Near-duplicate PRD detection.
+
+Keeps a MinHash signature of every stored PRD's text in an LSH index
+(see ``utils/minhash``), loaded at startup and kept current by
+PRDService, so a new PRD is checked against all stored PRDs by looking
+up a few band buckets instead of comparing it with each of them.
+"""
+import hashlib
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..config import config
+from ..utils.minhash import LSHIndex, shingles, signature
+from .prd_index_service import PRDIndexService
+
+# Columns a PRD's text and listing come from
+DUPLICATE_COLUMNS = ("title", "description", "requirements", "file_content", "content_hash")
+
+# Texts with fewer shingles are too short to compare meaningfully
+MIN_SHINGLES = 10
+
+MAX_DUPLICATES = 5
+
+
+def duplicate_text(fields: Dict[str, Any]) -> str:
+    """Text a PRD is compared by: its document, or its description and requirements."""
+    if fields.get("file_content"):
+        return fields["file_content"]
+    return "\n".join([fields.get("description") or ""] + list(fields.get("requirements") or []))
+
+
+class PRDDuplicateService(PRDIndexService):
+    """Maintains the PRD signature index and finds near-duplicates."""
+
+    name = "PRD duplicate index"
+    columns = DUPLICATE_COLUMNS
+
+    def __init__(self):
+        """Initialize an empty index."""
+        super().__init__()
+        self.index = LSHIndex(config.prd_duplicate_threshold)
+        self._titles: Dict[str, str] = {}
+        # Fingerprint of the text each PRD was signed from, to skip re-signing unchanged text
+        self._fingerprints: Dict[str, str] = {}
+        # Last signature computed, reused when the checked PRD is then stored
+        self._last: Tuple[Optional[str], Optional[array]] = (None, None)
+
+    @property
+    def enabled(self) -> bool:
+        return config.prd_duplicate_detection
+
+    def find_duplicates(self, fields: Dict[str, Any], limit: int = MAX_DUPLICATES) -> List[Dict[str, Any]]:
+        """Stored PRDs likely to duplicate a new PRD's fields, most similar first."""
+        sig = self._signature(fields, self._fingerprint(fields))
+        if sig is None:
+            return []
+        return [
+            {"id": prd_id, "title": self._titles.get(prd_id, ""), "similarity": round(score, 3)}
+            for prd_id, score in self.index.query(sig, limit)
+        ]
+
+    def stats(self) -> Dict[str, Any]:
+        """Index state for health output."""
+        return {**super().stats(), "threshold": self.index.threshold, **self.index.stats()}
+
+    def _fingerprint(self, fields: Dict[str, Any]) -> str:
+        """Hash of a PRD's text (the stored content hash when it has a document)."""
+        if fields.get("file_content") and fields.get("content_hash"):
+            return fields["content_hash"]
+        return hashlib.blake2b(duplicate_text(fields).encode("utf-8"), digest_size=32).hexdigest()
+
+    def _signature(self, fields: Dict[str, Any], fingerprint: str) -> Optional[array]:
+        """Signature of a PRD's text, or None when the text is too short."""
+        if self._last[0] == fingerprint:
+            return self._last[1]
+        hashes = shingles(duplicate_text(fields))
+        sig = signature(hashes) if len(hashes) >= MIN_SHINGLES else None
+        self._last = (fingerprint, sig)
+        return sig
+
+    def _add(self, row: Dict[str, Any]) -> None:
+        """Sign one row's text, unless it is unchanged since it was last signed."""
+        prd_id = row["id"]
+        self._titles[prd_id] = row.get("title") or ""
+        fingerprint = self._fingerprint(row)
+        if self._fingerprints.get(prd_id) == fingerprint:
+            return
+        self._fingerprints[prd_id] = fingerprint
+        sig = self._signature(row, fingerprint)
+        if sig is None:
+            self.index.remove(prd_id)
+        else:
+            self.index.add(prd_id, sig)
+
+    def _remove(self, prd_id: str) -> None:
+        self.index.remove(prd_id)
+        self._titles.pop(prd_id, None)
+        self._fingerprints.pop(prd_id, None)
+
+    def _clear(self) -> None:
+        self.index.clear()
+        self._titles.clear()
+        self._fingerprints.clear()
+        self._last = (None, None)
+
+
+# Global PRD duplicate service instance
+prd_duplicate_service = PRDDuplicateService()
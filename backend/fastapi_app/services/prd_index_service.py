@@ -0,0 +1,141 @@
+"""
+In-process indexes over stored PRDs.
+
+An index service is loaded from the data manager in pages when the app
+starts, in the background, and PRDService keeps it current by handing it
+every PRD row it writes and the id of every PRD it deletes. Writes that
+land while the load is running win over the loaded copy of the same PRD,
+so a slow load never resurrects stale data.
+"""
+import asyncio
+from abc import ABC, abstractmethod
+from contextlib import nullcontext
+from typing import Any, ContextManager, Dict, List, Optional, Set, Tuple
+
+from ..config import config
+from ..utils.query_spec import QuerySpec
+from ..utils.simple_data_manager import data_manager
+
+# Rows handled between yields to the event loop while loading
+LOAD_YIELD_EVERY = 100
+
+
+class PRDIndexService(ABC):
+    """Base class for an in-memory index fed with stored PRD rows."""
+
+    # Name used in log lines
+    name = "PRD index"
+    # Columns the index reads from each row
+    columns: Tuple[str, ...] = ("id",)
+
+    def __init__(self):
+        """Initialize an empty, not yet loaded index."""
+        self.ready = False
+        self.error: Optional[str] = None
+        self._load_task: Optional[asyncio.Task] = None
+        # PRDs written or deleted while a load is running
+        self._touched: Optional[Set[str]] = None
+
+    @property
+    def enabled(self) -> bool:
+        return True
+
+    def start_load(self) -> None:
+        """Load the index from the data manager in the background."""
+        if self.enabled and self._load_task is None:
+            self._load_task = asyncio.create_task(self.load())
+
+    async def stop(self) -> None:
+        """Cancel a running load."""
+        if self._load_task is not None and not self._load_task.done():
+            self._load_task.cancel()
+            try:
+                await self._load_task
+            except asyncio.CancelledError:
+                pass
+        self._load_task = None
+
+    async def load(self) -> None:
+        """(Re)build the index from every stored PRD."""
+        self.ready = False
+        self.error = None
+        self._touched = set()
+        columns = tuple(dict.fromkeys(("id", "created_at") + self.columns))
+        spec = QuerySpec(order_by="created_at", descending=False,
+                         limit=config.prd_index_load_page_size, columns=columns)
+        loaded = 0
+        try:
+            with self._bulk_load():
+                self._clear()
+                while True:
+                    # Pages read once at startup would only evict hot cache entries
+                    result = await data_manager.uncached.query_prds(spec)
+                    for row in result.rows:
+                        if row["id"] not in self._touched:
+                            self._add(row)
+                        loaded += 1
+                        if loaded % LOAD_YIELD_EVERY == 0:
+                            await asyncio.sleep(0)
+                    if not result.has_next or not result.rows:
+                        break
+                    last = result.rows[-1]
+                    value = last.get("created_at")
+                    spec.after = (value.isoformat() if hasattr(value, "isoformat") else value, last["id"])
+            await self._finish_load()
+            self.ready = True
+            print(f"🔎 {self.name} loaded: {loaded} PRDs")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.error = str(e)
+            print(f"❌ {self.name} load failed: {e}")
+        finally:
+            self._touched = None
+
+    def index_prd(self, row: Dict[str, Any]) -> None:
+        """Index a stored PRD row (a full row, as returned by a create or update)."""
+        if not self.enabled or not row.get("id"):
+            return
+        if self._touched is not None:
+            self._touched.add(row["id"])
+        self._add(row)
+
+    def index_prds(self, rows: List[Dict[str, Any]]) -> None:
+        """Index several stored PRD rows."""
+        for row in rows:
+            self.index_prd(row)
+
+    def remove_prd(self, prd_id: str) -> None:
+        """Drop a deleted PRD."""
+        if not self.enabled:
+            return
+        if self._touched is not None:
+            self._touched.add(prd_id)
+        self._remove(prd_id)
+
+    def clear(self) -> None:
+        """Drop every PRD, after the table has been cleared."""
+        self._clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Index state for health output."""
+        return {"enabled": self.enabled, "ready": self.ready, "error": self.error}
+
+    def _bulk_load(self) -> ContextManager:
+        """Context the initial load runs in."""
+        return nullcontext()
+
+    async def _finish_load(self) -> None:
+        """Work left after the rows are loaded and before the index is ready."""
+
+    @abstractmethod
+    def _add(self, row: Dict[str, Any]) -> None:
+        """Index one row, replacing any earlier version."""
+
+    @abstractmethod
+    def _remove(self, prd_id: str) -> None:
+        """Drop one PRD."""
+
+    @abstractmethod
+    def _clear(self) -> None:
+        """Drop every PRD."""
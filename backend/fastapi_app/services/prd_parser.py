@@ -3,11 +3,39 @@ Comprehensive PRD Parser Service
 Extracts all fields from PRD templates and maps them to database schema
 """
 
+import hashlib
 import re
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, date
 import json
 
+from .prd_classifier import PRDTypeClassifier, classify_prd
+
+
+# Sections parsed as lists of items
+LIST_SECTIONS = frozenset([
+    'target_users', 'user_stories', 'requirements',
+    'functional_requirements', 'non_functional_requirements',
+    'platform_requirements', 'infrastructure_requirements',
+    'operational_requirements', 'agent_capabilities',
+    'acceptance_criteria', 'technical_requirements',
+    'security_requirements', 'integration_requirements',
+    'deployment_requirements', 'success_metrics',
+    'key_milestones', 'dependencies', 'risks', 'assumptions'
+])
+
+# Result fields set by sections that fill more than the field named after them
+SECTION_FIELDS = {
+    'timeline': ('timeline', 'start_date', 'target_completion_date', 'key_milestones'),
+}
+
+# Markdown markers stripped from section lines
+LIST_MARKER = re.compile(r'^[\*\-\+]\s*')
+NUMBERED_MARKER = re.compile(r'^\d+\.\s*')
+CHECKBOX_MARKER = re.compile(r'^\s*\[\s*\]\s*')
+BOLD = re.compile(r'\*\*(.*?)\*\*')
+ITALIC = re.compile(r'\*(.*?)\*')
+
 
 class PRDParser:
     """Comprehensive PRD parser that extracts all template fields"""
@@ -38,18 +66,32 @@ class PRDParser:
             'assumptions': r'^##\s*\*?\*?Assumptions\*?\*?\s*$',
             'agent_capabilities': r'^##\s*\*?\*?Agent Capabilities\*?\*?\s*$',
         }
+        # All header patterns as one compiled alternation; the named group
+        # that matched is the section, so each line costs a single match
+        self._section_matcher = re.compile(
+            '|'.join(f'(?P<{name}>{pattern})' for name, pattern in self.section_patterns.items()),
+            re.IGNORECASE
+        )
     
     def parse_prd_content(self, content: str, filename: str = None) -> Dict[str, Any]:
         """
         Parse PRD content and extract all fields according to template structure
         """
-        lines = content.split('\n')
-        
-        # Initialize result with defaults
-        result = {
+        stream = self.stream(filename)
+        stream.feed(content)
+        return stream.close(file_content=content)
+    
+    def stream(self, filename: str = None) -> 'PRDStreamParser':
+        """Start an incremental parse: feed() text chunks, then close() for the result"""
+        return PRDStreamParser(self, filename)
+    
+    def _empty_result(self, filename: str = None) -> Dict[str, Any]:
+        """Parse result with every field at its default"""
+        return {
             'title': 'Untitled PRD',
             'description': '',
             'prd_type': 'agent',  # Default to agent
+            'type_classification': None,
             'problem_statement': '',
             'target_users': [],
             'user_stories': [],
@@ -75,175 +117,133 @@ class PRDParser:
             'risks': [],
             'assumptions': [],
             'original_filename': filename,
-            'file_content': content
+            'file_content': None,
+            'section_index': {}
         }
+    
+    def reparse(self, content: str, previous_index: Optional[Dict[str, Dict[str, Any]]],
+                filename: str = None) -> Dict[str, Any]:
+        """
+        Re-parse edited content, parsing only sections whose hash changed.
         
-        # Extract title first
-        result['title'] = self._extract_title(lines)
-        
-        # Determine PRD type based on content
-        result['prd_type'] = self._determine_prd_type(content, filename)
-        
-        # Parse all sections
-        sections = self._identify_sections(lines)
-        
-        for section_name, section_content in sections.items():
-            if section_name in result:
-                if section_name in ['target_users', 'user_stories', 'requirements', 
-                                  'functional_requirements', 'non_functional_requirements',
-                                  'platform_requirements', 'infrastructure_requirements',
-                                  'operational_requirements', 'agent_capabilities',
-                                  'acceptance_criteria', 'technical_requirements',
-                                  'security_requirements', 'integration_requirements',
-                                  'deployment_requirements', 'success_metrics',
-                                  'key_milestones', 'dependencies', 'risks', 'assumptions']:
-                    result[section_name] = self._parse_list_section(section_content)
-                elif section_name == 'performance_requirements':
-                    result[section_name] = self._parse_performance_requirements(section_content)
-                elif section_name == 'timeline':
-                    timeline_data = self._parse_timeline(section_content)
-                    result['timeline'] = timeline_data['timeline']
-                    result['start_date'] = timeline_data['start_date']
-                    result['target_completion_date'] = timeline_data['target_completion_date']
-                    result['key_milestones'] = timeline_data['key_milestones']
-                else:
-                    result[section_name] = self._parse_text_section(section_content)
+        Args:
+            content: The new document
+            previous_index: 'section_index' of the previous parse; None
+                parses every section
+            filename: Filename used for type detection
         
-        return result
+        Returns:
+            The parse result fields the edit can have changed: title,
+            prd_type, type_classification, section_index, and the fields of
+            every added, changed or removed section (removed ones at their
+            defaults)
+        """
+        defaults = self._empty_result(filename)
+        if previous_index is None:
+            result = self.parse_prd_content(content, filename)
+            touched = set(defaults) - {'original_filename', 'file_content'}
+            return {field: result[field] for field in touched}
+        
+        lines = content.split('\n')
+        finder = _TitleFinder()
+        splitter = _SectionSplitter(self)
+        title_done = False
+        sections: Dict[str, List[str]] = {}
+        section_index: Dict[str, Dict[str, Any]] = {}
+        
+        def complete(completed: Optional[Tuple[str, List[str]]]) -> None:
+            if completed:
+                sections[completed[0]] = completed[1]
+                section_index[completed[0]] = section_entry(splitter.last_span, completed[1])
+        
+        for line in lines:
+            line_stripped = line.strip()
+            if not title_done:
+                title_done = finder.feed(line_stripped)
+            complete(splitter.feed(line, line_stripped))
+        complete(splitter.close())
+        
+        result = dict(defaults)
+        result['title'] = finder.title()
+        touched = {'title'}
+        for section_name, entry in section_index.items():
+            previous = previous_index.get(section_name)
+            # A title section overrides the detected title, so it is always applied
+            if section_name == 'title' or previous is None or previous.get('hash') != entry['hash']:
+                self._apply_section(result, section_name, self._parse_section(section_name, sections[section_name]))
+                touched.update(SECTION_FIELDS.get(section_name, (section_name,)))
+        for section_name in previous_index.keys() - section_index.keys():
+            touched.update(SECTION_FIELDS.get(section_name, (section_name,)))
+        
+        classification = classify_prd(content, filename)
+        changes = {field: result[field] for field in touched if field in defaults}
+        changes['prd_type'] = classification.prd_type
+        changes['type_classification'] = classification.to_dict()
+        changes['section_index'] = section_index
+        return changes
+    
+    def _parse_section(self, section_name: str, section_content: List[str]) -> Any:
+        """Parse the lines of one section into its field value"""
+        if section_name in LIST_SECTIONS:
+            return self._parse_list_section(section_content)
+        elif section_name == 'performance_requirements':
+            return self._parse_performance_requirements(section_content)
+        elif section_name == 'timeline':
+            return self._parse_timeline(section_content)
+        else:
+            return self._parse_text_section(section_content)
+    
+    def _apply_section(self, result: Dict[str, Any], section_name: str, value: Any) -> None:
+        """Store a parsed section value in the parse result"""
+        if section_name not in result:
+            return
+        if section_name == 'timeline':
+            result['timeline'] = value['timeline']
+            result['start_date'] = value['start_date']
+            result['target_completion_date'] = value['target_completion_date']
+            result['key_milestones'] = value['key_milestones']
+        else:
+            result[section_name] = value
     
     def _extract_title(self, lines: List[str]) -> str:
         """Extract title from PRD content with improved logic"""
         if not lines:
             return "Untitled PRD"
 
-        # First, look for explicit title sections
-        for i, line in enumerate(lines):
-            line = line.strip()
-            if line.lower() in ['## title', '## **title**', '### title', '### **title**']:
-                # Found a title section, get the next non-empty line
-                for j in range(i + 1, min(i + 3, len(lines))):
-                    next_line = lines[j].strip()
-                    if next_line and not next_line.startswith('#'):
-                        return next_line
-
-        # Look for the first meaningful heading (H1 or H2)
+        finder = _TitleFinder()
         for line in lines:
-            line = line.strip()
-            if line.startswith('# '):
-                # H1 heading - this is likely the main title
-                title = line[2:].strip()
-                if title and len(title) > 3:  # Must be meaningful
-                    return title
-            elif line.startswith('## ') and not any(keyword in line.lower() for keyword in ['description', 'overview', 'summary', 'introduction', 'title']):
-                # H2 heading that's not a section header
-                title = line[3:].strip()
-                if title and len(title) > 3:
-                    return title
-
-        # Look for title patterns in the first few lines
-        for i, line in enumerate(lines[:5]):  # Check first 5 lines
-            line = line.strip()
-            if not line:
-                continue
-
-            # Skip common PRD headers
-            if any(header in line.lower() for header in [
-                'product requirements document',
-                'prd',
-                'document information',
-                'table of contents',
-                'overview',
-                'summary'
-            ]):
-                continue
-
-            # Look for title-like patterns
-            if (len(line) > 5 and len(line) < 100 and
-                not line.startswith('#') and
-                not line.startswith('-') and
-                not line.startswith('*') and
-                not line.startswith('1.') and
-                not line.startswith('2.') and
-                not line.startswith('3.') and
-                not line.startswith('4.') and
-                not line.startswith('5.') and
-                not line.startswith('##') and
-                not line.startswith('###')):
-                return line
-
-        # Fallback: use first non-empty line
-        for line in lines:
-            line = line.strip()
-            if line and len(line) > 3:
-                return line[:100]  # Limit length
-
-        return "Untitled PRD"
+            if finder.feed(line.strip()):
+                break
+        return finder.title()
     
     def _determine_prd_type(self, content: str, filename: str = None) -> str:
         """Determine PRD type based on content and filename"""
-        content_lower = content.lower()
-        
-        # Check filename for type indicators
-        if filename:
-            filename_lower = filename.lower()
-            if 'platform' in filename_lower:
-                return 'platform'
-            elif 'agent' in filename_lower:
-                return 'agent'
-        
-        # Check content for type indicators
-        platform_indicators = [
-            'platform', 'infrastructure', 'system', 'deployment', 
-            'scalability', 'monitoring', 'operational'
-        ]
-        
-        agent_indicators = [
-            'ai agent', 'agent', 'artificial intelligence', 'machine learning',
-            'automation', 'chatbot', 'assistant', 'intelligent'
-        ]
-        
-        platform_score = sum(1 for indicator in platform_indicators if indicator in content_lower)
-        agent_score = sum(1 for indicator in agent_indicators if indicator in content_lower)
-        
-        if platform_score > agent_score:
-            return 'platform'
-        else:
-            return 'agent'  # Default to agent
+        return classify_prd(content, filename).prd_type
     
     def _identify_sections(self, lines: List[str]) -> Dict[str, List[str]]:
         """Identify and extract all sections from PRD content"""
         sections = {}
-        current_section = None
-        current_content = []
+        splitter = _SectionSplitter(self)
         
         for line in lines:
-            line_stripped = line.strip()
-            
-            # Check if this line is a section header
-            section_found = None
-            for section_name, pattern in self.section_patterns.items():
-                if re.match(pattern, line_stripped, re.IGNORECASE):
-                    section_found = section_name
-                    break
-            
-            if section_found:
-                # Save previous section
-                if current_section and current_content:
-                    sections[current_section] = current_content
-                
-                # Start new section
-                current_section = section_found
-                current_content = []
-            elif current_section and line_stripped:
-                # Add content to current section
-                current_content.append(line)
-        
-        # Save last section
-        if current_section and current_content:
-            sections[current_section] = current_content
+            completed = splitter.feed(line, line.strip())
+            if completed:
+                sections[completed[0]] = completed[1]
+        
+        completed = splitter.close()
+        if completed:
+            sections[completed[0]] = completed[1]
         
         return sections
     
+    def _match_section_header(self, line: str) -> Optional[str]:
+        """Return the section a stripped line is the header of, if any"""
+        # Every header pattern starts with '#', so body lines skip the regex
+        if not line.startswith('#'):
+            return None
+        match = self._section_matcher.match(line)
+        return match.lastgroup if match else None
+    
     def _parse_list_section(self, content: List[str]) -> List[str]:
         """Parse a section that contains a list of items"""
         items = []
@@ -254,13 +254,14 @@ class PRDParser:
                 continue
             
             # Remove markdown list markers
-            line = re.sub(r'^[\*\-\+]\s*', '', line)
-            line = re.sub(r'^\d+\.\s*', '', line)
-            line = re.sub(r'^\s*\[\s*\]\s*', '', line)  # Remove checkbox markers
+            line = LIST_MARKER.sub('', line)
+            line = NUMBERED_MARKER.sub('', line)
+            line = CHECKBOX_MARKER.sub('', line)  # Remove checkbox markers
             
             # Remove bold/italic markers
-            line = re.sub(r'\*\*(.*?)\*\*', r'\1', line)
-            line = re.sub(r'\*(.*?)\*', r'\1', line)
+            if '*' in line:
+                line = BOLD.sub(r'\1', line)
+                line = ITALIC.sub(r'\1', line)
             
             if line and len(line) > 2:
                 items.append(line)
@@ -275,8 +276,9 @@ class PRDParser:
             line = line.strip()
             if line and not line.startswith('---'):
                 # Remove markdown formatting
-                line = re.sub(r'\*\*(.*?)\*\*', r'\1', line)
-                line = re.sub(r'\*(.*?)\*', r'\1', line)
+                if '*' in line:
+                    line = BOLD.sub(r'\1', line)
+                    line = ITALIC.sub(r'\1', line)
                 text_lines.append(line)
         
         return '\n'.join(text_lines)
@@ -392,3 +394,216 @@ class PRDParser:
             validation_result['warnings'].append("PRD has low completeness score - consider adding more details")
         
         return validation_result
+
+
+def section_entry(span: Tuple[int, int], section_content: List[str]) -> Dict[str, Any]:
+    """Section index entry: line span (header line, end exclusive) and content hash"""
+    digest = hashlib.blake2b('\n'.join(section_content).encode('utf-8'), digest_size=16)
+    return {'start': span[0], 'end': span[1], 'hash': digest.hexdigest()}
+
+
+_worker_parser: Optional[PRDParser] = None
+
+
+def parse_document(content: str, filename: str = None) -> Dict[str, Any]:
+    """
+    Parse and validate one PRD document (parse pool entry point).
+
+    Module-level so worker processes can unpickle it; each worker builds
+    its parser once. The result has a 'validation' entry and no
+    file_content, which the caller already holds.
+    """
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = PRDParser()
+    parsed_data = _worker_parser.parse_prd_content(content, filename)
+    parsed_data['file_content'] = None
+    parsed_data['validation'] = _worker_parser.validate_prd_structure(parsed_data)
+    return parsed_data
+
+
+class PRDStreamParser:
+    """
+    Incremental PRD parse over text chunks.
+
+    Lines are split out of the chunks as they arrive; each section is
+    parsed as soon as the next header closes it, so only the open section's
+    lines are held. Produces the same result as parse_prd_content.
+    """
+    
+    def __init__(self, parser: PRDParser, filename: str = None):
+        self.parser = parser
+        self.filename = filename
+        self.sections: Dict[str, Any] = {}
+        self._partial = ''
+        self._title = _TitleFinder()
+        self._title_done = False
+        self._type = PRDTypeClassifier(filename)
+        self._splitter = _SectionSplitter(parser)
+        self.section_index: Dict[str, Dict[str, Any]] = {}
+    
+    def feed(self, text: str) -> List[Tuple[str, Any]]:
+        """Parse the next chunk of text; returns the sections it completed"""
+        self._type.feed(text)
+        lines = text.split('\n')
+        lines[0] = self._partial + lines[0]
+        self._partial = lines.pop()
+        
+        emitted = []
+        for line in lines:
+            self._feed_line(line, emitted)
+        return emitted
+    
+    def close(self, file_content: Optional[str] = None) -> Dict[str, Any]:
+        """Finish the parse and build the result"""
+        emitted = []
+        self._feed_line(self._partial, emitted)
+        self._partial = ''
+        completed = self._splitter.close()
+        if completed:
+            self._emit(completed, emitted)
+        
+        result = self.parser._empty_result(self.filename)
+        result['file_content'] = file_content
+        result['title'] = self._title.title()
+        classification = self._type.result()
+        result['prd_type'] = classification.prd_type
+        result['type_classification'] = classification.to_dict()
+        result['section_index'] = self.section_index
+        for section_name, value in self.sections.items():
+            self.parser._apply_section(result, section_name, value)
+        return result
+    
+    def _feed_line(self, line: str, emitted: List[Tuple[str, Any]]) -> None:
+        line_stripped = line.strip()
+        if not self._title_done:
+            self._title_done = self._title.feed(line_stripped)
+        completed = self._splitter.feed(line, line_stripped)
+        if completed:
+            self._emit(completed, emitted)
+    
+    def _emit(self, completed: Tuple[str, List[str]], emitted: List[Tuple[str, Any]]) -> None:
+        section_name, section_content = completed
+        value = self.parser._parse_section(section_name, section_content)
+        self.sections[section_name] = value
+        self.section_index[section_name] = section_entry(self._splitter.last_span, section_content)
+        emitted.append((section_name, value))
+
+
+class _SectionSplitter:
+    """Groups lines under the section header above them"""
+    
+    def __init__(self, parser: PRDParser):
+        self._match_header = parser._match_section_header
+        self.current_section = None
+        self.current_content: List[str] = []
+        self.line_no = 0
+        self.current_start = 0
+        # (header line, end line) of the section last returned, end exclusive
+        self.last_span: Optional[Tuple[int, int]] = None
+    
+    def feed(self, line: str, line_stripped: str) -> Optional[Tuple[str, List[str]]]:
+        """Add a line; returns the previous section if this line closes it"""
+        line_no = self.line_no
+        self.line_no += 1
+        # Check if this line is a section header
+        section_found = self._match_header(line_stripped)
+        
+        if section_found:
+            completed = self._complete(line_no)
+            # Start new section
+            self.current_section = section_found
+            self.current_content = []
+            self.current_start = line_no
+            return completed
+        elif self.current_section and line_stripped:
+            # Add content to current section
+            self.current_content.append(line)
+        return None
+    
+    def close(self) -> Optional[Tuple[str, List[str]]]:
+        """Return the open section, if it has any content"""
+        return self._complete(self.line_no)
+    
+    def _complete(self, end: int) -> Optional[Tuple[str, List[str]]]:
+        if self.current_section and self.current_content:
+            self.last_span = (self.current_start, end)
+            return self.current_section, self.current_content
+        return None
+
+
+# Headings that introduce an explicit title section
+TITLE_SECTION_HEADERS = frozenset(['## title', '## **title**', '### title', '### **title**'])
+
+# Lines skipped when looking for a title at the top of the document
+TITLE_SKIP_HEADERS = (
+    'product requirements document',
+    'prd',
+    'document information',
+    'table of contents',
+    'overview',
+    'summary'
+)
+
+
+class _TitleFinder:
+    """
+    Title detection over stripped lines, in order of preference: the line
+    after an explicit title section, the first meaningful H1/H2 heading, a
+    title-like line among the first five, the first non-trivial line.
+    """
+    
+    def __init__(self):
+        self._line_no = 0
+        self._last_marker: Optional[int] = None
+        self._explicit: Optional[str] = None
+        self._heading: Optional[str] = None
+        self._early: Optional[str] = None
+        self._first_line: Optional[str] = None
+    
+    def feed(self, line: str) -> bool:
+        """Look at the next stripped line; True once the title is settled"""
+        line_no = self._line_no
+        self._line_no += 1
+        
+        # An explicit title section takes the next non-heading line within two lines
+        if (self._last_marker is not None and line_no - self._last_marker <= 2
+                and line and not line.startswith('#')):
+            self._explicit = line
+            return True
+        
+        if line.startswith('#'):
+            line_lower = line.lower()
+            if line_lower in TITLE_SECTION_HEADERS:
+                self._last_marker = line_no
+            
+            if self._heading is None:
+                if line.startswith('# '):
+                    # H1 heading - this is likely the main title
+                    title = line[2:].strip()
+                    if title and len(title) > 3:  # Must be meaningful
+                        self._heading = title
+                elif line.startswith('## ') and not any(keyword in line_lower for keyword in ['description', 'overview', 'summary', 'introduction', 'title']):
+                    # H2 heading that's not a section header
+                    title = line[3:].strip()
+                    if title and len(title) > 3:
+                        self._heading = title
+        
+        # Look for title patterns in the first few lines
+        if line_no < 5 and self._early is None and line:
+            if (not any(header in line.lower() for header in TITLE_SKIP_HEADERS) and
+                    len(line) > 5 and len(line) < 100 and
+                    not line.startswith(('#', '-', '*', '1.', '2.', '3.', '4.', '5.'))):
+                self._early = line
+        
+        if self._first_line is None and line and len(line) > 3:
+            self._first_line = line[:100]  # Limit length
+        
+        return False
+    
+    def title(self) -> str:
+        """The best title seen so far"""
+        for candidate in (self._explicit, self._heading, self._early, self._first_line):
+            if candidate is not None:
+                return candidate
+        return "Untitled PRD"
@@ -0,0 +1,138 @@
+"""
+Full-text search over PRDs.
+
+Wraps a BM25 ``SearchIndex`` over the PRD text columns, loaded at
+startup and kept current by PRDService (see ``PRDIndexService``).
+Reweights of the index run as a background task that yields to the
+event loop between chunks, so no request waits for one.
+"""
+import asyncio
+from typing import Any, ContextManager, Dict, List, Optional, Tuple
+
+from ..config import config
+from ..utils.search_index import SearchIndex, highlight, query_terms
+from .prd_index_service import PRDIndexService
+
+# Indexed columns and their weights, in the order snippets are taken from
+SEARCH_FIELDS = {
+    "title": 3.0,
+    "description": 1.5,
+    "problem_statement": 1.5,
+    "requirements": 1.0,
+    "user_stories": 1.0,
+    "acceptance_criteria": 1.0,
+}
+
+# Columns the index filters on
+SEARCH_FILTERS = ("prd_type",)
+
+MAX_SNIPPETS = 3
+
+
+class PRDSearchService(PRDIndexService):
+    """Maintains the PRD search index and answers queries."""
+
+    name = "PRD search index"
+    columns = tuple(SEARCH_FIELDS) + SEARCH_FILTERS
+
+    def __init__(self):
+        """Initialize an empty index."""
+        super().__init__()
+        self.index = SearchIndex(SEARCH_FIELDS)
+        self._reweight_task: Optional[asyncio.Task] = None
+
+    @property
+    def enabled(self) -> bool:
+        return config.prd_search_enabled
+
+    def search(self, query: str, limit: int, prd_type: Optional[str] = None) -> List[Tuple[str, float]]:
+        """Ranked (PRD id, score) pairs for a query."""
+        where = {"prd_type": prd_type} if prd_type else None
+        return self.index.search(query, limit, where)
+
+    def snippets(self, row: Dict[str, Any], query: str) -> List[Dict[str, str]]:
+        """Highlighted snippets of a PRD's fields that contain query terms, best field first."""
+        terms = set(query_terms(query))
+        found = []
+        for field in SEARCH_FIELDS:
+            value = row.get(field)
+            texts = [value] if isinstance(value, str) else (value or [])
+            for text in texts:
+                snippet = highlight(text, terms) if text else None
+                if snippet is not None:
+                    found.append({"field": field, "snippet": snippet})
+                    break
+            if len(found) == MAX_SNIPPETS:
+                break
+        return found
+
+    def stats(self) -> Dict[str, Any]:
+        """Index state for health output."""
+        return {**super().stats(), **self.index.stats()}
+
+    async def stop(self) -> None:
+        """Cancel a running load or reweight."""
+        await super().stop()
+        task, self._reweight_task = self._reweight_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def _schedule_reweight(self) -> None:
+        """Start a background reweight if the index needs one."""
+        if not self.index.needs_reweight:
+            return
+        if self._reweight_task is not None and not self._reweight_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (scripts): nothing to keep responsive
+            self.index.reweight()
+            return
+        self._reweight_task = loop.create_task(self._reweight())
+
+    async def _reweight(self) -> None:
+        """Run a reweight in steps, yielding to the event loop after each."""
+        steps = self.index.reweight_steps()
+        try:
+            for _ in steps:
+                await asyncio.sleep(0)
+        finally:
+            steps.close()
+
+    async def _finish_load(self) -> None:
+        """Compute the loaded documents' impacts before searches are served."""
+        while True:
+            if self._reweight_task is not None and not self._reweight_task.done():
+                # Also waits out a reweight the load abandoned, then starts a fresh one
+                await self._reweight_task
+            elif self.index.needs_reweight:
+                self._schedule_reweight()
+            else:
+                return
+
+    def _bulk_load(self) -> ContextManager:
+        return self.index.bulk_load()
+
+    def _add(self, row: Dict[str, Any]) -> None:
+        """Index one row's text and filter columns."""
+        self.index.add(
+            row["id"],
+            {field: row.get(field) for field in SEARCH_FIELDS},
+            {column: row.get(column) for column in SEARCH_FILTERS})
+        self._schedule_reweight()
+
+    def _remove(self, prd_id: str) -> None:
+        self.index.remove(prd_id)
+        self._schedule_reweight()
+
+    def _clear(self) -> None:
+        self.index.clear()
+
+
+# Global PRD search service instance
+prd_search_service = PRDSearchService()
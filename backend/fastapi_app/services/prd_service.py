@@ -1,18 +1,106 @@
 """
 PRD service for business logic operations.
 """
+import asyncio
+import codecs
+import hashlib
+import json
+import posixpath
 import uuid
 import re
-from typing import Optional, Dict, Any
+import weakref
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional, Dict, Any, List, Tuple, Union
 from datetime import datetime
 from fastapi import HTTPException, UploadFile
+from pydantic import ValidationError
 
 from ..models.prd import (
     PRDCreate, PRDUpdate, PRDResponse, PRDType, PRDStatus,
-    PRDListResponse, PRDMarkdownResponse
+    PRDListResponse, PRDMarkdownResponse, PRDSummary, PRDSummaryListResponse,
+    PRD_SUMMARY_COLUMNS, PRDBulkCreate, PRDUploadResult, PRDSearchHit, PRDSearchResponse,
+    PRDDuplicate, PRDDuplicatePolicy
 )
+from ..models.bulk import BulkOperationResponse, BulkItemStatus
+from ..config import config
 from ..utils.simple_data_manager import data_manager
-from .prd_parser import PRDParser
+from ..utils.query_spec import QuerySpec, QueryResult
+from ..utils.memory_store import query_rows
+from ..utils.pagination import next_cursor, parse_cursor_param
+from ..utils.bulk import BulkResults, validate_items, format_validation_error
+from ..utils.row_decoder import decode_row, decode_rows
+from ..utils.validation import validate_file_size
+from ..utils.errors import create_error_response
+from ..utils.cache import LRUCache
+from ..utils.archives import is_archive, expand_archive
+from ..utils.parse_pool import parse_pool
+from .prd_parser import PRDParser, PRDStreamParser, parse_document
+from .prd_classifier import classify_prd
+from .prd_search_service import SEARCH_FIELDS, prd_search_service
+from .prd_duplicate_service import prd_duplicate_service
+
+# In-process indexes kept current with every PRD write
+PRD_INDEXES = (prd_search_service, prd_duplicate_service)
+
+# Columns a search hit needs: its summary plus the fields snippets come from
+SEARCH_HIT_COLUMNS = tuple(dict.fromkeys(PRD_SUMMARY_COLUMNS + tuple(SEARCH_FIELDS)))
+
+# Columns filled from a parsed document (besides prd_type)
+PARSED_COLUMNS = (
+    "title", "description", "requirements", "problem_statement",
+    "target_users", "user_stories", "acceptance_criteria",
+    "technical_requirements", "performance_requirements",
+    "security_requirements", "integration_requirements",
+    "deployment_requirements", "success_metrics", "timeline",
+    "dependencies", "risks", "assumptions",
+)
+
+
+@dataclass
+class BatchDocument:
+    """One document of a batch upload, after reading."""
+    index: int
+    filename: str
+    content: Optional[str] = None
+    content_hash: Optional[str] = None
+    error: Optional[str] = None
+
+
+class UploadParse:
+    """
+    Incremental parse fed while an upload is read.
+
+    A parser error stops the feeding and is raised again by close(), so
+    reading always finishes and the caller falls back on the content.
+    """
+
+    def __init__(self, stream: PRDStreamParser):
+        self.stream = stream
+        self.error: Optional[Exception] = None
+
+    def feed(self, text: str) -> None:
+        if self.error is None:
+            try:
+                self.stream.feed(text)
+            except Exception as e:
+                self.error = e
+
+    def close(self) -> Dict[str, Any]:
+        if self.error is not None:
+            raise self.error
+        return self.stream.close()
+
+
+def new_content_hasher():
+    """BLAKE2b hasher for PRD file content (fed the UTF-8 bytes)."""
+    return hashlib.blake2b(digest_size=32)
+
+
+def content_hash(content: str) -> str:
+    """Hash PRD file content, matching the hash taken while an upload is read."""
+    hasher = new_content_hasher()
+    hasher.update(content.encode('utf-8'))
+    return hasher.hexdigest()
 
 
 class PRDService:
@@ -26,13 +114,133 @@ class PRDService:
             "priorities": ["low", "medium", "high", "critical"]
         }
         self.parser = PRDParser()
+        self._parse_cache = LRUCache(config.prd_parse_cache_size)
+        self._edit_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
 
-    async def create_prd(self, prd_data: PRDCreate) -> PRDResponse:
-        """Create a new PRD."""
+    async def create_prd(
+            self,
+            prd_data: PRDCreate,
+            section_index: Optional[Dict[str, Any]] = None,
+            on_duplicate: Optional[PRDDuplicatePolicy] = None) -> PRDResponse:
+        """
+        Create a new PRD (section_index comes from parsing its file_content).
+
+        The PRD is first checked for near-duplicates among stored PRDs;
+        on_duplicate (default PRD_DUPLICATE_POLICY) decides whether any
+        found are only reported in the response, reject the create with
+        409, or get the new content merged into the most similar one.
+        """
         prd_id = str(uuid.uuid4())
+        prd_dict = self._build_prd_dict(prd_id, prd_data, datetime.utcnow(), section_index)
+
+        duplicates = self._find_duplicates(prd_dict)
+        if duplicates:
+            policy = on_duplicate or PRDDuplicatePolicy(config.prd_duplicate_policy)
+            if policy == PRDDuplicatePolicy.REJECT:
+                raise create_error_response(
+                    "PRD is a near-duplicate of an existing PRD", status_code=409,
+                    details={"duplicates": [duplicate.dict() for duplicate in duplicates]})
+            if policy == PRDDuplicatePolicy.MERGE:
+                merged = await self._merge_into(duplicates[0].id, prd_data)
+                merged.duplicates = duplicates
+                return merged
+
+        prd = await self._store_prd(prd_dict)
+        prd.duplicates = duplicates
+        return prd
+
+    async def _store_prd(self, prd_dict: Dict[str, Any]) -> PRDResponse:
+        """Insert a built PRD record."""
+        # Try to save to database (will fallback to local database if Supabase fails)
+        try:
+            saved_prd = await data_manager.create_prd(prd_dict)
+            if saved_prd:
+                self._index_prds([saved_prd])
+                return decode_row(PRDResponse, saved_prd)
+        except Exception as e:
+            print(f"Database save failed, using in-memory storage: {e}")
+        
+        # Fallback to in-memory storage
+        if not hasattr(self, '_prds_db'):
+            self._prds_db: Dict[str, Dict[str, Any]] = {}
+        self._prds_db[prd_dict["id"]] = prd_dict
+        self._index_prds([prd_dict])
+        return decode_row(PRDResponse, prd_dict)
+
+    def _find_duplicates(self, prd_dict: Dict[str, Any]) -> Optional[List[PRDDuplicate]]:
+        """Near-duplicates of a new PRD, or None while detection is off or loading."""
+        if not prd_duplicate_service.enabled or not prd_duplicate_service.ready:
+            return None
+        return [PRDDuplicate(**match) for match in prd_duplicate_service.find_duplicates(prd_dict)]
+
+    async def _merge_into(self, prd_id: str, prd_data: PRDCreate) -> PRDResponse:
+        """
+        Apply a duplicate PRD to the existing one instead of creating it.
+
+        An uploaded document replaces the existing document (re-parsed
+        section by section); otherwise the fields that were set replace
+        the existing ones.
+        """
+        if prd_data.file_content:
+            return await self.update_prd(prd_id, PRDUpdate(file_content=prd_data.file_content))
+        fields = prd_data.dict(exclude_unset=True, exclude_none=True)
+        return await self.update_prd(
+            prd_id, PRDUpdate(**{field: value for field, value in fields.items() if field in PRDUpdate.model_fields}))
+
+    @staticmethod
+    def _index_prds(rows: List[Dict[str, Any]]) -> None:
+        """Hand stored PRD rows to the in-process indexes."""
+        for index in PRD_INDEXES:
+            index.index_prds(rows)
+
+    @staticmethod
+    def _unindex_prd(prd_id: str) -> None:
+        """Drop a deleted PRD from the in-process indexes."""
+        for index in PRD_INDEXES:
+            index.remove_prd(prd_id)
+
+    async def bulk_create_prds(self, bulk_data: PRDBulkCreate) -> BulkOperationResponse:
+        """Validate many PRDs and write them with batched inserts (or upserts)."""
+        results = BulkResults(len(bulk_data.prds), upsert=bulk_data.upsert)
         now = datetime.utcnow()
+        valid = validate_items(bulk_data.prds, PRDCreate, results)
+        rows = [self._build_prd_dict(prd_id, prd_data, now) for _, prd_id, prd_data in valid]
+
+        errors = await self._bulk_write_rows(rows, upsert=bulk_data.upsert)
+
+        for (index, prd_id, _), error in zip(valid, errors):
+            results.written(index, prd_id, error)
+        response = results.response()
+        print(f"📦 Bulk PRD write: {response.succeeded}/{response.total} succeeded")
+        return response
 
-        prd_dict = {
+    async def _bulk_write_rows(self, rows: List[Dict[str, Any]], upsert: bool = False) -> List[Optional[str]]:
+        """Write PRD rows in batches; returns a per-row error (None on success)."""
+        errors = await self._bulk_write_storage(rows, upsert)
+        self._index_prds([row for row, error in zip(rows, errors) if error is None])
+        return errors
+
+    async def _bulk_write_storage(self, rows: List[Dict[str, Any]], upsert: bool) -> List[Optional[str]]:
+        """Write PRD rows to the database, or to in-memory storage when it fails."""
+        try:
+            return await data_manager.bulk_write("prds", rows, upsert=upsert)
+        except Exception as e:
+            print(f"Database bulk save failed, using in-memory storage: {e}")
+            if not hasattr(self, '_prds_db'):
+                self._prds_db: Dict[str, Dict[str, Any]] = {}
+            errors = []
+            for row in rows:
+                if not upsert and row["id"] in self._prds_db:
+                    errors.append(f"prd {row['id']} already exists")
+                else:
+                    self._prds_db[row["id"]] = row
+                    errors.append(None)
+            return errors
+
+    def _build_prd_dict(self, prd_id: str, prd_data: PRDCreate, now: datetime,
+                        section_index: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Build the stored PRD record for a create request."""
+        return {
             "id": prd_id,
             "title": prd_data.title,
             "description": prd_data.description,
@@ -65,24 +273,9 @@ class PRDService:
             "assignee": prd_data.assignee,
             "target_sprint": prd_data.target_sprint,
             "original_filename": prd_data.original_filename,
-            "file_content": prd_data.file_content}
-
-        # Try to save to database (will fallback to local database if Supabase fails)
-        try:
-            saved_prd = await data_manager.create_prd(prd_dict)
-            if saved_prd:
-                # Convert datetime strings back to datetime objects for response
-                saved_prd["created_at"] = datetime.fromisoformat(saved_prd["created_at"].replace('Z', '+00:00'))
-                saved_prd["updated_at"] = datetime.fromisoformat(saved_prd["updated_at"].replace('Z', '+00:00'))
-                return PRDResponse(**saved_prd)
-        except Exception as e:
-            print(f"Database save failed, using in-memory storage: {e}")
-        
-        # Fallback to in-memory storage
-        if not hasattr(self, '_prds_db'):
-            self._prds_db: Dict[str, Dict[str, Any]] = {}
-        self._prds_db[prd_id] = prd_dict
-        return PRDResponse(**prd_dict)
+            "file_content": prd_data.file_content,
+            "content_hash": content_hash(prd_data.file_content) if prd_data.file_content else None,
+            "section_index": section_index}
 
     async def get_prd(self, prd_id: str) -> PRDResponse:
         """Get a PRD by ID."""
@@ -91,10 +284,7 @@ class PRDService:
             if data_manager.is_connected():
                 prd_data = await data_manager.get_prd(prd_id)
                 if prd_data:
-                    # Convert datetime strings back to datetime objects
-                    prd_data["created_at"] = datetime.fromisoformat(prd_data["created_at"].replace('Z', '+00:00'))
-                    prd_data["updated_at"] = datetime.fromisoformat(prd_data["updated_at"].replace('Z', '+00:00'))
-                    return PRDResponse(**prd_data)
+                    return decode_row(PRDResponse, prd_data)
         except Exception as e:
             print(f"Database get failed, trying in-memory storage: {e}")
         
@@ -104,80 +294,163 @@ class PRDService:
         if prd_id not in self._prds_db:
             raise HTTPException(status_code=404, detail="PRD not found")
 
-        return PRDResponse(**self._prds_db[prd_id])
+        return decode_row(PRDResponse, self._prds_db[prd_id])
 
     async def get_prds(
         self,
         skip: int = 0,
         limit: int = 100,
         prd_type: Optional[PRDType] = None,
-        status: Optional[PRDStatus] = None
+        status: Optional[PRDStatus] = None,
+        cursor: Optional[str] = None
     ) -> PRDListResponse:
-        """Get a list of PRDs with optional filtering."""
+        """Get a list of PRDs with optional filtering.
+
+        Pages by offset (skip) by default; when a cursor from a previous
+        response is given, pages by keyset on (created_at, id) instead.
+        """
+        spec = self._list_spec(skip, limit, prd_type, status, cursor)
+        result = await self._query_prds(spec)
+
+        return PRDListResponse(
+            prds=decode_rows(PRDResponse, result.rows),
+            total=result.total,
+            page=skip // limit + 1,
+            size=limit,
+            has_next=result.has_next,
+            next_cursor=next_cursor(result, spec)
+        )
+
+    async def get_prd_summaries(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        prd_type: Optional[PRDType] = None,
+        status: Optional[PRDStatus] = None,
+        cursor: Optional[str] = None
+    ) -> PRDSummaryListResponse:
+        """Get a list of PRD summaries, fetching only the summary columns."""
+        spec = self._list_spec(skip, limit, prd_type, status, cursor, columns=PRD_SUMMARY_COLUMNS)
+        result = await self._query_prds(spec)
+
+        return PRDSummaryListResponse(
+            prds=decode_rows(PRDSummary, result.rows),
+            total=result.total,
+            page=skip // limit + 1,
+            size=limit,
+            has_next=result.has_next,
+            next_cursor=next_cursor(result, spec)
+        )
+
+    async def get_prds_by_ids(self, prd_ids: List[str], summary: bool = False) -> Union[PRDListResponse, PRDSummaryListResponse]:
+        """Get many PRDs by id with one batched lookup, in request order."""
+        rows = await self._rows_by_ids(prd_ids, PRD_SUMMARY_COLUMNS if summary else None)
+
+        if summary:
+            return PRDSummaryListResponse(
+                prds=decode_rows(PRDSummary, rows),
+                total=len(rows), page=1, size=len(prd_ids), has_next=False)
+        return PRDListResponse(
+            prds=decode_rows(PRDResponse, rows),
+            total=len(rows), page=1, size=len(prd_ids), has_next=False)
+
+    async def _rows_by_ids(self, prd_ids: List[str], columns: Optional[Tuple[str, ...]] = None) -> List[Dict[str, Any]]:
+        """Fetch PRD rows (or some of their columns) by id in request order, falling back to in-memory storage."""
+        try:
+            return await data_manager.get_prds_by_ids(prd_ids, columns)
+        except Exception as e:
+            print(f"Database get_prds_by_ids failed, using in-memory storage: {e}")
+            prds_db = getattr(self, '_prds_db', {})
+            return [dict(prds_db[prd_id]) for prd_id in prd_ids if prd_id in prds_db]
+
+    async def search_prds(self, query: str, limit: int = 20, prd_type: Optional[PRDType] = None) -> PRDSearchResponse:
+        """Rank PRDs against a free-text query with the in-process BM25 index."""
+        if not prd_search_service.enabled:
+            raise HTTPException(status_code=503, detail="PRD search is disabled")
+        if not prd_search_service.ready:
+            detail = prd_search_service.error or "PRD search index is still loading"
+            raise HTTPException(status_code=503, detail=f"PRD search unavailable: {detail}")
+
+        type_value = prd_type.value if isinstance(prd_type, PRDType) else prd_type
+        scores = dict(prd_search_service.search(query, limit, type_value))
+        # Hits deleted behind the index's back (e.g. by a failed purge) are skipped
+        rows = await self._rows_by_ids(list(scores), SEARCH_HIT_COLUMNS)
+        results = [
+            PRDSearchHit(
+                prd=decode_row(PRDSummary, row),
+                score=round(scores[row["id"]], 4),
+                snippets=prd_search_service.snippets(row, query))
+            for row in rows
+        ]
+        return PRDSearchResponse(query=query, results=results, count=len(results))
+
+    def _list_spec(
+        self,
+        skip: int,
+        limit: int,
+        prd_type: Optional[PRDType],
+        status: Optional[PRDStatus],
+        cursor: Optional[str],
+        columns: Optional[Tuple[str, ...]] = None
+    ) -> QuerySpec:
+        """Build the storage query for a PRD list request."""
+        # Filters and paging are applied by the storage layer
+        return QuerySpec(
+            filters={
+                "status": status.value if status else None,
+                "prd_type": prd_type.value if prd_type else None
+            },
+            offset=skip,
+            limit=limit,
+            after=parse_cursor_param(cursor),
+            columns=columns)
+
+    async def _query_prds(self, spec: QuerySpec) -> QueryResult:
+        """Run a PRD list query against the database, falling back to in-memory storage."""
         # Try to get from database first (will fallback to local database if Supabase fails)
         try:
-            # Pass status parameter to database manager for efficient filtering
-            status_value = status.value if status else None
-            prds_data = await data_manager.get_prds(skip, limit)
-            if prds_data:
-                # Convert datetime strings back to datetime objects
-                for prd in prds_data:
-                    prd["created_at"] = datetime.fromisoformat(prd["created_at"].replace('Z', '+00:00'))
-                    prd["updated_at"] = datetime.fromisoformat(prd["updated_at"].replace('Z', '+00:00'))
-                
-                # Apply remaining filters (prd_type filtering still done in memory)
-                filtered_prds = prds_data
-                if prd_type:
-                    filtered_prds = [p for p in filtered_prds if p["prd_type"] == prd_type.value]
-                
-                return PRDListResponse(
-                    prds=[PRDResponse(**prd) for prd in filtered_prds],
-                    total=len(filtered_prds),
-                    page=skip // limit + 1,
-                    size=limit,
-                    has_next=len(filtered_prds) == limit
-                )
+            result = await data_manager.query_prds(spec)
+            if result.total:
+                # Timestamps are parsed when the rows are decoded into models
+                return result
         except Exception as e:
             print(f"Database get_prds failed, using in-memory storage: {e}")
         
         # Fallback to in-memory storage
         if not hasattr(self, '_prds_db'):
             self._prds_db: Dict[str, Dict[str, Any]] = {}
-        prds = list(self._prds_db.values())
-
-        # Apply filters
-        if prd_type:
-            prds = [p for p in prds if p["prd_type"] == prd_type.value]
-        if status:
-            prds = [p for p in prds if p["status"] == status.value]
-
-        # Sort by created_at descending
-        prds.sort(key=lambda x: x["created_at"], reverse=True)
-
-        # Apply pagination
-        total = len(prds)
-        prds = prds[skip:skip + limit]
-
-        return PRDListResponse(
-            prds=[PRDResponse(**prd) for prd in prds],
-            total=total,
-            page=skip // limit + 1,
-            size=limit,
-            has_next=skip + limit < total
-        )
+        return query_rows(self._prds_db.values(), spec)
 
     async def update_prd(
             self,
             prd_id: str,
             prd_data: PRDUpdate) -> PRDResponse:
-        """Update an existing PRD."""
+        """
+        Update an existing PRD.
+
+        New file_content is re-parsed section by section: only sections
+        whose hash changed since the last parse are parsed again, and only
+        the columns whose values changed are written.
+        """
+        update_data = prd_data.dict(exclude_unset=True)
+        if update_data.get("file_content") is not None:
+            async with self._edit_lock(prd_id):
+                update_data = await self._content_update(prd_id, update_data)
+                return await self._apply_update(prd_id, update_data)
+        return await self._apply_update(prd_id, update_data)
+
+    async def _apply_update(self, prd_id: str, update_data: Dict[str, Any]) -> PRDResponse:
+        """Write changed columns of a PRD."""
+        if not update_data:
+            return await self.get_prd(prd_id)
+
         # Try to update in database first
         try:
             if data_manager.is_connected():
-                update_data = prd_data.dict(exclude_unset=True)
                 updated_prd = await data_manager.update_prd(prd_id, update_data)
                 if updated_prd:
-                    return PRDResponse(**updated_prd)
+                    self._index_prds([updated_prd])
+                    return decode_row(PRDResponse, updated_prd)
         except Exception as e:
             print(f"Database update failed, trying in-memory storage: {e}")
 
@@ -188,14 +461,53 @@ class PRDService:
         prd_dict = self._prds_db[prd_id]
 
         # Update fields that are provided
-        update_data = prd_data.dict(exclude_unset=True)
         for field, value in update_data.items():
             if hasattr(prd_dict, field):
                 prd_dict[field] = value
 
         prd_dict["updated_at"] = datetime.utcnow()
+        self._index_prds([prd_dict])
+
+        return decode_row(PRDResponse, prd_dict)
+
+    def _edit_lock(self, prd_id: str) -> asyncio.Lock:
+        """Per-PRD lock serializing content edits, which read the stored section index."""
+        lock = self._edit_locks.get(prd_id)
+        if lock is None:
+            lock = self._edit_locks[prd_id] = asyncio.Lock()
+        return lock
+
+    async def _content_update(self, prd_id: str, update_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Turn an update carrying file_content into the columns it changes.
+
+        Columns set explicitly in the same update win over parsed ones.
+        """
+        content = update_data["file_content"]
+        self._check_upload_size(len(content.encode('utf-8')))
+        current = await data_manager.get_prd(prd_id)
+        if current is None:
+            raise HTTPException(status_code=404, detail="PRD not found")
+
+        new_hash = content_hash(content)
+        if new_hash == current.get("content_hash"):
+            update_data.pop("file_content")
+            return update_data
 
-        return PRDResponse(**prd_dict)
+        parsed = self.parser.reparse(content, current.get("section_index"), current.get("original_filename"))
+        changes = {
+            column: parsed[column] for column in PARSED_COLUMNS + ("prd_type",)
+            if column in parsed and parsed[column] != current.get(column)
+        }
+        try:
+            PRDUpdate(**changes)
+        except ValidationError as e:
+            raise HTTPException(status_code=400, detail=f"Edited content is invalid: {format_validation_error(e)}")
+
+        changes.update(update_data)
+        changes["content_hash"] = new_hash
+        changes["section_index"] = parsed["section_index"]
+        return changes
 
     async def delete_prd(self, prd_id: str) -> Dict[str, str]:
         """Delete a PRD."""
@@ -204,6 +516,7 @@ class PRDService:
             if data_manager.is_connected():
                 success = await data_manager.delete_prd(prd_id)
                 if success:
+                    self._unindex_prd(prd_id)
                     return {"message": "PRD deleted successfully"}
         except Exception as e:
             print(f"Database delete failed, trying in-memory storage: {e}")
@@ -215,6 +528,7 @@ class PRDService:
             raise HTTPException(status_code=404, detail="PRD not found")
 
         del self._prds_db[prd_id]
+        self._unindex_prd(prd_id)
         return {"message": "PRD deleted successfully"}
 
     async def clear_all_prds(self) -> Dict[str, str]:
@@ -222,12 +536,24 @@ class PRDService:
         # Use simplified data manager
         success = await data_manager.clear_all_prds()
         if success:
+            for index in PRD_INDEXES:
+                index.clear()
             return {"message": "All PRDs cleared successfully"}
         else:
             return {"message": "Failed to clear PRDs"}
 
-    async def upload_prd_file(self, file: UploadFile) -> PRDResponse:
-        """Upload and parse a PRD file."""
+    async def upload_prd_file(
+            self,
+            file: UploadFile,
+            return_existing: bool = False,
+            on_duplicate: Optional[PRDDuplicatePolicy] = None) -> PRDResponse:
+        """
+        Upload and parse a PRD file.
+
+        With return_existing, an upload whose content matches an existing
+        PRD returns that PRD instead of inserting a duplicate. Near-duplicates
+        are handled by create_prd according to on_duplicate.
+        """
         if not file.filename:
             raise HTTPException(status_code=400, detail="No filename provided")
 
@@ -237,45 +563,50 @@ class PRDService:
                 detail="File must be a .md or .txt file"
             )
 
-        content = await file.read()
-        try:
-            content_str = content.decode('utf-8')
-        except UnicodeDecodeError:
-            raise HTTPException(
-                status_code=400,
-                detail="File must be UTF-8 encoded"
-            )
+        # Sections are parsed as the chunks arrive; the hash is only known at the end
+        parse = UploadParse(self.parser.stream(file.filename))
+        chunks, upload_hash = await self._read_upload(file, parse)
 
-        # Parse the file content
-        parsed_data = self._parse_prd_content(content_str, file.filename)
+        if return_existing:
+            existing = await self._find_prd_by_content_hash(upload_hash)
+            if existing is not None:
+                return existing
 
-        # Detect PRD type
-        detected_type = self._detect_prd_type(content_str)
+        # The stored file_content is one string, so the chunks are joined once
+        # (briefly holding two copies) and dropped
+        content_str = ''.join(chunks)
+        del chunks
+
+        # Identical uploads reuse the earlier parse (type detection included)
+        # and the parse fed during the read is dropped unfinished
+        cache_key = (upload_hash, file.filename)
+        parsed_data = self._parse_cache.get(cache_key)
+        if parsed_data is None:
+            parsed_data = self._finish_upload_parse(parse, content_str, file.filename)
+            self._parse_cache.set(cache_key, parsed_data, config.prd_parse_cache_ttl)
 
         # Create PRD
-        prd_data = PRDCreate(
-            title=parsed_data["title"],
-            description=parsed_data["description"],
-            requirements=parsed_data["requirements"],
-            prd_type=PRDType(detected_type),
-            problem_statement=parsed_data.get("problem_statement"),
-            target_users=parsed_data.get("target_users"),
-            user_stories=parsed_data.get("user_stories"),
-            acceptance_criteria=parsed_data.get("acceptance_criteria"),
-            technical_requirements=parsed_data.get("technical_requirements"),
-            performance_requirements=parsed_data.get("performance_requirements"),
-            security_requirements=parsed_data.get("security_requirements"),
-            integration_requirements=parsed_data.get("integration_requirements"),
-            deployment_requirements=parsed_data.get("deployment_requirements"),
-            success_metrics=parsed_data.get("success_metrics"),
-            timeline=parsed_data.get("timeline"),
-            dependencies=parsed_data.get("dependencies"),
-            risks=parsed_data.get("risks"),
-            assumptions=parsed_data.get("assumptions"),
-            original_filename=file.filename,
-            file_content=content_str)
-
-        return await self.create_prd(prd_data)
+        prd_data = self._prd_from_parsed(parsed_data, file.filename, content_str)
+        return await self.create_prd(prd_data, parsed_data.get("section_index"), on_duplicate)
+
+    async def upload_prd_files(self, files: List[UploadFile], return_existing: bool = False) -> AsyncIterator[str]:
+        """
+        Upload many PRD files, or .zip/.tar archives of them.
+
+        Every file is read and size-checked before this returns. The
+        returned NDJSON stream then parses the documents on the parse pool,
+        inserts them in batches of PRD_BATCH_WRITE_SIZE and yields one
+        PRDUploadResult per document as it finishes, then a summary line.
+        """
+        documents = await self._read_batch(files)
+        return self._process_batch(documents, return_existing)
+
+    async def reupload_prd_file(self, prd_id: str, file: UploadFile) -> PRDResponse:
+        """Replace a PRD's document with a new version of the file (incremental re-parse)."""
+        if not file.filename or not file.filename.endswith(('.md', '.txt')):
+            raise HTTPException(status_code=400, detail="File must be a .md or .txt file")
+        chunks, _ = await self._read_upload(file)
+        return await self.update_prd(prd_id, PRDUpdate(file_content=''.join(chunks)))
 
     async def get_prd_markdown(self, prd_id: str) -> PRDMarkdownResponse:
         """Get PRD as markdown."""
@@ -289,111 +620,248 @@ class PRDService:
             filename=filename
         )
 
-    def _parse_prd_content(self, content: str, filename: str = None) -> Dict[str, Any]:
-        """Parse PRD content using comprehensive parser."""
+    async def _read_upload(self, file: UploadFile, parse: Optional[UploadParse] = None) -> Tuple[List[str], str]:
+        """
+        Read an upload in chunks, decoding, hashing and (with parse) parsing each as it arrives.
+
+        The size limit is checked against the declared size before reading
+        and against the running total after every chunk, so oversized files
+        are rejected without being buffered. Returns the decoded chunks and
+        the content hash.
+        """
+        if file.size is not None:
+            self._check_upload_size(file.size)
+
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        hasher = new_content_hasher()
+        chunks: List[str] = []
+        size = 0
+        try:
+            while True:
+                chunk = await file.read(config.prd_upload_chunk_size)
+                if not chunk:
+                    break
+                size += len(chunk)
+                self._check_upload_size(size)
+                hasher.update(chunk)
+                text = decoder.decode(chunk)
+                chunks.append(text)
+                if parse is not None:
+                    parse.feed(text)
+            decoder.decode(b'', final=True)
+        except UnicodeDecodeError:
+            raise HTTPException(
+                status_code=400,
+                detail="File must be UTF-8 encoded"
+            )
+        self._check_upload_size(size)
+        return chunks, hasher.hexdigest()
+
+    def _finish_upload_parse(self, parse: UploadParse, content: str, filename: str) -> Dict[str, Any]:
+        """Close the parse fed during the read and validate the result."""
         try:
-            # Use the comprehensive PRD parser
-            parsed_data = self.parser.parse_prd_content(content, filename)
-            
-            # Validate the parsed structure
-            validation = self.parser.validate_prd_structure(parsed_data)
-            
-            # Add validation info to parsed data
-            parsed_data['validation'] = validation
-            
-            return parsed_data
+            return self._validate_parsed(parse.close())
         except Exception as e:
-            # Return basic structure if parsing fails
-            return {
-                "title": "Uploaded PRD",
-                "description": content[:500] + "..." if len(content) > 500 else content,
-                "requirements": [],
-                "problem_statement": "",
-                "target_users": [],
-                "user_stories": [],
-                "acceptance_criteria": [],
-                "technical_requirements": [],
-                "performance_requirements": {},
-                "security_requirements": [],
-                "integration_requirements": [],
-                "deployment_requirements": [],
-                "success_metrics": [],
-                "timeline": "",
-                "dependencies": [],
-                "risks": [],
-                "assumptions": [],
-                "validation": {"is_valid": False, "errors": [f"Parsing failed: {str(e)}"], "warnings": [], "completeness_score": 0}
-            }
-
-
-    def _detect_prd_type(self, content: str) -> str:
-        """Detect if PRD is for platform or agent based on content."""
-        content_lower = content.lower()
-
-        # Platform indicators (high weight)
-        platform_keywords = [
-            'platform',
-            'factory',
-            'infrastructure',
-            'system',
-            'architecture',
-            'framework',
-            'core',
-            'base',
-            'foundation',
-            'engine',
-            'orchestrator',
-            'deployment',
-            'ci/cd',
-            'pipeline',
-            'monitoring',
-            'logging',
-            'authentication',
-            'authorization',
-            'database',
-            'api',
-            'backend',
-            'frontend',
-            'ui',
-            'ux',
-            'dashboard',
-            'admin',
-            'management']
-
-        # Agent indicators (high weight)
-        agent_keywords = [
-            'agent', 'bot', 'assistant', 'automation', 'workflow', 'task',
-            'process', 'execution', 'ai', 'ml', 'model', 'prediction',
-            'analysis', 'recommendation', 'chat', 'conversation', 'nlp',
-            'openai', 'anthropic', 'claude'
+            return self._unparsed_prd(content, e, filename)
+
+    async def _find_prd_by_content_hash(self, content_hash: str) -> Optional[PRDResponse]:
+        """Get the earliest PRD uploaded with this exact content, if any."""
+        spec = QuerySpec(filters={"content_hash": content_hash}, descending=False, limit=1)
+        result = await self._query_prds(spec)
+        return decode_row(PRDResponse, result.rows[0]) if result.rows else None
+
+    async def _read_batch(self, files: List[UploadFile]) -> List[BatchDocument]:
+        """Read a batch upload into documents; per-file problems become document errors."""
+        declared = sum(file.size or 0 for file in files)
+        if declared > config.prd_batch_max_bytes:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Batch cannot exceed {config.prd_batch_max_bytes // (1024 * 1024)}MB")
+
+        documents: List[BatchDocument] = []
+        for file in files:
+            filename = file.filename or ""
+            try:
+                if is_archive(filename):
+                    data = await file.read(config.prd_batch_max_bytes + 1)
+                    if len(data) > config.prd_batch_max_bytes:
+                        raise ValueError(f"Archive cannot exceed {config.prd_batch_max_bytes // (1024 * 1024)}MB")
+                    members = expand_archive(
+                        filename, data, config.prd_upload_max_bytes, config.prd_batch_max_bytes)
+                    del data
+                    for name, content, error in members:
+                        documents.append(self._batch_document(len(documents), name, content, error))
+                elif filename.endswith(('.md', '.txt')):
+                    chunks, upload_hash = await self._read_upload(file)
+                    documents.append(BatchDocument(len(documents), filename, ''.join(chunks), upload_hash))
+                else:
+                    documents.append(BatchDocument(
+                        len(documents), filename,
+                        error="File must be a .md or .txt file, or a .zip or .tar archive of them"))
+            except HTTPException as e:
+                documents.append(BatchDocument(len(documents), filename, error=e.detail))
+            except ValueError as e:
+                documents.append(BatchDocument(len(documents), filename, error=str(e)))
+
+            if len(documents) > config.prd_batch_max_files:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"Batch cannot contain more than {config.prd_batch_max_files} files")
+        return documents
+
+    def _batch_document(self, index: int, name: str, content: Optional[bytes], error: Optional[str]) -> BatchDocument:
+        """Build a batch document from an archive member's bytes."""
+        filename = posixpath.basename(name)
+        if error is not None:
+            return BatchDocument(index, filename, error=error)
+        if not content:
+            return BatchDocument(index, filename, error="File content cannot be empty")
+        try:
+            text = content.decode('utf-8')
+        except UnicodeDecodeError:
+            return BatchDocument(index, filename, error="File must be UTF-8 encoded")
+        hasher = new_content_hasher()
+        hasher.update(content)
+        return BatchDocument(index, filename, text, hasher.hexdigest())
+
+    async def _process_batch(self, documents: List[BatchDocument], return_existing: bool) -> AsyncIterator[str]:
+        """Parse, write and report the documents of a batch upload as NDJSON lines."""
+        counts = {status.value: 0 for status in BulkItemStatus if status != BulkItemStatus.UPSERTED}
+        duplicates: Dict[str, List[BatchDocument]] = {}  # content hash -> later copies in this batch
+        pending: List[Tuple[BatchDocument, Dict[str, Any]]] = []
+
+        def report(result: PRDUploadResult, document: BatchDocument) -> str:
+            """Result line for a document, followed by lines for its in-batch copies."""
+            results = [result]
+            for copy in duplicates.get(document.content_hash, ()):
+                if result.status == BulkItemStatus.CREATED:
+                    results.append(PRDUploadResult(
+                        index=copy.index, filename=copy.filename,
+                        status=BulkItemStatus.EXISTING, id=result.id, title=result.title))
+                else:
+                    results.append(result.copy(update={"index": copy.index, "filename": copy.filename}))
+            for item in results:
+                counts[item.status] += 1
+            return "".join(item.json() + "\n" for item in results)
+
+        # Unreadable files and already-stored content are answered before any parsing
+        to_parse = []
+        for document in documents:
+            if document.error is not None:
+                yield report(PRDUploadResult(
+                    index=document.index, filename=document.filename,
+                    status=BulkItemStatus.INVALID, error=document.error), document)
+                continue
+            if return_existing:
+                if document.content_hash in duplicates:
+                    duplicates[document.content_hash].append(document)
+                    continue
+                existing = await self._find_prd_by_content_hash(document.content_hash)
+                if existing is not None:
+                    yield report(PRDUploadResult(
+                        index=document.index, filename=document.filename,
+                        status=BulkItemStatus.EXISTING, id=existing.id, title=existing.title), document)
+                    continue
+                duplicates[document.content_hash] = []
+            to_parse.append(document)
+
+        tasks = [asyncio.ensure_future(self._parse_batch_document(document)) for document in to_parse]
+        try:
+            for next_parsed in asyncio.as_completed(tasks):
+                document, parsed_data = await next_parsed
+                try:
+                    prd_data = self._prd_from_parsed(parsed_data, document.filename, document.content)
+                except ValidationError as e:
+                    yield report(PRDUploadResult(
+                        index=document.index, filename=document.filename,
+                        status=BulkItemStatus.INVALID, error=format_validation_error(e)), document)
+                    continue
+
+                pending.append((document, self._build_prd_dict(
+                    str(uuid.uuid4()), prd_data, datetime.utcnow(), parsed_data.get("section_index"))))
+                if len(pending) >= config.prd_batch_write_size:
+                    for result, written in zip(await self._write_batch(pending), pending):
+                        yield report(result, written[0])
+                    pending = []
+
+            if pending:
+                for result, written in zip(await self._write_batch(pending), pending):
+                    yield report(result, written[0])
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        print(f"📦 Batch PRD upload: {counts['created']}/{len(documents)} created")
+        yield json.dumps({"summary": {"total": len(documents), **counts}}) + "\n"
+
+    async def _parse_batch_document(self, document: BatchDocument) -> Tuple[BatchDocument, Dict[str, Any]]:
+        """Parse one batch document on the parse pool, reusing cached parses."""
+        cache_key = (document.content_hash, document.filename)
+        parsed_data = self._parse_cache.get(cache_key)
+        if parsed_data is None:
+            try:
+                parsed_data = await parse_pool.run(parse_document, document.content, document.filename)
+            except Exception as e:
+                parsed_data = self._unparsed_prd(document.content, e, document.filename)
+            self._parse_cache.set(cache_key, parsed_data, config.prd_parse_cache_ttl)
+        return document, parsed_data
+
+    async def _write_batch(self, pending: List[Tuple[BatchDocument, Dict[str, Any]]]) -> List[PRDUploadResult]:
+        """Insert queued batch rows with one batched write."""
+        errors = await self._bulk_write_rows([row for _, row in pending])
+        return [
+            PRDUploadResult(
+                index=document.index, filename=document.filename,
+                status=BulkItemStatus.FAILED if error else BulkItemStatus.CREATED,
+                id=row["id"], title=row["title"], error=error)
+            for (document, row), error in zip(pending, errors)
         ]
 
-        # Count keyword occurrences
-        platform_score = sum(
-            1 for keyword in platform_keywords if keyword in content_lower)
-        agent_score = sum(
-            1 for keyword in agent_keywords if keyword in content_lower)
-
-        # Additional heuristics
-        if any(pattern in content_lower for pattern in [
-            'prd type', 'platform prd', 'agent prd', 'type:', 'category:'
-        ]):
-            if 'platform' in content_lower:
-                return 'platform'
-            elif 'agent' in content_lower:
-                return 'agent'
-
-        # Check for specific patterns
-        if 'create agent' in content_lower or 'build agent' in content_lower:
-            return 'agent'
-        if 'improve platform' in content_lower or 'enhance system' in content_lower:
-            return 'platform'
-
-        # Default based on scores
-        if platform_score > agent_score:
-            return 'platform'
-        else:
-            return 'agent'
+    def _prd_from_parsed(self, parsed_data: Dict[str, Any], filename: str, content: str) -> PRDCreate:
+        """Build the create request for an uploaded document."""
+        return PRDCreate(
+            **{column: parsed_data.get(column) for column in PARSED_COLUMNS},
+            prd_type=PRDType(parsed_data["prd_type"]),
+            original_filename=filename,
+            file_content=content)
+
+    def _check_upload_size(self, size: int) -> None:
+        """Reject empty uploads and uploads over PRD_UPLOAD_MAX_BYTES."""
+        try:
+            validate_file_size(size, config.prd_upload_max_bytes)
+        except ValueError as e:
+            raise HTTPException(status_code=413 if size else 400, detail=str(e))
+
+    def _validate_parsed(self, parsed_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate the parsed structure and add the validation info to it."""
+        parsed_data['validation'] = self.parser.validate_prd_structure(parsed_data)
+        return parsed_data
+
+    def _unparsed_prd(self, content: str, error: Exception, filename: str = None) -> Dict[str, Any]:
+        """Basic structure used when parsing fails."""
+        classification = classify_prd(content, filename)
+        return {
+            "title": "Uploaded PRD",
+            "description": content[:500] + "..." if len(content) > 500 else content,
+            "prd_type": classification.prd_type,
+            "type_classification": classification.to_dict(),
+            "requirements": [],
+            "problem_statement": "",
+            "target_users": [],
+            "user_stories": [],
+            "acceptance_criteria": [],
+            "technical_requirements": [],
+            "performance_requirements": {},
+            "security_requirements": [],
+            "integration_requirements": [],
+            "deployment_requirements": [],
+            "success_metrics": [],
+            "timeline": "",
+            "dependencies": [],
+            "risks": [],
+            "assumptions": [],
+            "validation": {"is_valid": False, "errors": [f"Parsing failed: {str(error)}"], "warnings": [], "completeness_score": 0}
+        }
 
     def _generate_prd_markdown(self, prd: PRDResponse) -> str:
         """Generate standardized markdown PRD."""
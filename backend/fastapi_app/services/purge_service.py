@@ -0,0 +1,119 @@
+"""
+Purge service: clears whole tables as pollable background jobs.
+"""
+import asyncio
+import uuid
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional
+from datetime import datetime
+from fastapi import HTTPException
+
+from ..models.purge import PurgeRequest, PurgeJobResponse, PurgeJobStatus
+from ..utils.simple_data_manager import data_manager
+from .agent_service import agent_service
+from .devin_service import devin_service
+from .prd_service import PRD_INDEXES, prd_service
+
+# Finished jobs kept for polling
+MAX_FINISHED_JOBS = 100
+
+
+class PurgeService:
+    """Service class for bulk purge jobs."""
+
+    def __init__(self):
+        """Initialize the purge service."""
+        self._jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def start_purge(self, request: PurgeRequest) -> PurgeJobResponse:
+        """Start a purge job in the background and return its initial state."""
+        if request.skip_audit and not data_manager.can_skip_audit:
+            raise HTTPException(
+                status_code=400,
+                detail="skip_audit requires SUPABASE_SERVICE_ROLE_KEY: purge_batch() is executable only by the service role")
+        job_id = str(uuid.uuid4())
+        tables = list(dict.fromkeys(request.tables))
+        job = {
+            "job_id": job_id,
+            "status": PurgeJobStatus.PENDING.value,
+            "tables": tables,
+            "current_table": None,
+            "deleted": dict.fromkeys(tables, 0),
+            "total_deleted": 0,
+            "batches": 0,
+            "skip_audit": request.skip_audit,
+            "created_at": datetime.utcnow(),
+            "finished_at": None,
+            "error": None
+        }
+        self._jobs[job_id] = job
+        self._prune_finished()
+        task = asyncio.create_task(self._run(job, request.batch_size))
+        self._tasks[job_id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(job_id, None))
+        return PurgeJobResponse(**job)
+
+    def get_job(self, job_id: str) -> PurgeJobResponse:
+        """Get the progress of a purge job."""
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="Purge job not found")
+        return PurgeJobResponse(**job)
+
+    async def wait(self, job_id: str) -> PurgeJobResponse:
+        """Wait for a purge job to finish and return its final state."""
+        task = self._tasks.get(job_id)
+        if task is not None:
+            await asyncio.shield(task)
+        return self.get_job(job_id)
+
+    async def _run(self, job: Dict[str, Any], batch_size: Optional[int]) -> None:
+        """Clear each table in turn, recording progress after every batch."""
+        job["status"] = PurgeJobStatus.RUNNING.value
+        try:
+            for table in job["tables"]:
+                job["current_table"] = table
+
+                def on_batch(count: int, table: str = table) -> None:
+                    job["deleted"][table] += count
+                    job["total_deleted"] += count
+                    job["batches"] += 1
+
+                await data_manager.purge_table(
+                    table, batch_size=batch_size, skip_audit=job["skip_audit"], on_batch=on_batch)
+                self._clear_fallback_storage(table)
+            job["status"] = PurgeJobStatus.COMPLETED.value
+            print(f"🧹 Purge {job['job_id']}: {job['total_deleted']} rows deleted in {job['batches']} batches")
+        except Exception as e:
+            job["status"] = PurgeJobStatus.FAILED.value
+            job["error"] = str(e)
+            print(f"❌ Purge {job['job_id']} failed on {job['current_table']}: {e}")
+        finally:
+            job["current_table"] = None
+            job["finished_at"] = datetime.utcnow()
+
+    def _clear_fallback_storage(self, table: str) -> None:
+        """Clear the services' in-memory fallback copies of a table."""
+        if table == "agents":
+            agent_service._agents_db.clear()
+        elif table == "devin_tasks":
+            devin_service._tasks_db.clear()
+        elif table == "prds":
+            for index in PRD_INDEXES:
+                index.clear()
+            if hasattr(prd_service, '_prds_db'):
+                prd_service._prds_db.clear()
+
+    def _prune_finished(self) -> None:
+        """Forget the oldest finished jobs beyond MAX_FINISHED_JOBS."""
+        finished: List[str] = [
+            job_id for job_id, job in self._jobs.items()
+            if job["finished_at"] is not None
+        ]
+        for job_id in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self._jobs[job_id]
+
+
+# Global service instance
+purge_service = PurgeService()
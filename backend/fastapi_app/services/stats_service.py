@@ -0,0 +1,48 @@
+"""
+Stats service for dashboard counts.
+"""
+import asyncio
+from typing import Dict, List, Tuple
+from datetime import datetime
+
+from ..models.agent import AgentStatus, AgentHealthStatus
+from ..models.devin import DevinTaskStatus
+from ..models.prd import PRDStatus, PRDType
+from ..models.stats import EntityCounts, StatsResponse
+from ..utils.simple_data_manager import data_manager
+
+
+class StatsService:
+    """Service class for counts by status and type."""
+
+    async def _counts(self, table: str, column: str, enum: type) -> Dict[str, int]:
+        """Count a table's rows per value of an enum column (cached by the data manager)."""
+        values: List[str] = [member.value for member in enum]
+        return await data_manager.count_by(table, column, values)
+
+    async def _entity_counts(
+        self,
+        table: str,
+        status_enum: type,
+        **breakdowns: Tuple[str, type]
+    ) -> EntityCounts:
+        """Count one entity by status and by each (column, enum) breakdown, keyed by EntityCounts field."""
+        by_status = await self._counts(table, "status", status_enum)
+        counts = {field: await self._counts(table, column, enum) for field, (column, enum) in breakdowns.items()}
+        return EntityCounts(total=sum(by_status.values()), by_status=by_status, **counts)
+
+    async def get_stats(self) -> StatsResponse:
+        """Get PRD, agent and Devin task counts by status and type."""
+        prds, agents, devin_tasks = await asyncio.gather(
+            self._entity_counts("prds", PRDStatus, by_type=("prd_type", PRDType)),
+            self._entity_counts("agents", AgentStatus, by_health_status=("health_status", AgentHealthStatus)),
+            self._entity_counts("devin_tasks", DevinTaskStatus))
+        return StatsResponse(
+            prds=prds,
+            agents=agents,
+            devin_tasks=devin_tasks,
+            generated_at=datetime.utcnow())
+
+
+# Global service instance
+stats_service = StatsService()
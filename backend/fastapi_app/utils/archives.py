@@ -0,0 +1,93 @@
+"""
+Expansion of .zip and .tar archives uploaded in a PRD batch.
+
+Only .md and .txt members are returned. Member sizes are checked against
+the per-file limit and the running uncompressed total against the batch
+limit before anything is read, and reads are capped, so a small archive
+cannot expand into an unbounded amount of memory.
+"""
+import io
+import posixpath
+import tarfile
+import zipfile
+from typing import List, Optional, Tuple
+
+ARCHIVE_SUFFIXES = ('.zip', '.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tar.xz')
+DOCUMENT_SUFFIXES = ('.md', '.txt')
+
+# (member name, member bytes or None, error or None)
+ArchiveMember = Tuple[str, Optional[bytes], Optional[str]]
+
+
+def is_archive(filename: str) -> bool:
+    """Whether a filename names a supported archive."""
+    return filename.lower().endswith(ARCHIVE_SUFFIXES)
+
+
+def _is_document(name: str) -> bool:
+    base = posixpath.basename(name)
+    return (name.lower().endswith(DOCUMENT_SUFFIXES)
+            and not base.startswith('.')
+            and not name.startswith('__MACOSX/'))
+
+
+def expand_archive(filename: str, data: bytes, max_member_bytes: int, max_total_bytes: int) -> List[ArchiveMember]:
+    """
+    List the PRD documents in an archive.
+
+    Raises ValueError if the archive cannot be read or its documents
+    exceed max_total_bytes uncompressed; oversized members are returned
+    with an error instead of their bytes.
+    """
+    try:
+        if filename.lower().endswith('.zip'):
+            return _expand_zip(data, max_member_bytes, max_total_bytes)
+        return _expand_tar(data, max_member_bytes, max_total_bytes)
+    except (zipfile.BadZipFile, tarfile.TarError, EOFError, OSError) as e:
+        raise ValueError(f"Could not read archive {filename}: {e}")
+
+
+def _check_member(size: int, total: int, max_member_bytes: int, max_total_bytes: int) -> Optional[str]:
+    if total > max_total_bytes:
+        raise ValueError(f"Archive contents exceed {max_total_bytes // (1024 * 1024)}MB")
+    if size > max_member_bytes:
+        return f"File content cannot exceed {max_member_bytes // 1024}KB"
+    return None
+
+
+def _expand_zip(data: bytes, max_member_bytes: int, max_total_bytes: int) -> List[ArchiveMember]:
+    members: List[ArchiveMember] = []
+    total = 0
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        for info in archive.infolist():
+            if info.is_dir() or not _is_document(info.filename):
+                continue
+            total += info.file_size
+            error = _check_member(info.file_size, total, max_member_bytes, max_total_bytes)
+            if error is None:
+                with archive.open(info) as member:
+                    content = member.read(max_member_bytes + 1)
+                if len(content) > max_member_bytes:
+                    members.append((info.filename, None, f"File content cannot exceed {max_member_bytes // 1024}KB"))
+                    continue
+                members.append((info.filename, content, None))
+            else:
+                members.append((info.filename, None, error))
+    return members
+
+
+def _expand_tar(data: bytes, max_member_bytes: int, max_total_bytes: int) -> List[ArchiveMember]:
+    members: List[ArchiveMember] = []
+    total = 0
+    with tarfile.open(fileobj=io.BytesIO(data), mode='r:*') as archive:
+        for info in archive:
+            if not info.isfile() or not _is_document(info.name):
+                continue
+            total += info.size
+            error = _check_member(info.size, total, max_member_bytes, max_total_bytes)
+            if error is None:
+                member = archive.extractfile(info)
+                members.append((info.name, member.read() if member else b'', None))
+            else:
+                members.append((info.name, None, error))
+    return members
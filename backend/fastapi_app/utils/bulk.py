@@ -0,0 +1,82 @@
+"""
+Helpers for bulk create/upsert endpoints.
+
+Items are validated individually so one malformed record is reported in
+its own result instead of rejecting the whole request, then the valid
+ones are written together by ``data_manager.bulk_write``.
+"""
+import uuid
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
+
+from ..models.bulk import BulkItemResult, BulkItemStatus, BulkOperationResponse
+
+
+def format_validation_error(error: ValidationError) -> str:
+    """Flatten a pydantic validation error into one readable line."""
+    return "; ".join(
+        f"{'.'.join(str(part) for part in err['loc']) or 'item'}: {err['msg']}"
+        for err in error.errors()
+    )
+
+
+class BulkResults:
+    """Collects per-item outcomes of a bulk request in request order."""
+
+    def __init__(self, size: int, upsert: bool = False):
+        self.upsert = upsert
+        self._results: List[Optional[BulkItemResult]] = [None] * size
+
+    def invalid(self, index: int, error: str, item_id: Optional[str] = None) -> None:
+        """Record an item that failed validation."""
+        self._results[index] = BulkItemResult(
+            index=index, id=item_id, status=BulkItemStatus.INVALID, error=error)
+
+    def written(self, index: int, item_id: str, error: Optional[str] = None) -> None:
+        """Record the outcome of writing an item."""
+        if error:
+            status = BulkItemStatus.FAILED
+        else:
+            status = BulkItemStatus.UPSERTED if self.upsert else BulkItemStatus.CREATED
+        self._results[index] = BulkItemResult(index=index, id=item_id, status=status, error=error)
+
+    def response(self) -> BulkOperationResponse:
+        """Build the API response."""
+        results = [result for result in self._results if result is not None]
+        succeeded = sum(1 for result in results if result.error is None)
+        return BulkOperationResponse(
+            total=len(results),
+            succeeded=succeeded,
+            failed=len(results) - succeeded,
+            results=results)
+
+
+def validate_items(
+    items: List[Dict[str, Any]],
+    model: Type[BaseModel],
+    results: BulkResults
+) -> List[Tuple[int, str, BaseModel]]:
+    """
+    Validate raw items against a create model.
+
+    Returns (index, id, validated model) for each valid item. Items may
+    carry their own "id" (needed for upserts); others get a new UUID.
+    Repeated ids within one request are rejected, since a batched upsert
+    cannot touch the same row twice.
+    """
+    valid = []
+    seen_ids = set()
+    for index, item in enumerate(items):
+        item_id = item.get("id") or str(uuid.uuid4())
+        if item_id in seen_ids:
+            results.invalid(index, f"duplicate id {item_id} in request", item_id)
+            continue
+        try:
+            data = model(**{key: value for key, value in item.items() if key != "id"})
+        except ValidationError as e:
+            results.invalid(index, format_validation_error(e), item.get("id"))
+            continue
+        seen_ids.add(item_id)
+        valid.append((index, item_id, data))
+    return valid
@@ -0,0 +1,526 @@
+"""
+Read-through entity cache in front of the data manager.
+
+Hot records (the PRD Devin is working on, dashboard agents) used to be
+re-fetched from Supabase on every request. ``CachedDataManager`` wraps
+``SimpleDataManager`` and serves single-record reads and list queries
+from a bounded in-process LRU with per-entity TTLs, optionally backed by
+a shared Redis tier for records. Every create/update/delete/clear on an
+entity invalidates its cached records and its cached list queries.
+
+List queries are cached locally only, keyed by an entity generation that
+is bumped on each write, so a write makes every older list entry
+unreachable at once. Per-column counts (the /stats endpoint) are cached
+the same way. With several workers a write only invalidates the local
+tier of the worker that made it, so keep TTLs short.
+"""
+import json
+import time
+from collections import OrderedDict
+from dataclasses import astuple
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..config import config
+from .query_spec import QuerySpec, QueryResult, order_by_ids, unique_ids
+
+try:
+    import redis.asyncio as redis_asyncio
+except ImportError:  # Optional dependency: only needed when REDIS_URL is set
+    redis_asyncio = None
+
+
+class LRUCache:
+    """Bounded in-process cache with per-entry expiry and counters."""
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Entries kept before the least recently used is evicted
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Any) -> Optional[Any]:
+        """Get a live entry, or None on a miss."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Any, value: Any, ttl: float) -> None:
+        """Store an entry for ttl seconds, evicting the oldest if full."""
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, key: Any) -> None:
+        """Drop an entry if present."""
+        if self._entries.pop(key, None) is not None:
+            self.invalidations += 1
+
+    def delete_where(self, predicate) -> None:
+        """Drop every entry whose key matches the predicate."""
+        for key in [key for key in self._entries if predicate(key)]:
+            del self._entries[key]
+            self.invalidations += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Get counters for tuning size and TTLs."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations
+        }
+
+
+class RedisTier:
+    """Shared second-level cache for records; failures degrade to a miss."""
+
+    def __init__(self, url: str, prefix: str = "agent-factory"):
+        self.prefix = prefix
+        self._client = redis_asyncio.from_url(url, decode_responses=True)
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    def _key(self, entity: str, record_id: str) -> str:
+        return f"{self.prefix}:{entity}:{record_id}"
+
+    async def get(self, entity: str, record_id: str) -> Optional[Dict[str, Any]]:
+        """Get a cached record, or None on a miss or Redis error."""
+        try:
+            raw = await self._client.get(self._key(entity, record_id))
+        except Exception as e:
+            self.errors += 1
+            print(f"⚠️ Redis cache get failed: {e}")
+            return None
+        if raw is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(raw)
+
+    async def set(self, entity: str, record_id: str, row: Dict[str, Any], ttl: float) -> None:
+        """Store a record for ttl seconds."""
+        try:
+            await self._client.set(
+                self._key(entity, record_id), json.dumps(row, default=str), ex=max(1, int(ttl)))
+        except Exception as e:
+            self.errors += 1
+            print(f"⚠️ Redis cache set failed: {e}")
+
+    async def delete(self, entity: str, record_id: Optional[str] = None) -> None:
+        """Drop one record, or every record of the entity when no id is given."""
+        try:
+            if record_id is not None:
+                await self._client.delete(self._key(entity, record_id))
+                return
+            keys = [key async for key in self._client.scan_iter(match=self._key(entity, "*"))]
+            if keys:
+                await self._client.delete(*keys)
+        except Exception as e:
+            self.errors += 1
+            print(f"⚠️ Redis cache delete failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Get counters for the shared tier."""
+        return {"hits": self.hits, "misses": self.misses, "errors": self.errors}
+
+
+class EntityCache:
+    """Two-tier record cache plus generation-keyed list query cache."""
+
+    def __init__(
+        self,
+        ttls: Dict[str, float],
+        query_ttl: float,
+        max_entries: int = 1024,
+        redis_url: Optional[str] = None,
+        count_ttl: float = 0
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            ttls: Record TTL in seconds per entity (table name)
+            query_ttl: TTL in seconds for cached list query pages
+            max_entries: Size of the in-process LRU
+            redis_url: Optional Redis URL for the shared record tier
+            count_ttl: TTL in seconds for cached per-column counts
+        """
+        self.ttls = ttls
+        self.query_ttl = query_ttl
+        self.count_ttl = count_ttl
+        self.local = LRUCache(max_entries)
+        self.redis: Optional[RedisTier] = None
+        self._generations: Dict[str, int] = {}
+        if redis_url:
+            if redis_asyncio is None:
+                print("⚠️ REDIS_URL is set but the redis package is not installed; using in-process cache only")
+            else:
+                self.redis = RedisTier(redis_url)
+
+    def ttl(self, entity: str) -> float:
+        return self.ttls.get(entity, 0)
+
+    async def get_record(self, entity: str, record_id: str) -> Optional[Dict[str, Any]]:
+        """Get a copy of a cached record from the local tier, then Redis."""
+        row = self.local.get(("record", entity, record_id))
+        if row is None and self.redis is not None:
+            row = await self.redis.get(entity, record_id)
+            if row is not None:
+                self.local.set(("record", entity, record_id), row, self.ttl(entity))
+        return dict(row) if row is not None else None
+
+    async def set_record(
+        self,
+        entity: str,
+        record_id: str,
+        row: Dict[str, Any],
+        generation: int
+    ) -> None:
+        """Cache a record in both tiers unless a write happened since it was read."""
+        ttl = self.ttl(entity)
+        if ttl <= 0 or generation != self.generation(entity):
+            return
+        self.local.set(("record", entity, record_id), dict(row), ttl)
+        if self.redis is not None:
+            await self.redis.set(entity, record_id, row, ttl)
+
+    def generation(self, entity: str) -> int:
+        """Get the entity's write generation (bumped by every invalidation)."""
+        return self._generations.get(entity, 0)
+
+    def query_key(self, entity: str, spec: QuerySpec) -> Tuple:
+        """Build the cache key for a list query under the current generation."""
+        spec_key = tuple(
+            tuple(sorted(value.items(), key=str)) if isinstance(value, dict) else value
+            for value in astuple(spec)
+        )
+        return ("query", entity, self.generation(entity), spec_key)
+
+    def get_query(self, key: Tuple) -> Optional[QueryResult]:
+        """Get a cached list page, with copies of its rows."""
+        result = self.local.get(key)
+        if result is None:
+            return None
+        return QueryResult(
+            rows=[dict(row) for row in result.rows],
+            total=result.total,
+            offset=result.offset,
+            more=result.more)
+
+    def set_query(self, key: Tuple, result: QueryResult) -> None:
+        """Cache a list page under the key built before it was fetched."""
+        if self.query_ttl <= 0:
+            return
+        cached = QueryResult(
+            rows=[dict(row) for row in result.rows],
+            total=result.total,
+            offset=result.offset,
+            more=result.more)
+        self.local.set(key, cached, self.query_ttl)
+
+    def count_key(self, entity: str, column: str) -> Tuple:
+        """Build the cache key for per-column counts under the current generation."""
+        return ("counts", entity, self.generation(entity), column)
+
+    def get_counts(self, key: Tuple) -> Optional[Dict[str, int]]:
+        """Get a copy of cached per-column counts."""
+        counts = self.local.get(key)
+        return dict(counts) if counts is not None else None
+
+    def set_counts(self, key: Tuple, counts: Dict[str, int]) -> None:
+        """Cache per-column counts under the key built before they were fetched."""
+        if self.count_ttl <= 0:
+            return
+        self.local.set(key, dict(counts), self.count_ttl)
+
+    async def invalidate(self, entity: str, record_id: Optional[str] = None) -> None:
+        """Drop a record (or all records when no id) and every list page of the entity."""
+        self._generations[entity] = self._generations.get(entity, 0) + 1
+        if record_id is not None:
+            self.local.delete(("record", entity, record_id))
+        else:
+            self.local.delete_where(lambda key: key[0] == "record" and key[1] == entity)
+        if self.redis is not None:
+            await self.redis.delete(entity, record_id)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get counters for both tiers."""
+        return {
+            "local": self.local.stats(),
+            "redis": self.redis.stats() if self.redis is not None else None,
+            "ttl_seconds": {**self.ttls, "queries": self.query_ttl, "counts": self.count_ttl}
+        }
+
+
+class CachedDataManager:
+    """Wraps a SimpleDataManager with read-through caching and write invalidation."""
+
+    def __init__(self, manager, cache: EntityCache):
+        """
+        Initialize the wrapper.
+
+        Args:
+            manager: The SimpleDataManager to wrap
+            cache: Cache holding records and list pages
+        """
+        self._manager = manager
+        self.cache = cache
+
+    def __getattr__(self, name: str):
+        # Everything not cached here (mode, health monitor, ...) goes straight through
+        return getattr(self._manager, name)
+
+    @property
+    def uncached(self):
+        """The wrapped manager, for bulk scans that would only churn the cache."""
+        return self._manager
+
+    async def _get(self, entity: str, record_id: str, fetch) -> Optional[Dict[str, Any]]:
+        row = await self.cache.get_record(entity, record_id)
+        if row is not None:
+            return row
+        # A write racing this read bumps the generation and keeps the stale row out
+        generation = self.cache.generation(entity)
+        row = await fetch(record_id)
+        if row is not None:
+            await self.cache.set_record(entity, record_id, dict(row), generation)
+        return row
+
+    async def _get_many(
+        self,
+        entity: str,
+        ids: List[str],
+        fetch,
+        columns: Optional[Tuple[str, ...]] = None
+    ) -> List[Dict[str, Any]]:
+        ids = unique_ids(ids)
+        # Cached records are projected; partial rows fetched for the rest are never cached
+        spec = QuerySpec(columns=columns)
+        found: Dict[str, Dict[str, Any]] = {}
+        for record_id in ids:
+            row = await self.cache.get_record(entity, record_id)
+            if row is not None:
+                found[record_id] = spec.project(row)
+        missing = [record_id for record_id in ids if record_id not in found]
+        if missing and columns is not None:
+            for row in await fetch(missing, columns):
+                found[row["id"]] = row
+        elif missing:
+            generation = self.cache.generation(entity)
+            for row in await fetch(missing):
+                found[row["id"]] = row
+                await self.cache.set_record(entity, row["id"], dict(row), generation)
+        return order_by_ids(found.values(), ids)
+
+    async def _query(self, entity: str, spec: QuerySpec, fetch) -> QueryResult:
+        key = self.cache.query_key(entity, spec)
+        result = self.cache.get_query(key)
+        if result is not None:
+            return result
+        result = await fetch(spec)
+        self.cache.set_query(key, result)
+        return result
+
+    async def count_by(self, table: str, column: str, values: List[str]) -> Dict[str, int]:
+        """Count rows per value of a column (cached until the next write to the table)."""
+        key = self.cache.count_key(table, column)
+        counts = self.cache.get_counts(key)
+        if counts is None:
+            counts = await self._manager.count_by(table, column, values)
+            self.cache.set_counts(key, counts)
+        return counts
+
+    # Agent Operations
+    async def create_agent(self, agent_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create an agent."""
+        try:
+            return await self._manager.create_agent(agent_data)
+        finally:
+            await self.cache.invalidate("agents", agent_data.get("id"))
+
+    async def get_agents(self, skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        """Get agents."""
+        result = await self.query_agents(QuerySpec(offset=skip, limit=limit))
+        return result.rows
+
+    async def query_agents(self, spec: QuerySpec) -> QueryResult:
+        """Get a filtered, ordered page of agents (cached)."""
+        return await self._query("agents", spec, self._manager.query_agents)
+
+    async def get_agent(self, agent_id: str) -> Optional[Dict[str, Any]]:
+        """Get a specific agent (cached)."""
+        return await self._get("agents", agent_id, self._manager.get_agent)
+
+    async def get_agents_by_ids(self, agent_ids: List[str]) -> List[Dict[str, Any]]:
+        """Get many agents, fetching only the uncached ones."""
+        return await self._get_many("agents", agent_ids, self._manager.get_agents_by_ids)
+
+    async def update_agent(self, agent_id: str, agent_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Update an agent."""
+        try:
+            return await self._manager.update_agent(agent_id, agent_data)
+        finally:
+            await self.cache.invalidate("agents", agent_id)
+
+    async def delete_agent(self, agent_id: str) -> bool:
+        """Delete an agent."""
+        try:
+            return await self._manager.delete_agent(agent_id)
+        finally:
+            await self.cache.invalidate("agents", agent_id)
+
+    async def clear_all_agents(self) -> bool:
+        """Clear all agents."""
+        try:
+            return await self._manager.clear_all_agents()
+        finally:
+            await self.cache.invalidate("agents")
+
+    # PRD Operations
+    async def create_prd(self, prd_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a PRD."""
+        try:
+            return await self._manager.create_prd(prd_data)
+        finally:
+            await self.cache.invalidate("prds", prd_data.get("id"))
+
+    async def get_prds(self, skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        """Get PRDs."""
+        result = await self.query_prds(QuerySpec(offset=skip, limit=limit))
+        return result.rows
+
+    async def query_prds(self, spec: QuerySpec) -> QueryResult:
+        """Get a filtered, ordered page of PRDs (cached)."""
+        return await self._query("prds", spec, self._manager.query_prds)
+
+    async def get_prd(self, prd_id: str) -> Optional[Dict[str, Any]]:
+        """Get a specific PRD (cached)."""
+        return await self._get("prds", prd_id, self._manager.get_prd)
+
+    async def get_prds_by_ids(
+        self,
+        prd_ids: List[str],
+        columns: Optional[Tuple[str, ...]] = None
+    ) -> List[Dict[str, Any]]:
+        """Get many PRDs, fetching only the uncached ones."""
+        return await self._get_many("prds", prd_ids, self._manager.get_prds_by_ids, columns)
+
+    async def update_prd(self, prd_id: str, prd_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Update a PRD."""
+        try:
+            return await self._manager.update_prd(prd_id, prd_data)
+        finally:
+            await self.cache.invalidate("prds", prd_id)
+
+    async def delete_prd(self, prd_id: str) -> bool:
+        """Delete a PRD."""
+        try:
+            return await self._manager.delete_prd(prd_id)
+        finally:
+            await self.cache.invalidate("prds", prd_id)
+
+    async def clear_all_prds(self) -> bool:
+        """Clear all PRDs."""
+        try:
+            return await self._manager.clear_all_prds()
+        finally:
+            await self.cache.invalidate("prds")
+
+    # Devin Task Operations
+    async def create_devin_task(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a Devin task."""
+        try:
+            return await self._manager.create_devin_task(task_data)
+        finally:
+            await self.cache.invalidate("devin_tasks", task_data.get("id"))
+
+    async def get_devin_tasks(self, skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        """Get Devin tasks."""
+        result = await self.query_devin_tasks(QuerySpec(offset=skip, limit=limit))
+        return result.rows
+
+    async def query_devin_tasks(self, spec: QuerySpec) -> QueryResult:
+        """Get a filtered, ordered page of Devin tasks (cached)."""
+        return await self._query("devin_tasks", spec, self._manager.query_devin_tasks)
+
+    async def get_devin_task(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Get a specific Devin task (cached)."""
+        return await self._get("devin_tasks", task_id, self._manager.get_devin_task)
+
+    async def get_devin_tasks_by_ids(self, task_ids: List[str]) -> List[Dict[str, Any]]:
+        """Get many Devin tasks, fetching only the uncached ones."""
+        return await self._get_many("devin_tasks", task_ids, self._manager.get_devin_tasks_by_ids)
+
+    async def update_devin_task(self, task_id: str, task_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Update a Devin task."""
+        try:
+            return await self._manager.update_devin_task(task_id, task_data)
+        finally:
+            await self.cache.invalidate("devin_tasks", task_id)
+
+    async def bulk_write(
+        self,
+        table: str,
+        rows: List[Dict[str, Any]],
+        upsert: bool = False
+    ) -> List[Optional[str]]:
+        """Bulk insert/upsert, then invalidate the table."""
+        try:
+            return await self._manager.bulk_write(table, rows, upsert=upsert)
+        finally:
+            await self.cache.invalidate(table)
+
+    async def purge_table(self, table: str, *args, **kwargs) -> int:
+        """Delete every row of a table in batches, then invalidate it."""
+        try:
+            return await self._manager.purge_table(table, *args, **kwargs)
+        finally:
+            await self.cache.invalidate(table)
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Get cache counters for the health endpoint."""
+        return self.cache.stats()
+
+
+def create_entity_cache() -> EntityCache:
+    """Build the entity cache from configuration."""
+    return EntityCache(
+        ttls={
+            "prds": config.cache_ttl_prds,
+            "agents": config.cache_ttl_agents,
+            "devin_tasks": config.cache_ttl_devin_tasks
+        },
+        query_ttl=config.cache_ttl_queries,
+        max_entries=config.cache_max_entries,
+        redis_url=config.redis_url,
+        count_ttl=config.cache_ttl_counts)
@@ -0,0 +1,135 @@
+"""
+Cached connection health for the data managers.
+
+Services call ``is_connected()`` before almost every query. Probing the
+database each time doubled the number of round-trips, so the monitor keeps
+the last known state and refreshes it from a background asyncio task.
+Real queries report their outcome back, which marks the connection down
+as soon as a transport error is seen instead of waiting for the next probe.
+"""
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import httpx
+
+
+def is_connection_error(error: BaseException) -> bool:
+    """Whether an exception means the database could not be reached at all."""
+    return isinstance(error, (httpx.TransportError, OSError))
+
+
+class ConnectionMonitor:
+    """Caches database health with a TTL and refreshes it in the background."""
+
+    def __init__(
+        self,
+        name: str,
+        probe: Callable[[], Awaitable[Any]],
+        ttl: float = 30.0,
+        refresh_interval: float = 15.0
+    ):
+        """
+        Initialize the monitor.
+
+        Args:
+            name: Name used in logs and status output
+            probe: Coroutine function that raises if the database is unreachable
+            ttl: Seconds after which the cached state is considered stale
+            refresh_interval: Seconds between background probes
+        """
+        self.name = name
+        self._probe = probe
+        self.ttl = ttl
+        self.refresh_interval = refresh_interval
+        # Optimistic until proven otherwise; a failing query flips it at once
+        self._healthy = True
+        self._checked_at: Optional[float] = None
+        self._last_error: Optional[str] = None
+        self._last_change: Optional[datetime] = None
+        self._task: Optional[asyncio.Task] = None
+        self._refreshing: Optional[asyncio.Task] = None
+
+    @property
+    def is_healthy(self) -> bool:
+        """Return the cached state; schedules a refresh if it is stale."""
+        if self.is_stale and self._task is None:
+            self._schedule_refresh()
+        return self._healthy
+
+    @property
+    def is_stale(self) -> bool:
+        """Whether the cached state is older than the TTL."""
+        return self._checked_at is None or time.monotonic() - self._checked_at > self.ttl
+
+    def mark_up(self) -> None:
+        """Record a successful database call."""
+        self._set_state(True, None)
+
+    def mark_down(self, error: BaseException) -> None:
+        """Record a failed database call."""
+        self._set_state(False, str(error))
+
+    def _set_state(self, healthy: bool, error: Optional[str]) -> None:
+        if healthy != self._healthy:
+            self._last_change = datetime.now(timezone.utc)
+            if healthy:
+                print(f"✅ {self.name} connection restored")
+            else:
+                print(f"❌ {self.name} connection marked down: {error}")
+        self._healthy = healthy
+        self._last_error = error
+        self._checked_at = time.monotonic()
+
+    async def refresh(self) -> bool:
+        """Probe the database now and update the cached state."""
+        try:
+            await self._probe()
+            self.mark_up()
+        except Exception as e:
+            self.mark_down(e)
+        return self._healthy
+
+    def _schedule_refresh(self) -> None:
+        """Refresh in the background when there is a running loop to do it on."""
+        if self._refreshing is not None and not self._refreshing.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._refreshing = loop.create_task(self.refresh())
+
+    async def _run(self) -> None:
+        while True:
+            await self.refresh()
+            await asyncio.sleep(self.refresh_interval)
+
+    def start(self) -> None:
+        """Start the background refresh task."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background refresh task."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def status(self) -> Dict[str, Any]:
+        """Get the monitor state for health endpoints."""
+        age = None if self._checked_at is None else round(time.monotonic() - self._checked_at, 3)
+        return {
+            "name": self.name,
+            "connected": self._healthy,
+            "checked_seconds_ago": age,
+            "ttl_seconds": self.ttl,
+            "background_refresh": self._task is not None,
+            "last_error": self._last_error,
+            "last_change": self._last_change.isoformat() if self._last_change else None
+        }
@@ -0,0 +1,190 @@
+"""
+Non-blocking access to the synchronous Supabase client.
+
+supabase-py performs blocking HTTP I/O inside every ``.execute()`` call.
+Calling it directly from ``async def`` code freezes the event loop for the
+whole round-trip, so the data manager hands each query to a bounded pool of
+worker threads instead. The HTTP connection pool of the client is sized to
+match the number of workers so threads never queue on a free connection.
+
+There is one Supabase client per process (``shared_client()``): every table
+goes through the same keep-alive pool, so TLS handshakes are paid once per
+connection rather than once per manager. Calls reserved to the service role
+(the ``purge_batch()`` function) go through a second client built with
+``SUPABASE_SERVICE_ROLE_KEY`` on first use (``service_client()``). ``pool_stats()`` reports how busy
+the workers and connections are for the health endpoint.
+"""
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+import httpx
+from supabase import create_client, Client
+from supabase.lib.client_options import SyncClientOptions
+
+from ..config import config
+
+
+class DatabaseExecutor:
+    """Bounded thread pool that runs blocking database calls off the event loop."""
+
+    def __init__(self, max_workers: int):
+        """
+        Initialize the executor.
+
+        Args:
+            max_workers: Maximum number of concurrent database calls
+        """
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Utilization counters (only touched on the event loop)
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.completed = 0
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Get the underlying thread pool, creating it on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="db-worker")
+        return self._executor
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking callable on the pool and await its result."""
+        loop = asyncio.get_running_loop()
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            return await loop.run_in_executor(
+                self.executor, functools.partial(func, *args, **kwargs))
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+
+    async def execute(self, query) -> Any:
+        """Execute a PostgREST query builder without blocking the event loop."""
+        return await self.run(query.execute)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the worker threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Get worker utilization counters."""
+        return {
+            "max_workers": self.max_workers,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "queued": max(0, self.in_flight - self.max_workers),
+            "completed": self.completed,
+        }
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:  # Optional dependency: httpx[http2]
+        return False
+    return True
+
+
+def create_http_client() -> httpx.Client:
+    """Create the keep-alive HTTP client, sized to the executor."""
+    pool_size = config.db_pool_size
+    http2 = config.db_http2 and _http2_available()
+    if config.db_http2 and not http2:
+        print("⚠️ DB_HTTP2 is set but the h2 package is missing; using HTTP/1.1")
+    return httpx.Client(
+        http2=http2,
+        timeout=config.db_request_timeout,
+        limits=httpx.Limits(
+            max_connections=pool_size,
+            max_keepalive_connections=pool_size,
+            keepalive_expiry=config.db_keepalive_expiry))
+
+
+class SharedClient:
+    """The process-wide Supabase client and its HTTP pool, created on first use."""
+
+    def __init__(self, service_role: bool = False):
+        """
+        Initialize the holder.
+
+        Args:
+            service_role: Authenticate with SUPABASE_SERVICE_ROLE_KEY instead of
+                SUPABASE_KEY (which falls back to the service role key if unset)
+        """
+        self.service_role = service_role
+        self._client: Optional[Client] = None
+        self._http_client: Optional[httpx.Client] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> Client:
+        """Get the shared client (no network I/O)."""
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    supabase_url = config.supabase_url
+                    if self.service_role:
+                        supabase_key = config.supabase_service_role_key
+                    else:
+                        supabase_key = config.supabase_key or config.supabase_service_role_key
+                    if not supabase_url or not supabase_key:
+                        key_name = "service role key" if self.service_role else "key"
+                        raise ValueError(f"Supabase URL and {key_name} are required")
+                    self._http_client = create_http_client()
+                    self._client = create_client(
+                        supabase_url, supabase_key,
+                        options=SyncClientOptions(httpx_client=self._http_client))
+        return self._client
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        if self._http_client is not None:
+            self._http_client.close()
+        self._client = None
+        self._http_client = None
+
+    def connection_stats(self) -> Dict[str, Any]:
+        """Count open, idle and busy pooled connections (best effort: httpcore internals)."""
+        if self._http_client is None:
+            return {"open": 0, "idle": 0, "busy": 0, "http2": config.db_http2}
+        pool = getattr(getattr(self._http_client, "_transport", None), "_pool", None)
+        connections = list(getattr(pool, "connections", []))
+        idle = sum(1 for connection in connections if connection.is_idle())
+        return {
+            "open": len(connections),
+            "idle": idle,
+            "busy": len(connections) - idle,
+            "http2": bool(getattr(pool, "_http2", False)),
+        }
+
+
+# Global executor and client shared by every table and service
+db_executor = DatabaseExecutor(max_workers=config.db_pool_size)
+db_client = SharedClient()
+db_service_client = SharedClient(service_role=True)
+
+
+def shared_client() -> Client:
+    """Get the process-wide pooled Supabase client."""
+    return db_client.get()
+
+
+def service_client() -> Client:
+    """Get the Supabase client authenticated as the service role."""
+    return db_service_client.get()
+
+
+def pool_stats() -> Dict[str, Any]:
+    """Get worker and connection utilization for the health endpoint."""
+    return {
+        "executor": db_executor.stats(),
+        "connections": {**db_client.connection_stats(), "max": config.db_pool_size},
+    }
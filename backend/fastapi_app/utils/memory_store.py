@@ -0,0 +1,227 @@
+"""
+Indexed in-memory storage used by the development data mode.
+
+Each table keeps secondary indexes (value -> set of ids) on the columns the
+API filters by, plus a sorted (created_at, id) index. Unfiltered pages are
+sliced straight out of the sorted index and keyset pages start with a
+bisect, so paging costs O(log n) instead of a sort of the whole table;
+filtered pages walk the sorted index and stop once the page is full.
+Ordering matches Postgres: NULLs sort last ascending and first descending,
+with id as the tie-breaker.
+Rows are copied on the way in and out: callers routinely mutate the dicts
+they get back (e.g. converting timestamps) and must not corrupt the store.
+"""
+import bisect
+from collections import Counter
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .query_spec import QuerySpec, QueryResult, sort_key
+
+
+class MemoryTable:
+    """A dict-backed table with equality indexes and a sorted order index."""
+
+    def __init__(self, indexed_columns: Iterable[str] = (), sorted_column: str = "created_at"):
+        """
+        Initialize the table.
+
+        Args:
+            indexed_columns: Columns to maintain equality indexes for
+            sorted_column: Column to keep a sorted (value, id) index on
+        """
+        self.rows: Dict[str, Dict[str, Any]] = {}
+        self._indexes: Dict[str, Dict[Any, Set[str]]] = {
+            column: {} for column in indexed_columns
+        }
+        self.sorted_column = sorted_column
+        # Ascending sort keys; descending pages read it from the end
+        self._order: List[Tuple[bool, Any, str]] = []
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __contains__(self, row_id: str) -> bool:
+        return row_id in self.rows
+
+    def _index_row(self, row_id: str, row: Dict[str, Any]) -> None:
+        for column, index in self._indexes.items():
+            index.setdefault(row.get(column), set()).add(row_id)
+        bisect.insort(self._order, sort_key(row.get(self.sorted_column), row_id))
+
+    def _unindex_row(self, row_id: str, row: Dict[str, Any]) -> None:
+        for column, index in self._indexes.items():
+            ids = index.get(row.get(column))
+            if ids is not None:
+                ids.discard(row_id)
+                if not ids:
+                    del index[row.get(column)]
+        key = sort_key(row.get(self.sorted_column), row_id)
+        position = bisect.bisect_left(self._order, key)
+        if position < len(self._order) and self._order[position] == key:
+            del self._order[position]
+
+    def insert(self, row_id: str, row: Dict[str, Any]) -> Dict[str, Any]:
+        """Insert or replace a row."""
+        if row_id in self.rows:
+            self._unindex_row(row_id, self.rows[row_id])
+        stored = dict(row)
+        self.rows[row_id] = stored
+        self._index_row(row_id, stored)
+        return dict(stored)
+
+    def get(self, row_id: str) -> Optional[Dict[str, Any]]:
+        """Get a copy of a row by id."""
+        row = self.rows.get(row_id)
+        return dict(row) if row is not None else None
+
+    def get_many(self, ids: Iterable[str]) -> List[Dict[str, Any]]:
+        """Get copies of the rows that exist for the given ids."""
+        return [dict(self.rows[row_id]) for row_id in ids if row_id in self.rows]
+
+    def update(self, row_id: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Update columns of an existing row."""
+        row = self.rows.get(row_id)
+        if row is None:
+            return None
+        self._unindex_row(row_id, row)
+        row.update(data)
+        self._index_row(row_id, row)
+        return dict(row)
+
+    def delete(self, row_id: str) -> bool:
+        """Delete a row by id."""
+        row = self.rows.pop(row_id, None)
+        if row is None:
+            return False
+        self._unindex_row(row_id, row)
+        return True
+
+    def delete_batch(self, limit: int) -> int:
+        """Delete up to limit rows; returns how many were deleted."""
+        ids = list(islice(self.rows, limit))
+        for row_id in ids:
+            self.delete(row_id)
+        return len(ids)
+
+    def clear(self) -> None:
+        """Delete all rows."""
+        self.rows.clear()
+        for index in self._indexes.values():
+            index.clear()
+        self._order.clear()
+
+    def count_by(self, column: str) -> Dict[Any, int]:
+        """Count rows per value of a column (from its index when there is one)."""
+        index = self._indexes.get(column)
+        if index is not None:
+            return {value: len(ids) for value, ids in index.items()}
+        return dict(Counter(row.get(column) for row in self.rows.values()))
+
+    def _candidate_ids(self, filters: Dict[str, Any]) -> Optional[Set[str]]:
+        """Intersect index lookups for indexed filters (None = no indexed filter)."""
+        indexed = [
+            self._indexes[column].get(value, set())
+            for column, value in filters.items() if column in self._indexes
+        ]
+        if not indexed:
+            return None
+        indexed.sort(key=len)
+        if len(indexed) == 1:
+            return indexed[0]  # Read-only use; no need to copy
+        candidates = set(indexed[0])
+        for ids in indexed[1:]:
+            candidates &= ids
+        return candidates
+
+    def query(self, spec: QuerySpec) -> QueryResult:
+        """Run a filtered, ordered, paginated query."""
+        filters = spec.active_filters()
+        candidate_ids = self._candidate_ids(filters)
+        if spec.order_by != self.sorted_column or any(column not in self._indexes for column in filters):
+            # No usable sorted index or an unindexed filter: filter and sort the candidates
+            if candidate_ids is None:
+                rows = self.rows.values()
+            else:
+                rows = [self.rows[row_id] for row_id in candidate_ids]
+            return query_rows(rows, spec)
+        return self._query_sorted(spec, candidate_ids)
+
+    def _query_sorted(self, spec: QuerySpec, candidate_ids: Optional[Set[str]]) -> QueryResult:
+        """Page through the sorted index, keeping only candidate ids if filtered."""
+        order = self._order
+        total = len(order) if candidate_ids is None else len(candidate_ids)
+
+        # Positions in page order: walk the ascending index backwards when descending
+        if spec.after is not None:
+            cursor = sort_key(*spec.after)
+            if spec.descending:
+                positions = range(bisect.bisect_left(order, cursor) - 1, -1, -1)
+            else:
+                positions = range(bisect.bisect_right(order, cursor), len(order))
+            skip = 0
+        else:
+            positions = range(len(order) - 1, -1, -1) if spec.descending else range(len(order))
+            skip = spec.offset
+            if candidate_ids is None:
+                # Unfiltered offset page: index arithmetic, no walk
+                positions = positions[skip:]
+                skip = 0
+
+        # Collect one extra row so keyset pages know whether another page follows
+        wanted = spec.limit + 1 if spec.after is not None else spec.limit
+        page: List[Dict[str, Any]] = []
+        for position in positions:
+            row_id = order[position][2]
+            if candidate_ids is not None and row_id not in candidate_ids:
+                continue
+            if skip:
+                skip -= 1
+                continue
+            page.append(self.rows[row_id])
+            if len(page) == wanted:
+                break
+
+        if spec.after is not None:
+            return QueryResult(
+                rows=[spec.project(row) for row in page[:spec.limit]],
+                total=total,
+                more=len(page) > spec.limit)
+        return QueryResult(rows=[spec.project(row) for row in page], total=total, offset=spec.offset)
+
+
+def query_rows(rows: Iterable[Dict[str, Any]], spec: QuerySpec) -> QueryResult:
+    """Filter, order and page plain row dicts according to a query spec."""
+    matching = [row for row in rows if spec.matches(row)]
+
+    # Like Postgres: NULLs sort last ascending and first descending
+    matching.sort(key=lambda row: sort_key(row.get(spec.order_by), row.get("id")), reverse=spec.descending)
+    if spec.after is not None:
+        remaining = [row for row in matching if spec.is_after_cursor(row)]
+        return QueryResult(
+            rows=[spec.project(row) for row in remaining[:spec.limit]],
+            total=len(matching),
+            more=len(remaining) > spec.limit)
+    page = matching[spec.offset:spec.offset + spec.limit]
+    return QueryResult(rows=[spec.project(row) for row in page], total=len(matching), offset=spec.offset)
+
+
+class MemoryStore:
+    """In-memory tables mirroring the Supabase schema and its indexes."""
+
+    def __init__(self):
+        """Initialize tables with the same filter indexes as infra/database/schema.sql."""
+        self.tables: Dict[str, MemoryTable] = {
+            "agents": MemoryTable(["status", "health_status", "prd_id"]),
+            "prds": MemoryTable(["status", "prd_type", "priority", "content_hash"]),
+            "devin_tasks": MemoryTable(["status", "prd_id"]),
+            "audit_logs": MemoryTable(["table_name", "record_id", "action"], sorted_column="timestamp"),
+            "system_metrics": MemoryTable(["metric_name"], sorted_column="timestamp"),
+        }
+
+    def __getitem__(self, table: str) -> MemoryTable:
+        return self.tables[table]
+
+    def values(self, table: str) -> List[Dict[str, Any]]:
+        """Get copies of all rows in a table."""
+        return [dict(row) for row in self.tables[table].rows.values()]
@@ -0,0 +1,193 @@
+"""
+MinHash signatures and an LSH index for near-duplicate text detection.
+
+Text is cut into shingles (runs of SHINGLE_SIZE words) and the Jaccard
+similarity of two shingle sets is estimated as the share of equal
+entries in their MinHash signatures. ``LSHIndex`` hashes bands of each
+stored signature into buckets, so a query signature is only compared
+with the signatures it shares a bucket with rather than with all of them.
+
+Signatures use one-permutation hashing: every shingle is hashed once
+into one of NUM_PERM bins and each bin keeps its minimum, so signing
+costs one pass over the shingles instead of NUM_PERM. Bins left empty
+(short texts) borrow the value of the nearest filled bin to their right,
+offset by the distance, which keeps the estimate unbiased.
+"""
+import re
+import zlib
+from array import array
+from functools import lru_cache
+from operator import eq
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+WORD = re.compile(r"[a-z0-9]+")
+
+SHINGLE_SIZE = 3
+
+# Signature length; a power of two
+NUM_PERM = 128
+
+_MASK = (1 << 64) - 1
+_MIX = 0x9E3779B97F4A7C15
+_BIN_BITS = NUM_PERM.bit_length() - 1
+_VALUE_BITS = 64 - _BIN_BITS
+_VALUE_MASK = (1 << _VALUE_BITS) - 1
+_EMPTY = _MASK
+
+
+def shingles(text: str) -> Set[int]:
+    """Hashes of the text's word shingles (all its words when it has fewer)."""
+    words = list(map(zlib.crc32, map(str.encode, WORD.findall(text.lower()))))
+    if len(words) < SHINGLE_SIZE:
+        return {hash(tuple(words))} if words else set()
+    return set(map(hash, zip(*(words[offset:] for offset in range(SHINGLE_SIZE)))))
+
+
+def signature(shingle_hashes: Iterable[int]) -> Optional[array]:
+    """MinHash signature of a shingle set, or None when it is empty."""
+    bins = [_EMPTY] * NUM_PERM
+    for shingle in shingle_hashes:
+        mixed = (shingle * _MIX) & _MASK
+        slot = mixed >> _VALUE_BITS
+        value = mixed & _VALUE_MASK
+        if value < bins[slot]:
+            bins[slot] = value
+
+    empty = bins.count(_EMPTY)
+    if empty == NUM_PERM:
+        return None
+    if empty:
+        filled = list(bins)
+        for slot, value in enumerate(bins):
+            if value == _EMPTY:
+                distance = 1
+                while bins[(slot + distance) % NUM_PERM] == _EMPTY:
+                    distance += 1
+                filled[slot] = bins[(slot + distance) % NUM_PERM] + (distance << _VALUE_BITS)
+        bins = filled
+    return array("Q", bins)
+
+
+def similarity(first: array, second: array) -> float:
+    """Estimated Jaccard similarity of the texts behind two signatures."""
+    return sum(map(eq, first, second)) / NUM_PERM
+
+
+def _integrate(function, low: float, high: float, steps: int = 100) -> float:
+    """Midpoint-rule integral of function over [low, high]."""
+    width = (high - low) / steps
+    return sum(function(low + (step + 0.5) * width) for step in range(steps)) * width
+
+
+@lru_cache(maxsize=None)
+def lsh_params(threshold: float, num_perm: int = NUM_PERM,
+               false_positive_weight: float = 0.3, false_negative_weight: float = 0.7) -> Tuple[int, int]:
+    """
+    Bands and rows per band for a similarity threshold.
+
+    Minimizes the weighted areas under the false positive curve (below the
+    threshold) and the false negative curve (above it). Candidates are
+    verified against the full signature, so misses weigh more than extra
+    candidates.
+    """
+    best, best_params = float("inf"), (1, num_perm)
+    for bands in range(1, num_perm + 1):
+        for rows in range(1, num_perm // bands + 1):
+            false_positive = _integrate(lambda s: 1 - (1 - s ** rows) ** bands, 0.0, threshold)
+            false_negative = _integrate(lambda s: (1 - s ** rows) ** bands, threshold, 1.0)
+            error = false_positive_weight * false_positive + false_negative_weight * false_negative
+            if error < best:
+                best, best_params = error, (bands, rows)
+    return best_params
+
+
+class LSHIndex:
+    """
+    Signatures keyed by id, bucketed by band for threshold queries.
+
+    A bucket holds a single key, or a list of keys once it is shared;
+    keys must therefore not be lists themselves.
+    """
+
+    def __init__(self, threshold: float):
+        """Initialize an empty index for the given similarity threshold."""
+        self.threshold = threshold
+        self.bands, self.rows = lsh_params(round(threshold, 2))
+        self._buckets: List[Dict[int, object]] = [{} for _ in range(self.bands)]
+        self._signatures: Dict[Hashable, array] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._signatures
+
+    def _band_hashes(self, sig: array) -> List[int]:
+        """One hash per band of a signature."""
+        data = sig.tobytes()
+        width = self.rows * sig.itemsize
+        return [hash(data[band * width:(band + 1) * width]) for band in range(self.bands)]
+
+    def add(self, key: Hashable, sig: array) -> None:
+        """Store a signature, replacing any earlier one for the key."""
+        if key in self._signatures:
+            self.remove(key)
+        self._signatures[key] = sig
+        for buckets, band_hash in zip(self._buckets, self._band_hashes(sig)):
+            bucket = buckets.get(band_hash)
+            if bucket is None:
+                buckets[band_hash] = key
+            elif isinstance(bucket, list):
+                bucket.append(key)
+            else:
+                buckets[band_hash] = [bucket, key]
+
+    def remove(self, key: Hashable) -> None:
+        """Drop a key's signature, if stored."""
+        sig = self._signatures.pop(key, None)
+        if sig is None:
+            return
+        for buckets, band_hash in zip(self._buckets, self._band_hashes(sig)):
+            bucket = buckets.get(band_hash)
+            if isinstance(bucket, list):
+                bucket.remove(key)
+                if len(bucket) == 1:
+                    buckets[band_hash] = bucket[0]
+            elif bucket is not None:
+                del buckets[band_hash]
+
+    def clear(self) -> None:
+        """Drop every signature."""
+        self._signatures.clear()
+        for buckets in self._buckets:
+            buckets.clear()
+
+    def candidates(self, sig: array) -> Set[Hashable]:
+        """Keys sharing at least one band bucket with a signature."""
+        found: Set[Hashable] = set()
+        for buckets, band_hash in zip(self._buckets, self._band_hashes(sig)):
+            bucket = buckets.get(band_hash)
+            if isinstance(bucket, list):
+                found.update(bucket)
+            elif bucket is not None:
+                found.add(bucket)
+        return found
+
+    def query(self, sig: array, limit: Optional[int] = None) -> List[Tuple[Hashable, float]]:
+        """(key, estimated similarity) pairs at or above the threshold, most similar first."""
+        matches = []
+        for key in self.candidates(sig):
+            score = similarity(sig, self._signatures[key])
+            if score >= self.threshold:
+                matches.append((key, score))
+        matches.sort(key=lambda match: (-match[1], str(match[0])))
+        return matches[:limit] if limit is not None else matches
+
+    def stats(self) -> Dict[str, int]:
+        """Index size for health output."""
+        return {
+            "signatures": len(self._signatures),
+            "bands": self.bands,
+            "rows_per_band": self.rows,
+            "buckets": sum(len(buckets) for buckets in self._buckets),
+        }
@@ -0,0 +1,68 @@
+"""
+Opaque keyset pagination cursors.
+
+A cursor encodes the sort key of the last row of a page - ``(created_at,
+id)`` by default - so the next page starts strictly after it. Unlike
+offsets this costs the same at any depth and is stable while rows are
+inserted between requests.
+"""
+import base64
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException
+
+from .query_spec import QuerySpec, QueryResult, unique_ids
+
+
+def encode_cursor(row: Dict[str, Any], order_by: str = "created_at") -> str:
+    """Build an opaque cursor pointing just after the given row."""
+    value = row.get(order_by)
+    if hasattr(value, "isoformat"):
+        value = value.isoformat()
+    payload = json.dumps([value, row.get("id")], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, str]:
+    """Decode a cursor into its (sort value, id) pair."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except Exception:
+        raise ValueError("Invalid pagination cursor")
+    if not isinstance(row_id, str):
+        raise ValueError("Invalid pagination cursor")
+    return value, row_id
+
+
+def parse_cursor_param(cursor: Optional[str]) -> Optional[Tuple[Any, str]]:
+    """Decode an optional ``cursor`` query parameter, rejecting bad ones with a 400."""
+    if not cursor:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+MAX_IDS_PER_REQUEST = 1000
+
+
+def parse_ids_param(ids: Optional[str]) -> Optional[List[str]]:
+    """Split a comma-separated ``ids`` query parameter, rejecting oversized ones with a 400."""
+    if ids is None:
+        return None
+    parsed = unique_ids(part.strip() for part in ids.split(","))
+    if len(parsed) > MAX_IDS_PER_REQUEST:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_IDS_PER_REQUEST} ids can be fetched per request")
+    return parsed
+
+
+def next_cursor(result: QueryResult, spec: QuerySpec) -> Optional[str]:
+    """Get the cursor for the page after this result, if there is one."""
+    if not result.has_next or not result.rows:
+        return None
+    return encode_cursor(result.rows[-1], spec.order_by)
@@ -0,0 +1,73 @@
+"""
+Process pool for CPU-bound PRD parsing.
+
+Parsing is pure Python and holds the GIL, so running it on the event loop
+(or on threads) stalls every other request while a large batch is parsed.
+``parse_pool`` runs parses in worker processes instead. Workers are started
+with "spawn" so they never inherit the parent's database threads or open
+connections, and only import the parser module.
+"""
+import asyncio
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from ..config import config
+
+
+class ParsePool:
+    """Lazily started process pool; runs inline when configured with no workers."""
+
+    def __init__(self, max_workers: int):
+        """
+        Initialize the pool.
+
+        Args:
+            max_workers: Worker processes (0 parses on the event loop thread)
+        """
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # Utilization counters (only touched on the event loop)
+        self.in_flight = 0
+        self.completed = 0
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """Get the underlying process pool, starting it on first use."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"))
+        return self._executor
+
+    async def run(self, func: Callable[..., Any], *args) -> Any:
+        """Run a picklable module-level function in a worker and await its result."""
+        if self.max_workers <= 0:
+            return func(*args)
+        loop = asyncio.get_running_loop()
+        self.in_flight += 1
+        try:
+            return await loop.run_in_executor(self.executor, functools.partial(func, *args))
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Get worker utilization counters."""
+        return {
+            "max_workers": self.max_workers,
+            "started": self._executor is not None,
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+        }
+
+
+# Global parse pool instance
+parse_pool = ParsePool(config.prd_parse_workers)
@@ -0,0 +1,126 @@
+"""
+Storage-independent list query specification.
+
+Services describe what they want (equality filters, ordering, a page) and
+each storage backend translates it: PostgREST ``.eq()``/``.order()``/
+``.range()`` calls for Supabase, index lookups for the in-memory store.
+Filtering therefore happens before pagination, so pages are always full
+and totals are exact.
+"""
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+def unique_ids(ids: Iterable[str]) -> List[str]:
+    """Drop empty and repeated ids, keeping first-seen order."""
+    return list(dict.fromkeys(row_id for row_id in ids if row_id))
+
+
+def chunked(items: List[Any], size: int) -> List[List[Any]]:
+    """Split a list into chunks of at most size items."""
+    return [items[start:start + size] for start in range(0, len(items), size)]
+
+
+def order_by_ids(rows: Iterable[Dict[str, Any]], ids: List[str]) -> List[Dict[str, Any]]:
+    """Return rows in the order their ids were requested, skipping missing ids."""
+    by_id = {row["id"]: row for row in rows}
+    return [by_id[row_id] for row_id in ids if row_id in by_id]
+
+
+def sort_key(value: Any, row_id: Any) -> Tuple[bool, Any, str]:
+    """Null-aware (value, id) sort key; ascending order puts NULLs last like Postgres."""
+    if hasattr(value, "isoformat"):
+        value = value.isoformat()
+    return (value is None, value if value is not None else "", row_id or "")
+
+
+@dataclass
+class QuerySpec:
+    """Filters, ordering and pagination for a list query."""
+    filters: Dict[str, Any] = field(default_factory=dict)
+    order_by: str = "created_at"
+    descending: bool = True
+    offset: int = 0
+    limit: int = 100
+    # Keyset position (order_by value, id): return rows strictly after it
+    after: Optional[Tuple[Any, str]] = None
+    # Columns to fetch; None means every column
+    columns: Optional[Tuple[str, ...]] = None
+
+    def without_cursor(self) -> "QuerySpec":
+        """Get the same query without a keyset position or page bounds."""
+        return replace(self, after=None, offset=0)
+
+    @property
+    def select_clause(self) -> str:
+        """Get the PostgREST select list, always including the paging keys."""
+        if self.columns is None:
+            return "*"
+        columns = list(self.columns)
+        for key in ("id", self.order_by):
+            if key not in columns:
+                columns.append(key)
+        return ",".join(columns)
+
+    def project(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a row keeping only the selected columns."""
+        if self.columns is None:
+            return dict(row)
+        return {column: row.get(column) for column in self.select_clause.split(",")}
+
+    def active_filters(self) -> Dict[str, Any]:
+        """Get the filters that are actually set (None means 'no filter')."""
+        return {key: value for key, value in self.filters.items() if value is not None}
+
+    def apply_postgrest(self, query):
+        """Apply filters, ordering and the page range to a PostgREST query."""
+        for column, value in self.active_filters().items():
+            query = query.eq(column, value)
+        if self.after is not None:
+            query = query.or_(self.postgrest_keyset_filter())
+        # id is the tie-breaker so rows sharing a timestamp page deterministically
+        query = query.order(self.order_by, desc=self.descending)
+        if self.order_by != "id":
+            query = query.order("id", desc=self.descending)
+        if self.after is not None:
+            # One extra row tells us whether another page exists
+            return query.limit(self.limit + 1)
+        return query.range(self.offset, self.offset + self.limit - 1)
+
+    def postgrest_keyset_filter(self) -> str:
+        """Build the PostgREST or() filter selecting rows after the cursor."""
+        value, row_id = self.after
+        op = "lt" if self.descending else "gt"
+        return (
+            f'{self.order_by}.{op}."{value}",'
+            f'and({self.order_by}.eq."{value}",id.{op}."{row_id}")'
+        )
+
+    def is_after_cursor(self, row: Dict[str, Any]) -> bool:
+        """Check whether a row sorts strictly after the keyset position."""
+        if self.after is None:
+            return True
+        key = sort_key(row.get(self.order_by), row.get("id"))
+        cursor = sort_key(*self.after)
+        return key < cursor if self.descending else key > cursor
+
+    def matches(self, row: Dict[str, Any]) -> bool:
+        """Check whether a row satisfies all active filters."""
+        return all(row.get(column) == value for column, value in self.active_filters().items())
+
+
+@dataclass
+class QueryResult:
+    """One page of rows plus the total number of matching rows."""
+    rows: List[Dict[str, Any]]
+    total: int
+    offset: int = 0
+    # Set by keyset queries, which cannot derive it from offset and total
+    more: Optional[bool] = None
+
+    @property
+    def has_next(self) -> bool:
+        """Whether more matching rows exist after this page."""
+        if self.more is not None:
+            return self.more
+        return self.offset + len(self.rows) < self.total
@@ -0,0 +1,274 @@
+"""
+Retry policy and circuit breaker for database calls.
+
+When Supabase degrades, retrying every error with long fixed backoffs
+piles requests up behind calls that are bound to fail. ``RetryPolicy``
+retries only transient failures (transport errors, timeouts, 5xx/429,
+Postgres connection and serialization errors), sleeps asynchronously
+with decorrelated jitter so retries from many requests spread out, and
+gives up once the per-call deadline is spent. Writes that are not
+idempotent (inserts) are only retried when the request never reached the
+server, since a timed-out insert may have landed. A shared ``CircuitBreaker``
+opens after a run of transient failures and fails calls fast until a
+single trial call is let through after the reset timeout.
+
+Both fail-fast errors subclass OSError, so ``is_connection_error`` treats
+them like an unreachable database and services fall back as before.
+"""
+import asyncio
+import random
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import httpx
+from postgrest.exceptions import APIError
+
+from ..config import config
+
+# HTTP statuses worth retrying: timeouts, rate limiting, gateway/server errors
+TRANSIENT_HTTP_STATUSES = {408, 425, 429, 500, 502, 503, 504}
+
+# SQLSTATE / PostgREST codes for failures that may succeed on retry
+TRANSIENT_DB_CODES = {
+    "40001",     # serialization_failure
+    "40P01",     # deadlock_detected
+    "55P03",     # lock_not_available
+    "57014",     # query_canceled (statement timeout)
+    "PGRST000",  # PostgREST could not connect to the database
+    "PGRST001",  # database connection error
+    "PGRST002",  # schema cache not loaded yet
+}
+TRANSIENT_DB_CODE_CLASSES = ("08", "53", "57P")  # connection, resources, operator intervention
+
+# Failures raised before a request was sent: safe to retry even for non-idempotent writes
+UNSENT_REQUEST_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout, ConnectionRefusedError)
+
+
+class CircuitOpenError(ConnectionError):
+    """Raised without calling the database while the circuit breaker is open."""
+
+
+class DeadlineExceededError(TimeoutError):
+    """Raised when a call and its retries run past the per-call deadline."""
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """Whether a failed database call may succeed if retried."""
+    if isinstance(error, CircuitOpenError):
+        return False
+    if isinstance(error, (httpx.TransportError, OSError)):
+        return True
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in TRANSIENT_HTTP_STATUSES
+    if isinstance(error, APIError):
+        code = error.code
+        if isinstance(code, int):
+            # Non-JSON error bodies (e.g. a gateway page) carry the HTTP status
+            return code in TRANSIENT_HTTP_STATUSES
+        if isinstance(code, str):
+            return code in TRANSIENT_DB_CODES or code.startswith(TRANSIENT_DB_CODE_CLASSES)
+    return False
+
+
+def is_retryable_error(error: BaseException, idempotent: bool = True) -> bool:
+    """Whether a failed call may be retried: transient, and for writes also never sent."""
+    if not is_transient_error(error):
+        return False
+    return idempotent or isinstance(error, UNSENT_REQUEST_ERRORS)
+
+
+class CircuitBreaker:
+    """Closed -> open after consecutive transient failures -> half-open trial -> closed."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Initialize the breaker.
+
+        Args:
+            name: Name used in logs and status output
+            failure_threshold: Consecutive transient failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before a trial call
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_started: Optional[float] = None
+        self._last_change: Optional[datetime] = None
+        self.trips = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        """Get the current state, moving open to half-open once the timeout passed."""
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._set_state(self.HALF_OPEN)
+        return self._state
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError unless a call may go through now."""
+        state = self.state
+        if state == self.CLOSED:
+            return
+        now = time.monotonic()
+        # Half-open lets one trial through; a trial that never reported back expires
+        if state == self.HALF_OPEN and (
+                self._trial_started is None or now - self._trial_started >= self.reset_timeout):
+            self._trial_started = now
+            return
+        self.rejected += 1
+        retry_in = self.reset_timeout if state == self.HALF_OPEN else \
+            self.reset_timeout - (now - self._opened_at)
+        raise CircuitOpenError(
+            f"{self.name} circuit breaker is {state}; failing fast (retry in {max(0.0, retry_in):.1f}s)")
+
+    def record_success(self) -> None:
+        """Record a call that reached the database; closes the circuit."""
+        self._failures = 0
+        self._trial_started = None
+        if self._state != self.CLOSED:
+            self._set_state(self.CLOSED)
+
+    def record_failure(self, error: BaseException) -> None:
+        """Record a transient failure; opens the circuit at the threshold or on a failed trial."""
+        self._failures += 1
+        self._trial_started = None
+        if self._state == self.HALF_OPEN or (
+                self._state == self.CLOSED and self._failures >= self.failure_threshold):
+            self._opened_at = time.monotonic()
+            self.trips += 1
+            self._set_state(self.OPEN, error)
+
+    def _set_state(self, state: str, error: Optional[BaseException] = None) -> None:
+        if state == self.OPEN:
+            print(f"🔌 {self.name} circuit breaker opened after {self._failures} failures: {error}")
+        elif state == self.CLOSED:
+            print(f"✅ {self.name} circuit breaker closed")
+        self._state = state
+        self._last_change = datetime.now(timezone.utc)
+
+    def status(self) -> Dict[str, Any]:
+        """Get the breaker state for health endpoints."""
+        state = self.state
+        retry_in = None
+        if state == self.OPEN:
+            retry_in = round(max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at)), 3)
+        return {
+            "name": self.name,
+            "state": state,
+            "consecutive_failures": self._failures,
+            "failure_threshold": self.failure_threshold,
+            "reset_timeout_seconds": self.reset_timeout,
+            "retry_in_seconds": retry_in,
+            "trips": self.trips,
+            "rejected_calls": self.rejected,
+            "last_change": self._last_change.isoformat() if self._last_change else None
+        }
+
+
+class RetryPolicy:
+    """Retries transient failures with decorrelated jitter inside a per-call deadline."""
+
+    def __init__(
+        self,
+        breaker: CircuitBreaker,
+        max_attempts: int = 3,
+        base_delay: float = 0.1,
+        max_delay: float = 2.0,
+        deadline: float = 10.0
+    ):
+        """
+        Initialize the policy.
+
+        Args:
+            breaker: Circuit breaker consulted before and updated after every attempt
+            max_attempts: Attempts per call, including the first
+            base_delay: Smallest backoff between attempts, in seconds
+            max_delay: Largest backoff between attempts, in seconds
+            deadline: Total seconds a call may take, including retries and backoff
+        """
+        self.breaker = breaker
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.calls = 0
+        self.retries = 0
+        self.deadline_exceeded = 0
+
+    def next_delay(self, previous: float) -> float:
+        """Decorrelated jitter: uniform between the base and three times the last delay, capped."""
+        return min(self.max_delay, random.uniform(self.base_delay, max(self.base_delay, previous * 3)))
+
+    async def call(self, func: Callable[..., Awaitable[Any]], *args, idempotent: bool = True, **kwargs) -> Any:
+        """
+        Await func(*args, **kwargs), retrying transient failures.
+
+        With idempotent=False only failures raised before the request was
+        sent are retried. A call that runs past the deadline is never
+        retried: its executor thread cannot be cancelled and may still land.
+        """
+        self.calls += 1
+        deadline = time.monotonic() + self.deadline
+        delay = self.base_delay
+        attempt = 0
+        while True:
+            attempt += 1
+            self.breaker.before_call()
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining <= 0:
+                    raise asyncio.TimeoutError()
+                result = await asyncio.wait_for(func(*args, **kwargs), timeout=remaining)
+            except Exception as e:
+                if isinstance(e, asyncio.TimeoutError) and time.monotonic() >= deadline:
+                    self.deadline_exceeded += 1
+                    error = DeadlineExceededError(f"Database call exceeded its {self.deadline}s deadline")
+                    self.breaker.record_failure(error)
+                    raise error from None
+                if not is_transient_error(e):
+                    # The database answered (e.g. a 4xx validation error): healthy, not retryable
+                    self.breaker.record_success()
+                    raise
+                self.breaker.record_failure(e)
+                if attempt >= self.max_attempts or not is_retryable_error(e, idempotent):
+                    raise
+                delay = self.next_delay(delay)
+                if time.monotonic() + delay >= deadline:
+                    raise
+                self.retries += 1
+                print(f"⏳ Transient database error (attempt {attempt}), retrying in {delay:.2f}s: {e}")
+                await asyncio.sleep(delay)
+                continue
+            self.breaker.record_success()
+            return result
+
+    def status(self) -> Dict[str, Any]:
+        """Get retry counters and breaker state for health endpoints."""
+        return {
+            "max_attempts": self.max_attempts,
+            "deadline_seconds": self.deadline,
+            "calls": self.calls,
+            "retries": self.retries,
+            "deadline_exceeded": self.deadline_exceeded,
+            "circuit_breaker": self.breaker.status()
+        }
+
+
+# Shared by both data managers: they talk to the same Supabase project
+db_retry_policy = RetryPolicy(
+    CircuitBreaker(
+        "Supabase",
+        failure_threshold=config.db_breaker_threshold,
+        reset_timeout=config.db_breaker_reset),
+    max_attempts=config.db_retry_attempts,
+    base_delay=config.db_retry_base_delay,
+    max_delay=config.db_retry_max_delay,
+    deadline=config.db_call_deadline)
@@ -0,0 +1,66 @@
+"""
+Decoding of stored rows into API response models.
+
+Supabase and the local stores hand rows back with timestamps as ISO-8601
+strings. Services used to convert each timestamp column by hand with
+``datetime.fromisoformat(value.replace('Z', '+00:00'))`` before building
+the model. The model's own pydantic-core validator already parses ISO-8601
+(including "Z" and 1-6 fractional digits) in Rust, so ``RowDecoder`` hands
+the raw row straight to the validator compiled for each model and skips
+the Python-level parsing entirely.
+
+``model_construct`` is deliberately not used for trusted rows: in pydantic
+v2 it is implemented in Python and measures slower than validation (see
+scripts/testing/benchmark-row-decoding.py).
+"""
+from typing import Any, Callable, Dict, Iterable, List, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class RowDecoder:
+    """Row -> model conversion for one response model."""
+
+    def __init__(self, model: Type[M]):
+        """
+        Initialize the decoder.
+
+        Args:
+            model: Response model the rows are built into
+        """
+        self.model = model
+        self._validate: Callable[[Dict[str, Any]], M] = model.model_validate
+
+    def build(self, row: Dict[str, Any]) -> M:
+        """Build the model from a stored row."""
+        return self._validate(row)
+
+    def build_many(self, rows: Iterable[Dict[str, Any]]) -> List[M]:
+        """Build models for many stored rows."""
+        validate = self._validate
+        return [validate(row) for row in rows]
+
+
+_decoders: Dict[type, RowDecoder] = {}
+
+
+def decoder_for(model: Type[M]) -> RowDecoder:
+    """Get the (cached) decoder for a response model."""
+    decoder = _decoders.get(model)
+    if decoder is None:
+        decoder = _decoders[model] = RowDecoder(model)
+    return decoder
+
+
+def decode_row(model: Type[M], row: Optional[Dict[str, Any]]) -> Optional[M]:
+    """Build one model from a stored row (None stays None)."""
+    if row is None:
+        return None
+    return decoder_for(model).build(row)
+
+
+def decode_rows(model: Type[M], rows: Iterable[Dict[str, Any]]) -> List[M]:
+    """Build models from stored rows."""
+    return decoder_for(model).build_many(rows)
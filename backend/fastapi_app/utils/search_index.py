@@ -0,0 +1,477 @@
+"""
+In-process BM25 full-text index.
+
+``SearchIndex`` keeps an inverted index (term -> {doc id: impact}) over a
+few weighted text fields per document (a field's weight multiplies both
+its term frequencies and its share of the document length, as in BM25F).
+A posting's impact is its BM25 term-frequency component, computed once
+against a frozen average document length, so a query score is just
+sum(idf * impact) with idf taken from live document frequencies. Once the
+live average drifts from the frozen one by more than REWEIGHT_DRIFT, the
+index needs a reweight: every impact is recomputed against the new
+average into a second set of postings, in chunks (``reweight_steps``) so
+the caller can yield to its event loop between them. Writes go to both
+sets meanwhile, queries keep using the old one, and the new set replaces
+it when complete. Memory for postings peaks at twice the usual during a
+reweight.
+
+Queries run Fagin's threshold algorithm over impact-sorted posting lists:
+the lists of the query terms are read from their highest impact (always
+advancing the list that adds most to the threshold), every newly seen
+document is scored exactly with dictionary lookups, and reading stops
+once no unseen document can beat the k-th best score. Queries made only
+of terms found in most documents have flat scores and read further; they
+are the slow case. Frequent terms keep their sorted list (doc ids only, ordered
+by the impacts in the postings, then by id) and maintain it with bisect
+on writes; short lists are sorted when queried.
+"""
+import html
+import math
+import re
+from array import array
+from bisect import bisect_left, insort
+from collections import Counter
+from contextlib import contextmanager
+from heapq import nlargest
+from itertools import chain, repeat
+from operator import add, mul
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+TOKEN = re.compile(r"[A-Za-z0-9]+")
+
+STOPWORDS = frozenset((
+    "a", "an", "and", "are", "as", "at", "be", "by", "can", "for", "from",
+    "has", "have", "in", "into", "is", "it", "its", "of", "on", "or", "so",
+    "that", "the", "their", "this", "to", "was", "we", "will", "with",
+))
+
+# Relative change of the average document length that triggers a reweight
+REWEIGHT_DRIFT = 0.10
+
+# Postings read from a list the first time a query reads it
+TOP_K_FIRST_BLOCK = 64
+
+# Documents, then postings sorted, per step of a reweight
+REWEIGHT_STEP_DOCUMENTS = 200
+REWEIGHT_STEP_POSTINGS = 20000
+
+FieldValue = Union[str, Iterable[str], None]
+
+
+def field_text(value: FieldValue) -> str:
+    """Join a text or list-of-text field into one string."""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    return "\n".join(str(item) for item in value if item)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric tokens, without stopwords and single characters."""
+    tokens = []
+    for match in TOKEN.finditer(text):
+        token = match.group().lower()
+        if len(token) > 1 and token not in STOPWORDS:
+            tokens.append(token)
+    return tokens
+
+
+def query_terms(query: str) -> List[str]:
+    """Distinct tokens of a query, in order."""
+    return list(dict.fromkeys(tokenize(query)))
+
+
+def highlight(text: str, terms: Set[str], width: int = 160) -> Optional[str]:
+    """
+    Cut an HTML snippet around the first query term in text.
+
+    The snippet is escaped, every query term in it is wrapped in <mark>,
+    and an ellipsis marks each side that was cut. Returns None when text
+    contains none of the terms.
+    """
+    matches = [match for match in TOKEN.finditer(text) if match.group().lower() in terms]
+    if not matches:
+        return None
+    start = max(0, matches[0].start() - width // 4)
+    if start:
+        # Start on a word: skip the partial one, unless that would pass the match
+        space = text.find(" ", start, matches[0].start())
+        start = space + 1 if space != -1 else matches[0].start()
+    end = min(len(text), start + width)
+    if end < len(text):
+        space = text.rfind(" ", start, end)
+        if space > matches[0].end():
+            end = space
+
+    parts = ["…" if start else ""]
+    position = start
+    for match in matches:
+        if match.start() >= end:
+            break
+        if match.end() > end:
+            end = match.end()
+        parts.append(html.escape(text[position:match.start()]))
+        parts.append(f"<mark>{html.escape(match.group())}</mark>")
+        position = match.end()
+    parts.append(html.escape(text[position:end]))
+    if end < len(text):
+        parts.append("…")
+    return "".join(parts).replace("\n", " ")
+
+
+class _Impacts:
+    """Posting impacts computed against one frozen average document length."""
+
+    def __init__(self, avgdl: float, k1: float, b: float, ranked_min_df: int, building: bool = False):
+        """
+        Initialize an empty set of postings.
+
+        Args:
+            avgdl: Frozen average document length
+            k1: BM25 term-frequency saturation
+            b: BM25 document-length normalization
+            ranked_min_df: Document frequency from which a term's sorted list is kept
+            building: While True no sorted list is created (a reweight sorts them at the end)
+        """
+        self.avgdl = avgdl
+        self.k1 = k1
+        self.b = b
+        self.ranked_min_df = ranked_min_df
+        self.building = building
+        self.postings: Dict[str, Dict[str, float]] = {}
+        # term -> doc ids by descending impact, for frequent terms
+        self.ranked: Dict[str, List[str]] = {}
+
+    def norm(self, length: float) -> float:
+        """BM25 length normalization against the frozen average length."""
+        if not self.avgdl:
+            return self.k1
+        return self.k1 * (1 - self.b + self.b * length / self.avgdl)
+
+    def add(self, doc_id: str, terms: Tuple[str, ...], frequencies: array, length: float) -> None:
+        """Add (or overwrite) a document's postings."""
+        k1 = self.k1
+        norm = self.norm(length)
+        if self.building and not self.ranked:
+            postings = self.postings
+            for term, frequency in zip(terms, frequencies):
+                term_postings = postings.get(term)
+                if term_postings is None:
+                    term_postings = postings[term] = {}
+                term_postings[doc_id] = frequency * (k1 + 1) / (frequency + norm)
+            return
+        for term, frequency in zip(terms, frequencies):
+            self._insert(term, doc_id, frequency * (k1 + 1) / (frequency + norm))
+
+    def remove(self, doc_id: str, terms: Tuple[str, ...]) -> None:
+        """Drop a document's postings (those present)."""
+        for term in terms:
+            postings = self.postings.get(term)
+            if postings is None or doc_id not in postings:
+                continue
+            ranked = self.ranked.get(term)
+            if ranked is not None:
+                key = _descending(postings)
+                del ranked[bisect_left(ranked, key(doc_id), key=key)]
+            del postings[doc_id]
+            if not postings:
+                del self.postings[term]
+                self.ranked.pop(term, None)
+
+    def ranked_list(self, term: str) -> List[str]:
+        """A term's doc ids, highest impact first."""
+        ranked = self.ranked.get(term)
+        if ranked is None:
+            ranked = _sorted_by_impact(self.postings[term])
+        return ranked
+
+    def _insert(self, term: str, doc_id: str, impact: float) -> None:
+        """Add one posting, keeping the term's sorted list (if any) in order."""
+        postings = self.postings.get(term)
+        if postings is None:
+            postings = self.postings[term] = {}
+        ranked = self.ranked.get(term)
+        if ranked is not None and doc_id in postings:
+            key = _descending(postings)
+            del ranked[bisect_left(ranked, key(doc_id), key=key)]
+        postings[doc_id] = impact
+        if ranked is not None:
+            insort(ranked, doc_id, key=_descending(postings))
+        elif not self.building and len(postings) >= self.ranked_min_df:
+            self.ranked[term] = _sorted_by_impact(postings)
+
+
+class SearchIndex:
+    """Incrementally maintained BM25 index over weighted document fields."""
+
+    def __init__(self, field_weights: Dict[str, float], k1: float = 1.2, b: float = 0.75,
+                 ranked_min_df: int = 64):
+        """
+        Initialize the index.
+
+        Args:
+            field_weights: Weight per indexed field name
+            k1: BM25 term-frequency saturation
+            b: BM25 document-length normalization
+            ranked_min_df: Document frequency from which a term's sorted
+                posting list is kept and maintained
+        """
+        self.field_weights = field_weights
+        self.k1 = k1
+        self.b = b
+        self.ranked_min_df = ranked_min_df
+        # doc id -> (terms, weighted frequency of each term, weighted length)
+        self._docs: Dict[str, Tuple[Tuple[str, ...], array, float]] = {}
+        self._meta: Dict[str, Dict[str, Any]] = {}
+        self._total_length = 0.0
+        # Impacts queries use (None until a bulk load is reweighted) and the set a reweight is building
+        self._live: Optional[_Impacts] = self._impacts(0.0)
+        self._next: Optional[_Impacts] = None
+        self._loading = False
+        self.reweights = 0
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._docs
+
+    @property
+    def loading(self) -> bool:
+        """Whether the index has no usable impacts yet (searches are refused)."""
+        return self._live is None
+
+    @property
+    def needs_reweight(self) -> bool:
+        """Whether a reweight should be run: impacts are missing or their average length drifted."""
+        if self._loading or self._next is not None or not self._docs:
+            return False
+        if self._live is None or not self._live.avgdl:
+            return True
+        live = self._total_length / len(self._docs)
+        return abs(live - self._live.avgdl) > REWEIGHT_DRIFT * self._live.avgdl
+
+    def add(self, doc_id: str, fields: Dict[str, FieldValue], meta: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Index a document, replacing any earlier version.
+
+        Args:
+            doc_id: Document ID
+            fields: Field values by name; fields without a weight are ignored
+            meta: Values that searches can filter on
+        """
+        if doc_id in self._docs:
+            self.remove(doc_id)
+        frequencies, length = self._analyze(fields)
+        entry = (tuple(frequencies), array("d", frequencies.values()), length)
+        self._docs[doc_id] = entry
+        self._meta[doc_id] = meta or {}
+        self._total_length += length
+        for impacts in (self._live, self._next):
+            if impacts is not None:
+                impacts.add(doc_id, *entry)
+
+    def remove(self, doc_id: str) -> bool:
+        """Drop a document; returns whether it was indexed."""
+        entry = self._docs.pop(doc_id, None)
+        if entry is None:
+            return False
+        self._meta.pop(doc_id, None)
+        self._total_length = self._total_length - entry[2] if self._docs else 0.0
+        for impacts in (self._live, self._next):
+            if impacts is not None:
+                impacts.remove(doc_id, entry[0])
+        return True
+
+    def clear(self) -> None:
+        """Drop every document (and abandon a running reweight)."""
+        self._docs.clear()
+        self._meta.clear()
+        self._total_length = 0.0
+        self._live = None if self._loading else self._impacts(0.0)
+        self._next = None
+
+    @contextmanager
+    def bulk_load(self) -> Iterator["SearchIndex"]:
+        """
+        Add many documents without computing impacts.
+
+        Searches are refused from the start of the load until the reweight
+        that must follow it (``reweight_steps`` or ``reweight``) completes.
+        """
+        self._loading = True
+        self._live = None
+        self._next = None
+        try:
+            yield self
+        finally:
+            self._loading = False
+
+    def reweight_steps(self) -> Iterator[None]:
+        """
+        Recompute every impact against the current average length, a chunk per step.
+
+        Yields between chunks; the new impacts replace the live ones after
+        the last step. Writes made between steps are applied to both. The
+        reweight is abandoned if the index is cleared or bulk loaded meanwhile.
+        """
+        if self._next is not None:
+            raise RuntimeError("Search index is already reweighting")
+        avgdl = self._total_length / len(self._docs) if self._docs else 0.0
+        impacts = self._next = self._impacts(avgdl, building=True)
+        try:
+            for done, doc_id in enumerate(list(self._docs), 1):
+                entry = self._docs.get(doc_id)
+                if entry is not None:
+                    impacts.add(doc_id, *entry)
+                if done % REWEIGHT_STEP_DOCUMENTS == 0:
+                    yield
+                    if self._next is not impacts:
+                        return
+
+            sorted_postings = 0
+            for term in list(impacts.postings):
+                postings = impacts.postings.get(term)
+                if postings is None or len(postings) < self.ranked_min_df:
+                    continue
+                impacts.ranked[term] = _sorted_by_impact(postings)
+                sorted_postings += len(postings)
+                if sorted_postings >= REWEIGHT_STEP_POSTINGS:
+                    sorted_postings = 0
+                    yield
+                    if self._next is not impacts:
+                        return
+
+            impacts.building = False
+            self._live = impacts
+            self.reweights += 1
+        finally:
+            if self._next is impacts:
+                self._next = None
+
+    def reweight(self) -> None:
+        """Run a whole reweight at once."""
+        for _ in self.reweight_steps():
+            pass
+
+    def search(self, query: str, limit: int = 10,
+               where: Optional[Dict[str, Any]] = None) -> List[Tuple[str, float]]:
+        """
+        Find the best matching documents.
+
+        Args:
+            query: Free text; documents matching any of its terms are ranked
+            limit: Number of results
+            where: Metadata values a document must have to be returned
+
+        Returns:
+            (doc id, score) pairs, best first
+        """
+        impacts = self._live
+        if impacts is None:
+            raise RuntimeError("Search index is loading")
+        terms = [term for term in query_terms(query) if term in impacts.postings]
+        if not terms or limit <= 0:
+            return []
+
+        count = len(self._docs)
+        lists = []
+        for term in terms:
+            postings = impacts.postings[term]
+            frequency = len(postings)
+            idf = math.log(1 + (count - frequency + 0.5) / (frequency + 0.5))
+            lists.append((idf, postings, impacts.ranked_list(term)))
+
+        accept = None
+        if where:
+            meta = self._meta
+            accept = lambda doc_id: all(meta[doc_id].get(key) == value for key, value in where.items())
+        return self._top_k(lists, limit, accept)
+
+    def stats(self) -> Dict[str, Any]:
+        """Index size and tuning state for health output."""
+        impacts = self._live or self._impacts(0.0)
+        return {
+            "documents": len(self._docs),
+            "terms": len(impacts.postings),
+            "postings": sum(len(postings) for postings in impacts.postings.values()),
+            "ranked_terms": len(impacts.ranked),
+            "avg_length": round(impacts.avgdl, 2),
+            "reweights": self.reweights,
+            "reweighting": self._next is not None,
+            "loading": self.loading,
+        }
+
+    def _impacts(self, avgdl: float, building: bool = False) -> _Impacts:
+        return _Impacts(avgdl, self.k1, self.b, self.ranked_min_df, building)
+
+    def _analyze(self, fields: Dict[str, FieldValue]) -> Tuple[Dict[str, float], float]:
+        """Weighted term frequencies and length of a document."""
+        frequencies: Dict[str, float] = {}
+        length = 0.0
+        for name, weight in self.field_weights.items():
+            counts = Counter(tokenize(field_text(fields.get(name))))
+            for term, count in counts.items():
+                frequencies[term] = frequencies.get(term, 0.0) + weight * count
+            length += weight * sum(counts.values())
+        return frequencies, length
+
+    def _top_k(self, lists: List[Tuple[float, Dict[str, float], List[str]]],
+               limit: int, accept) -> List[Tuple[str, float]]:
+        """
+        Threshold algorithm over the query terms' sorted lists.
+
+        Lists are read best-first, in blocks that double in size: the next
+        block comes from the list whose current impact adds most to the
+        threshold, and stops where that list can no longer lift a document
+        past the k-th best score. Each block's new documents are scored
+        with map() so the per-document work stays in C.
+        """
+        positions = [0] * len(lists)
+        blocks = [max(limit, TOP_K_FIRST_BLOCK)] * len(lists)
+        keys = [_descending(postings) for _, postings, _ in lists]
+        # idf * impact at each list's read position; no unseen document can beat their sum
+        heads = [idf * postings[ranked[0]] for idf, postings, ranked in lists]
+        best: List[Tuple[float, str]] = []
+        seen: Set[str] = set()
+        while True:
+            threshold = sum(heads)
+            kth = best[-1][0] if len(best) >= limit else None
+            if kth is not None and kth >= threshold:
+                break
+            i = max(range(len(lists)), key=heads.__getitem__)
+            if not heads[i]:
+                break
+            idf, postings, ranked = lists[i]
+            start = positions[i]
+            end = min(len(ranked), start + blocks[i])
+            if kth is not None:
+                cut = (kth - (threshold - heads[i])) / idf
+                end = max(start + 1, bisect_left(ranked, (-cut, ""), start, end, key=keys[i]))
+
+            batch = set(ranked[start:end])
+            batch -= seen
+            seen |= batch
+            candidates = [doc_id for doc_id in batch if accept(doc_id)] if accept else list(batch)
+            if candidates:
+                scores = None
+                for term_idf, term_postings, _ in lists:
+                    column = map(mul, map(term_postings.get, candidates, repeat(0.0)), repeat(term_idf))
+                    scores = list(column) if scores is None else list(map(add, scores, column))
+                best = nlargest(limit, chain(best, zip(scores, candidates)))
+
+            positions[i] = end
+            blocks[i] *= 2
+            heads[i] = idf * postings[ranked[end]] if end < len(ranked) else 0.0
+        return [(doc_id, score) for score, doc_id in sorted(best, key=lambda item: (-item[0], item[1]))]
+
+
+def _descending(postings: Dict[str, float]):
+    """Sort key ordering a term's doc ids by descending impact, then id."""
+    return lambda doc_id: (-postings[doc_id], doc_id)
+
+
+def _sorted_by_impact(postings: Dict[str, float]) -> List[str]:
+    """A term's doc ids, highest impact first."""
+    return sorted(postings, key=_descending(postings))
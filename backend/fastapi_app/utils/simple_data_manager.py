@@ -1,12 +1,30 @@
 """
 Simplified data manager with Supabase + In-Memory storage.
 No more complex fallback chains - just clean, predictable storage.
+
+This is the single storage facade for every table (PRDs, agents, Devin
+tasks, audit logs, system metrics); in production all of them share the
+one pooled Supabase client from ``db_pool``.
 """
 import os
-from typing import Dict, Any, List, Optional
+import asyncio
+import uuid
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from datetime import datetime
-from supabase import create_client, Client
+from supabase import Client
+from postgrest.types import CountMethod, ReturnMethod
 from ..config import config
+from .db_pool import db_executor, db_client, db_service_client, shared_client, service_client, pool_stats
+from .connection_monitor import ConnectionMonitor, is_connection_error
+from .memory_store import MemoryStore
+from .sqlite_store import SQLiteStore
+from .single_flight import SingleFlight
+from .resilience import db_retry_policy
+from .query_spec import QuerySpec, QueryResult, chunked, order_by_ids, unique_ids
+from .cache import CachedDataManager, LRUCache, create_entity_cache
+
+# Filter combinations whose list total is kept for cursor pages
+KEYSET_TOTALS_MAX_ENTRIES = 256
 
 
 class SimpleDataManager:
@@ -17,28 +35,34 @@ class SimpleDataManager:
         Initialize the data manager.
         
         Args:
-            mode: "development" (in-memory only) or "production" (Supabase only)
+            mode: "development" (in-memory only), "sqlite" (local WAL-mode
+                file at SQLITE_PATH) or "production" (Supabase only)
         """
         self.mode = mode
         self.supabase: Optional[Client] = None
-        self.memory_storage = {
-            "agents": {},
-            "prds": {}
-        }
+        self.connection_monitor: Optional[ConnectionMonitor] = None
+        self.memory_store = MemoryStore()
+        self.sqlite_store: Optional[SQLiteStore] = None
+        self.single_flight = SingleFlight("data_manager")
+        # Supabase list totals by (table, filters), reused by the cursor pages that follow
+        # until the next write
+        self._keyset_totals = LRUCache(KEYSET_TOTALS_MAX_ENTRIES)
         
         if mode == "production":
             self._init_supabase()
+        elif mode == "sqlite":
+            self.sqlite_store = SQLiteStore(config.sqlite_path)
+            print(f"✅ Using SQLite storage at {config.sqlite_path}")
     
     def _init_supabase(self):
         """Initialize Supabase client."""
         try:
-            supabase_url = config.supabase_url
-            supabase_key = config.supabase_key
-            
-            if not supabase_url or not supabase_key:
-                raise ValueError("Supabase URL and key are required for production mode")
-            
-            self.supabase = create_client(supabase_url, supabase_key)
+            self.supabase = shared_client()
+            self.connection_monitor = ConnectionMonitor(
+                "Supabase",
+                self._probe_connection,
+                ttl=config.db_health_ttl,
+                refresh_interval=config.db_health_interval)
             print(f"✅ Connected to Supabase (mode: {self.mode})")
         except Exception as e:
             print(f"❌ Failed to connect to Supabase: {e}")
@@ -54,137 +78,475 @@ class SimpleDataManager:
                 db_data[key] = value
         return db_data
     
+    async def _execute(self, query, idempotent: bool = True, write: bool = False):
+        """
+        Execute a Supabase query on the database executor under the shared retry policy.
+
+        Pass idempotent=False for inserts: they are retried only when the
+        request was never sent, so a write that landed is not repeated.
+        Pass write=True for anything that changes rows, so cached list
+        totals are dropped once it finishes (or fails, as it may have landed).
+        """
+        try:
+            result = await db_retry_policy.call(db_executor.execute, query, idempotent=idempotent)
+        except Exception as e:
+            if is_connection_error(e):
+                self.connection_monitor.mark_down(e)
+            raise
+        finally:
+            if write:
+                # Every table: audit triggers and foreign key cascades change other tables' counts
+                self._keyset_totals.delete_where(lambda key: True)
+        self.connection_monitor.mark_up()
+        return result
+    
+    async def _probe_connection(self) -> None:
+        """Run a minimal query to check that Supabase is reachable."""
+        await db_executor.execute(self.supabase.table('agents').select('id').limit(1))
+    
+    async def _fetch_by_id(self, table: str, row_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch one row by id from Supabase."""
+        result = await self._execute(self.supabase.table(table).select('*').eq('id', row_id))
+        return result.data[0] if result.data else None
+    
+    async def _fetch_by_ids(self, table: str, ids: List[str], select: str = '*') -> List[Dict[str, Any]]:
+        """Fetch rows by id from Supabase with one in() query per chunk, run concurrently."""
+        results = await asyncio.gather(*(
+            self._execute(self.supabase.table(table).select(select).in_('id', chunk))
+            for chunk in chunked(ids, config.db_in_chunk_size)
+        ))
+        return [row for result in results for row in (result.data or [])]
+    
+    async def _get_by_ids(
+        self,
+        table: str,
+        ids: List[str],
+        columns: Optional[Tuple[str, ...]] = None
+    ) -> List[Dict[str, Any]]:
+        """Get rows by id in request order, optionally only some columns; missing ids are skipped."""
+        ids = unique_ids(ids)
+        if not ids:
+            return []
+        spec = QuerySpec(columns=columns)
+        if self.mode == "development":
+            rows = [spec.project(row) for row in self.memory_store[table].get_many(ids)]
+        elif self.mode == "sqlite":
+            rows = [spec.project(row) for row in await self.sqlite_store.get_many(table, ids)]
+        else:
+            rows = await self._fetch_by_ids(table, ids, spec.select_clause)
+        return order_by_ids(rows, ids)
+    
+    async def _query_supabase(self, table: str, spec: QuerySpec) -> QueryResult:
+        """Run a query spec against a Supabase table with an exact match count."""
+        if spec.after is not None:
+            return await self._keyset_query_supabase(table, spec)
+        query = spec.apply_postgrest(self.supabase.table(table).select(spec.select_clause, count=config.db_count_mode))
+        result = await self._execute(query)
+        rows = result.data or []
+        total = result.count if result.count is not None else spec.offset + len(rows)
+        if result.count is not None:
+            self._keyset_totals.set(self._total_key(table, spec), total, config.db_keyset_total_ttl)
+        return QueryResult(rows=rows, total=total, offset=spec.offset)
+    
+    def _total_key(self, table: str, spec: QuerySpec) -> tuple:
+        """Key a list total by table and active filters (not by page)."""
+        return (table, tuple(sorted(spec.active_filters().items())))
+    
+    async def _keyset_query_supabase(self, table: str, spec: QuerySpec) -> QueryResult:
+        """
+        Fetch the page after a cursor.
+
+        The total is the one counted for the same filters by an earlier
+        page within DB_KEYSET_TOTAL_TTL and since this process's last write;
+        only when none is cached does a head count query run alongside the page.
+        """
+        rows_query = spec.apply_postgrest(self.supabase.table(table).select(spec.select_clause))
+        key = self._total_key(table, spec)
+        total = self._keyset_totals.get(key)
+        if total is None:
+            count_query = self.supabase.table(table).select('id', count=config.db_count_mode, head=True)
+            for column, value in spec.active_filters().items():
+                count_query = count_query.eq(column, value)
+            rows_result, count_result = await asyncio.gather(
+                self._execute(rows_query), self._execute(count_query))
+            total = count_result.count or 0
+            self._keyset_totals.set(key, total, config.db_keyset_total_ttl)
+        else:
+            rows_result = await self._execute(rows_query)
+        rows = rows_result.data or []
+        return QueryResult(
+            rows=rows[:spec.limit],
+            total=total,
+            more=len(rows) > spec.limit)
+    
+    async def _create_row(self, table: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Insert one row; local stores get a generated id if the row has none."""
+        if self.mode == "production":
+            result = await self._execute(
+                self.supabase.table(table).insert(self._prepare_data_for_db(data)), idempotent=False, write=True)
+            return result.data[0] if result.data else None
+        row = {"id": str(uuid.uuid4()), **data}
+        if self.mode == "sqlite":
+            return await self.sqlite_store.insert(table, row)
+        return self.memory_store[table].insert(row["id"], row)
+    
+    async def _get_row(self, table: str, row_id: str) -> Optional[Dict[str, Any]]:
+        """Get one row by id (concurrent Supabase lookups of one id share a query)."""
+        if self.mode == "development":
+            return self.memory_store[table].get(row_id)
+        elif self.mode == "sqlite":
+            return await self.sqlite_store.get(table, row_id)
+        else:
+            return await self.single_flight.do((table, row_id), lambda: self._fetch_by_id(table, row_id))
+    
+    async def _update_row(self, table: str, row_id: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Update columns of one row."""
+        if self.mode == "development":
+            return self.memory_store[table].update(row_id, data)
+        elif self.mode == "sqlite":
+            return await self.sqlite_store.update(table, row_id, data)
+        else:
+            result = await self._execute(self.supabase.table(table).update(data).eq('id', row_id), write=True)
+            return result.data[0] if result.data else None
+    
+    async def _query_table(self, table: str, spec: QuerySpec) -> QueryResult:
+        """Run a query spec against whichever store the mode uses."""
+        if self.mode == "development":
+            return self.memory_store[table].query(spec)
+        elif self.mode == "sqlite":
+            return await self.sqlite_store.query(table, spec)
+        else:
+            return await self._query_supabase(table, spec)
+    
+    async def count_by(self, table: str, column: str, values: List[str]) -> Dict[str, int]:
+        """
+        Count rows per value of a column.
+
+        The given values are always present (zero if unused); local stores
+        also report any other non-null values they find. PostgREST has no
+        GROUP BY, so Supabase runs one head count query per value, concurrently.
+        """
+        counts: Dict[str, int] = dict.fromkeys(values, 0)
+        if self.mode == "development":
+            found = self.memory_store[table].count_by(column)
+        elif self.mode == "sqlite":
+            found = await self.sqlite_store.count_by(table, column)
+        else:
+            results = await asyncio.gather(*(
+                self._execute(self.supabase.table(table)
+                              .select('id', count=config.db_count_mode, head=True)
+                              .eq(column, value))
+                for value in values
+            ))
+            found = {value: result.count or 0 for value, result in zip(values, results)}
+        counts.update((value, count) for value, count in found.items() if value is not None)
+        return counts
+    
+    async def bulk_write(
+        self,
+        table: str,
+        rows: List[Dict[str, Any]],
+        upsert: bool = False
+    ) -> List[Optional[str]]:
+        """
+        Insert (or upsert by id) many rows with one request per chunk.
+
+        Returns one entry per row: None if it was written, else the error.
+        A chunk that fails for a reason other than connectivity is retried
+        row by row so a single bad record does not fail its neighbours.
+        """
+        if self.mode == "development":
+            store = self.memory_store[table]
+            errors: List[Optional[str]] = []
+            for row in rows:
+                if not upsert and row["id"] in store:
+                    errors.append(f"{table[:-1]} {row['id']} already exists")
+                else:
+                    store.insert(row["id"], row)
+                    errors.append(None)
+            return errors
+        elif self.mode == "sqlite":
+            return await self.sqlite_store.bulk_write(table, rows, upsert=upsert)
+        
+        errors = []
+        chunk_size = config.db_bulk_chunk_size
+        for start in range(0, len(rows), chunk_size):
+            chunk = [self._prepare_data_for_db(row) for row in rows[start:start + chunk_size]]
+            try:
+                await self._execute(self._bulk_query(table, chunk, upsert), idempotent=upsert, write=True)
+                errors.extend([None] * len(chunk))
+            except Exception as e:
+                if is_connection_error(e):
+                    raise
+                print(f"⚠️ Bulk {table} chunk failed, retrying row by row: {e}")
+                for row in chunk:
+                    try:
+                        await self._execute(self._bulk_query(table, [row], upsert), idempotent=upsert, write=True)
+                        errors.append(None)
+                    except Exception as row_error:
+                        errors.append(str(row_error))
+        return errors
+    
+    async def delete_batch(self, table: str, limit: int, skip_audit: bool = False) -> int:
+        """
+        Delete up to limit rows of a table; returns how many were deleted.
+
+        On Supabase this selects a page of ids and deletes them with one
+        in() request per DB_IN_CHUNK_SIZE ids, run concurrently, counting
+        the rows the deletes actually removed (row level security can let
+        the select through and filter the delete).
+        With skip_audit the purge_batch() database function, executable
+        only by the service role, deletes the batch instead, with the audit
+        trigger switched off for that transaction.
+        """
+        if self.mode == "development":
+            return self.memory_store[table].delete_batch(limit)
+        elif self.mode == "sqlite":
+            return await self.sqlite_store.delete_batch(table, limit)
+        
+        if skip_audit:
+            result = await self._execute(service_client().rpc(
+                'purge_batch', {'p_table': table, 'p_limit': limit, 'p_skip_audit': True}), idempotent=False, write=True)
+            return int(result.data or 0)
+        result = await self._execute(self.supabase.table(table).select('id').limit(limit))
+        ids = [row['id'] for row in result.data or []]
+        # One in() delete per chunk keeps each request URL short
+        results = await asyncio.gather(*(
+            self._execute(self.supabase.table(table).delete(
+                count=CountMethod.exact, returning=ReturnMethod.minimal).in_('id', chunk), write=True)
+            for chunk in chunked(ids, config.db_in_chunk_size)
+        ))
+        return sum(result.count or 0 for result in results)
+    
+    @property
+    def can_skip_audit(self) -> bool:
+        """Whether purges may skip auditing (Supabase needs the service role key for it)."""
+        return self.mode != "production" or bool(config.supabase_service_role_key)
+    
+    async def purge_table(
+        self,
+        table: str,
+        batch_size: Optional[int] = None,
+        skip_audit: bool = False,
+        on_batch: Optional[Callable[[int], None]] = None
+    ) -> int:
+        """Delete every row of a table in bounded batches; returns the number deleted."""
+        batch_size = batch_size or config.db_purge_batch_size
+        deleted = 0
+        while True:
+            count = await self.delete_batch(table, batch_size, skip_audit=skip_audit)
+            deleted += count
+            if on_batch is not None and count:
+                on_batch(count)
+            # A batch deleting nothing means the rest cannot be deleted; stop rather than spin
+            if count == 0 or count < batch_size:
+                return deleted
+    
+    def _bulk_query(self, table: str, rows: List[Dict[str, Any]], upsert: bool):
+        """Build a batched insert/upsert that does not echo the rows back."""
+        if upsert:
+            return self.supabase.table(table).upsert(
+                rows, on_conflict='id', returning=ReturnMethod.minimal)
+        return self.supabase.table(table).insert(rows, returning=ReturnMethod.minimal)
+    
     # Agent Operations
     async def create_agent(self, agent_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create an agent."""
         if self.mode == "development":
-            agent_id = agent_data.get("id", f"agent_{len(self.memory_storage['agents']) + 1}")
-            self.memory_storage["agents"][agent_id] = agent_data
-            return agent_data
+            agent_id = agent_data.get("id", f"agent_{len(self.memory_store['agents']) + 1}")
+            return self.memory_store["agents"].insert(agent_id, agent_data)
+        elif self.mode == "sqlite":
+            return await self.sqlite_store.insert("agents", agent_data)
         else:
             # Ensure datetime objects are converted to ISO strings for database storage
             db_data = self._prepare_data_for_db(agent_data)
-            result = self.supabase.table('agents').insert(db_data).execute()
+            result = await self._execute(self.supabase.table('agents').insert(db_data), idempotent=False, write=True)
             return result.data[0] if result.data else None
     
     async def get_agents(self, skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
         """Get agents."""
-        if self.mode == "development":
-            agents = list(self.memory_storage["agents"].values())
-            return agents[skip:skip + limit]
-        else:
-            result = self.supabase.table('agents').select('*').range(skip, skip + limit - 1).execute()
-            return result.data or []
+        result = await self.query_agents(QuerySpec(offset=skip, limit=limit))
+        return result.rows
+    
+    async def query_agents(self, spec: QuerySpec) -> QueryResult:
+        """Get a filtered, ordered page of agents with the total match count."""
+        return await self._query_table('agents', spec)
     
     async def get_agent(self, agent_id: str) -> Optional[Dict[str, Any]]:
-        """Get a specific agent."""
-        if self.mode == "development":
-            return self.memory_storage["agents"].get(agent_id)
-        else:
-            result = self.supabase.table('agents').select('*').eq('id', agent_id).execute()
-            return result.data[0] if result.data else None
+        """Get a specific agent (concurrent lookups of one id share a query)."""
+        return await self._get_row('agents', agent_id)
+    
+    async def get_agents_by_ids(self, agent_ids: List[str]) -> List[Dict[str, Any]]:
+        """Get many agents with one batched lookup."""
+        return await self._get_by_ids('agents', agent_ids)
     
     async def update_agent(self, agent_id: str, agent_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Update an agent."""
-        if self.mode == "development":
-            if agent_id in self.memory_storage["agents"]:
-                self.memory_storage["agents"][agent_id].update(agent_data)
-                return self.memory_storage["agents"][agent_id]
-            return None
-        else:
-            result = self.supabase.table('agents').update(agent_data).eq('id', agent_id).execute()
-            return result.data[0] if result.data else None
+        return await self._update_row('agents', agent_id, agent_data)
     
     async def delete_agent(self, agent_id: str) -> bool:
         """Delete an agent."""
         if self.mode == "development":
-            if agent_id in self.memory_storage["agents"]:
-                del self.memory_storage["agents"][agent_id]
-                return True
-            return False
+            return self.memory_store["agents"].delete(agent_id)
+        elif self.mode == "sqlite":
+            return await self.sqlite_store.delete("agents", agent_id)
         else:
-            result = self.supabase.table('agents').delete().eq('id', agent_id).execute()
+            result = await self._execute(self.supabase.table('agents').delete().eq('id', agent_id), write=True)
             return True
     
     async def clear_all_agents(self) -> bool:
-        """Clear all agents."""
-        if self.mode == "development":
-            self.memory_storage["agents"].clear()
-            return True
-        else:
-            result = self.supabase.table('agents').delete().neq('id', '00000000-0000-0000-0000-000000000000').execute()
-            return True
+        """Clear all agents in bounded batches."""
+        await self.purge_table('agents')
+        return True
     
     # PRD Operations
     async def create_prd(self, prd_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a PRD."""
         if self.mode == "development":
-            prd_id = prd_data.get("id", f"prd_{len(self.memory_storage['prds']) + 1}")
-            self.memory_storage["prds"][prd_id] = prd_data
-            return prd_data
+            prd_id = prd_data.get("id", f"prd_{len(self.memory_store['prds']) + 1}")
+            return self.memory_store["prds"].insert(prd_id, prd_data)
+        elif self.mode == "sqlite":
+            return await self.sqlite_store.insert("prds", prd_data)
         else:
-            result = self.supabase.table('prds').insert(prd_data).execute()
+            result = await self._execute(self.supabase.table('prds').insert(prd_data), idempotent=False, write=True)
             return result.data[0] if result.data else None
     
     async def get_prds(self, skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
         """Get PRDs."""
-        if self.mode == "development":
-            prds = list(self.memory_storage["prds"].values())
-            return prds[skip:skip + limit]
-        else:
-            result = self.supabase.table('prds').select('*').range(skip, skip + limit - 1).execute()
-            return result.data or []
+        result = await self.query_prds(QuerySpec(offset=skip, limit=limit))
+        return result.rows
+    
+    async def query_prds(self, spec: QuerySpec) -> QueryResult:
+        """Get a filtered, ordered page of PRDs with the total match count."""
+        return await self._query_table('prds', spec)
     
     async def get_prd(self, prd_id: str) -> Optional[Dict[str, Any]]:
-        """Get a specific PRD."""
-        if self.mode == "development":
-            return self.memory_storage["prds"].get(prd_id)
-        else:
-            result = self.supabase.table('prds').select('*').eq('id', prd_id).execute()
-            return result.data[0] if result.data else None
+        """Get a specific PRD (concurrent lookups of one id share a query)."""
+        return await self._get_row('prds', prd_id)
+    
+    async def get_prds_by_ids(
+        self,
+        prd_ids: List[str],
+        columns: Optional[Tuple[str, ...]] = None
+    ) -> List[Dict[str, Any]]:
+        """Get many PRDs with one batched lookup (only the given columns, if any)."""
+        return await self._get_by_ids('prds', prd_ids, columns)
     
     async def update_prd(self, prd_id: str, prd_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Update a PRD."""
-        if self.mode == "development":
-            if prd_id in self.memory_storage["prds"]:
-                self.memory_storage["prds"][prd_id].update(prd_data)
-                return self.memory_storage["prds"][prd_id]
-            return None
-        else:
-            result = self.supabase.table('prds').update(prd_data).eq('id', prd_id).execute()
-            return result.data[0] if result.data else None
+        return await self._update_row('prds', prd_id, prd_data)
     
     async def delete_prd(self, prd_id: str) -> bool:
         """Delete a PRD."""
         if self.mode == "development":
-            if prd_id in self.memory_storage["prds"]:
-                del self.memory_storage["prds"][prd_id]
-                return True
-            return False
+            return self.memory_store["prds"].delete(prd_id)
+        elif self.mode == "sqlite":
+            return await self.sqlite_store.delete("prds", prd_id)
         else:
-            result = self.supabase.table('prds').delete().eq('id', prd_id).execute()
+            result = await self._execute(self.supabase.table('prds').delete().eq('id', prd_id), write=True)
             return True
     
     async def clear_all_prds(self) -> bool:
-        """Clear all PRDs."""
-        if self.mode == "development":
-            self.memory_storage["prds"].clear()
-            return True
-        else:
-            result = self.supabase.table('prds').delete().neq('id', '00000000-0000-0000-0000-000000000000').execute()
-            return True
+        """Clear all PRDs in bounded batches."""
+        await self.purge_table('prds')
+        return True
+    
+    # Devin Task Operations
+    async def create_devin_task(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a Devin task."""
+        return await self._create_row('devin_tasks', task_data)
+    
+    async def get_devin_tasks(self, skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        """Get Devin tasks."""
+        result = await self.query_devin_tasks(QuerySpec(offset=skip, limit=limit))
+        return result.rows
+    
+    async def query_devin_tasks(self, spec: QuerySpec) -> QueryResult:
+        """Get a filtered, ordered page of Devin tasks with the total match count."""
+        return await self._query_table('devin_tasks', spec)
+    
+    async def get_devin_task(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Get a specific Devin task."""
+        return await self._get_row('devin_tasks', task_id)
+    
+    async def get_devin_tasks_by_ids(self, task_ids: List[str]) -> List[Dict[str, Any]]:
+        """Get many Devin tasks with one batched lookup."""
+        return await self._get_by_ids('devin_tasks', task_ids)
+    
+    async def update_devin_task(self, task_id: str, task_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Update a Devin task."""
+        return await self._update_row('devin_tasks', task_id, task_data)
+    
+    # Audit Log and System Metric Operations (append-only, ordered by timestamp)
+    async def create_audit_log(self, log_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Record an audit log entry."""
+        return await self._create_row('audit_logs', log_data)
+    
+    async def query_audit_logs(self, spec: QuerySpec) -> QueryResult:
+        """Get a filtered page of audit log entries (order by "timestamp")."""
+        return await self._query_table('audit_logs', spec)
+    
+    async def create_system_metric(self, metric_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Record a system metric sample."""
+        return await self._create_row('system_metrics', metric_data)
+    
+    async def query_system_metrics(self, spec: QuerySpec) -> QueryResult:
+        """Get a filtered page of system metric samples (order by "timestamp")."""
+        return await self._query_table('system_metrics', spec)
+    
+    @property
+    def uncached(self) -> "SimpleDataManager":
+        """This manager, for bulk scans that must not go through the entity cache."""
+        return self
     
     def is_connected(self) -> bool:
-        """Check if the data manager is connected."""
-        if self.mode == "development":
-            return True  # In-memory is always "connected"
+        """Check if the data manager is connected (cached, no round-trip)."""
+        if self.mode in ("development", "sqlite"):
+            return True  # Local storage is always "connected"
         else:
-            try:
-                # Test Supabase connection
-                self.supabase.table('agents').select('id').limit(1).execute()
-                return True
-            except:
-                return False
+            return self.connection_monitor.is_healthy
+    
+    async def test_connection(self) -> bool:
+        """Probe the storage now and update the cached connection state."""
+        if self.connection_monitor is None:
+            return True
+        connected = await self.connection_monitor.refresh()
+        if not connected:
+            print(f"❌ Supabase connection test failed: {self.connection_monitor.status()['last_error']}")
+        return connected
+    
+    def start_health_monitor(self) -> None:
+        """Start refreshing the connection state in the background."""
+        if self.connection_monitor:
+            self.connection_monitor.start()
+    
+    async def stop_health_monitor(self) -> None:
+        """Stop the background connection refresh."""
+        if self.connection_monitor:
+            await self.connection_monitor.stop()
+    
+    def close(self) -> None:
+        """Release storage resources (the SQLite thread, or the pooled HTTP connections)."""
+        if self.sqlite_store is not None:
+            self.sqlite_store.close()
+            self.sqlite_store = None
+        if self.supabase is not None:
+            db_client.close()
+            db_service_client.close()
+            self.supabase = None
+    
+    def connection_status(self) -> Dict[str, Any]:
+        """Get the cached connection state for health endpoints."""
+        if self.sqlite_store is not None:
+            return {**self.sqlite_store.status(), "mode": self.mode, "single_flight": self.single_flight.stats()}
+        if self.connection_monitor is None:
+            return {"name": "memory", "connected": True, "mode": self.mode}
+        return {
+            **self.connection_monitor.status(),
+            "mode": self.mode,
+            "single_flight": self.single_flight.stats(),
+            "pool": pool_stats()
+        }
 
 
 # Global instance - auto-detect mode based on Supabase availability
@@ -204,5 +566,12 @@ def _get_data_mode():
     else:
         return "development"  # Fallback to in-memory
 
-# Initialize data manager with auto-detected mode
-data_manager = SimpleDataManager(mode=_get_data_mode())
+# Initialize data manager with auto-detected mode, behind the entity cache
+def _create_data_manager():
+    """Create the global data manager, wrapped in the read-through cache if enabled."""
+    manager = SimpleDataManager(mode=_get_data_mode())
+    if config.cache_enabled:
+        return CachedDataManager(manager, create_entity_cache())
+    return manager
+
+data_manager = _create_data_manager()
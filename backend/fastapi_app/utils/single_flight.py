@@ -0,0 +1,63 @@
+"""
+Single-flight coalescing of concurrent identical reads.
+
+When a PRD is marked ready-for-devin the frontend, the MCP loader and
+the Devin service all fetch it at once. ``SingleFlight`` lets the first
+caller for a key run the fetch and makes every concurrent caller for the
+same key await that one in-flight task instead of issuing its own query.
+Nothing is cached: once the fetch completes the next call runs again.
+"""
+import asyncio
+import copy
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """Shares one in-flight call per key between concurrent callers."""
+
+    def __init__(self, name: str):
+        """
+        Initialize the group.
+
+        Args:
+            name: Name used in status output
+        """
+        self.name = name
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run func for key, or join the call already in flight for it.
+
+        Every caller gets its own deep copy of the result, since callers
+        routinely mutate the rows they get back. The shared task is
+        shielded, so one caller being cancelled does not cancel the fetch
+        for the others.
+        """
+        self.calls += 1
+        task = self._inflight.get(key)
+        if task is None:
+            self.executions += 1
+            task = asyncio.ensure_future(func())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done, key=key: self._forget(key, done))
+        else:
+            self.coalesced += 1
+        return copy.deepcopy(await asyncio.shield(task))
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    def stats(self) -> Dict[str, Any]:
+        """Get counters showing how many duplicate calls were saved."""
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._inflight)
+        }
@@ -0,0 +1,320 @@
+"""
+Embedded SQLite storage used by the ``sqlite`` data mode.
+
+A durable single-node alternative to Supabase: no network hop, reads in
+microseconds. Each table keeps the full row as JSON in ``data`` and
+promotes the columns that ``infra/database/schema.sql`` indexes (status,
+type, foreign keys, timestamps) to real columns carrying the same
+indexes, so filters and ordering are answered from indexes. Tables are
+WITHOUT ROWID, which makes every secondary index end in ``id`` - exactly
+the (created_at, id) order the API pages by. A database created before a
+column was promoted gets it added and backfilled from ``data`` on open.
+
+The database runs in WAL mode and every statement runs on one dedicated
+thread that owns the connection; callers await it like any other I/O.
+Statements are fixed strings per table, so sqlite3's statement cache
+prepares each one once.
+"""
+import asyncio
+import json
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .query_spec import QuerySpec, QueryResult, chunked
+
+# Indexed (promoted) columns per table, with the B-tree indexes from schema.sql
+SQLITE_TABLES: Dict[str, Dict[str, str]] = {
+    "prds": {
+        "status": "idx_prds_status",
+        "prd_type": "idx_prds_type",
+        "priority": "idx_prds_priority",
+        "content_hash": "idx_prds_content_hash",
+        "created_at": "idx_prds_created_at",
+        "updated_at": "idx_prds_updated_at",
+    },
+    "agents": {
+        "status": "idx_agents_status",
+        "health_status": "idx_agents_health_status",
+        "prd_id": "idx_agents_prd_id",
+        "created_at": "idx_agents_created_at",
+        "updated_at": "idx_agents_updated_at",
+    },
+    "devin_tasks": {
+        "status": "idx_devin_tasks_status",
+        "prd_id": "idx_devin_tasks_prd_id",
+        "created_at": "idx_devin_tasks_created_at",
+        "updated_at": "idx_devin_tasks_updated_at",
+    },
+    "audit_logs": {
+        "table_name": "idx_audit_logs_table_name",
+        "record_id": "idx_audit_logs_record_id",
+        "action": "idx_audit_logs_action",
+        "timestamp": "idx_audit_logs_timestamp",
+    },
+    "system_metrics": {
+        "metric_name": "idx_system_metrics_name",
+        "timestamp": "idx_system_metrics_timestamp",
+    },
+}
+
+
+def _to_db_value(value: Any) -> Any:
+    """Store timestamps as ISO strings, like the Supabase client returns them."""
+    return value.isoformat() if hasattr(value, "isoformat") else value
+
+
+def _json_default(value: Any) -> Any:
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class SQLiteTable:
+    """Prepared SQL for one table."""
+
+    def __init__(self, name: str, columns: Dict[str, str]):
+        self.name = name
+        self.columns = list(columns)
+        placeholders = ", ".join("?" for _ in range(len(self.columns) + 2))
+        column_list = ", ".join(["id", *self.columns, "data"])
+        assignments = ", ".join(f"{column} = excluded.{column}" for column in [*self.columns, "data"])
+        self.create_sql = (
+            f"CREATE TABLE IF NOT EXISTS {name} ("
+            f"id TEXT PRIMARY KEY, "
+            + "".join(f"{column}, " for column in self.columns)
+            + "data TEXT NOT NULL) WITHOUT ROWID"
+        )
+        self.index_sql = [
+            f"CREATE INDEX IF NOT EXISTS {index} ON {name}({column})"
+            for column, index in columns.items()
+        ]
+        self.insert_sql = f"INSERT INTO {name} ({column_list}) VALUES ({placeholders})"
+        self.upsert_sql = self.insert_sql + f" ON CONFLICT(id) DO UPDATE SET {assignments}"
+        self.replace_sql = f"UPDATE {name} SET " + ", ".join(
+            f"{column} = ?" for column in [*self.columns, "data"]) + " WHERE id = ?"
+        self.get_sql = f"SELECT data FROM {name} WHERE id = ?"
+        self.delete_sql = f"DELETE FROM {name} WHERE id = ?"
+        self.clear_sql = f"DELETE FROM {name}"
+        self.delete_batch_sql = f"DELETE FROM {name} WHERE id IN (SELECT id FROM {name} LIMIT ?)"
+
+    def migrate_sql(self, existing: List[str]) -> List[str]:
+        """Statements promoting columns missing from a table created by an older version."""
+        statements = []
+        for column in self.columns:
+            if column not in existing:
+                statements.append(f"ALTER TABLE {self.name} ADD COLUMN {column}")
+                statements.append(f"UPDATE {self.name} SET {column} = json_extract(data, '$.{column}')")
+        return statements
+
+    def params(self, row: Dict[str, Any]) -> Tuple:
+        """Get insert parameters for a row: id, promoted columns, JSON data."""
+        return (
+            row["id"],
+            *(_to_db_value(row.get(column)) for column in self.columns),
+            json.dumps(row, default=_json_default),
+        )
+
+    def column_expr(self, column: str) -> str:
+        """SQL expression for a column: promoted column or a JSON lookup."""
+        if column == "id" or column in self.columns:
+            return column
+        return f"json_extract(data, '$.{column}')"
+
+    def query_sql(self, spec: QuerySpec) -> Tuple[str, List[Any], str, List[Any]]:
+        """Build the page and count statements for a query spec."""
+        where: List[str] = []
+        params: List[Any] = []
+        for column, value in spec.active_filters().items():
+            where.append(f"{self.column_expr(column)} = ?")
+            params.append(_to_db_value(value))
+        count_where = list(where)
+        count_params = list(params)
+
+        order = self.column_expr(spec.order_by)
+        direction = "DESC" if spec.descending else "ASC"
+        if spec.after is not None:
+            value, row_id = spec.after
+            op = "<" if spec.descending else ">"
+            # Postgres order: NULLs first descending, last ascending
+            if value is None:
+                where.append(f"({order} IS NULL AND id {op} ?)" + (f" OR {order} IS NOT NULL" if spec.descending else ""))
+                params.append(row_id)
+            else:
+                where.append(f"(({order}, id) {op} (?, ?)" + ("" if spec.descending else f" OR {order} IS NULL") + ")")
+                params.extend([_to_db_value(value), row_id])
+
+        where_sql = f" WHERE {' AND '.join(f'({clause})' for clause in where)}" if where else ""
+        nulls = "NULLS FIRST" if spec.descending else "NULLS LAST"
+        sql = f"SELECT data FROM {self.name}{where_sql} ORDER BY {order} {direction} {nulls}, id {direction}"
+        if spec.after is not None:
+            sql += " LIMIT ?"
+            params.append(spec.limit + 1)
+        else:
+            sql += " LIMIT ? OFFSET ?"
+            params.extend([spec.limit, spec.offset])
+
+        count_where_sql = f" WHERE {' AND '.join(count_where)}" if count_where else ""
+        count_sql = f"SELECT COUNT(*) FROM {self.name}{count_where_sql}"
+        return sql, params, count_sql, count_params
+
+
+class SQLiteStore:
+    """Async facade over a WAL-mode SQLite file owned by one worker thread."""
+
+    def __init__(self, path: str):
+        """
+        Initialize the store and create the schema.
+
+        Args:
+            path: Database file path (":memory:" for a throwaway database)
+        """
+        self.path = path
+        self.tables = {name: SQLiteTable(name, columns) for name, columns in SQLITE_TABLES.items()}
+        self._connection: Optional[sqlite3.Connection] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite")
+        self._executor.submit(self._open).result()
+
+    def _open(self) -> None:
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, cached_statements=256)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        with connection:
+            for table in self.tables.values():
+                connection.execute(table.create_sql)
+                existing = [row[1] for row in connection.execute(f"PRAGMA table_info({table.name})")]
+                for sql in table.migrate_sql(existing):
+                    connection.execute(sql)
+                for sql in table.index_sql:
+                    connection.execute(sql)
+        self._connection = connection
+
+    async def _run(self, func: Callable, *args) -> Any:
+        """Run a function on the database thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    def _get(self, table: str, row_id: str) -> Optional[Dict[str, Any]]:
+        row = self._connection.execute(self.tables[table].get_sql, (row_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _get_many(self, table: str, ids: List[str]) -> List[Dict[str, Any]]:
+        rows = []
+        # Stay well under SQLite's bound-variable limit
+        for chunk in chunked(ids, 500):
+            placeholders = ", ".join("?" for _ in chunk)
+            sql = f"SELECT data FROM {table} WHERE id IN ({placeholders})"
+            rows.extend(json.loads(data) for (data,) in self._connection.execute(sql, chunk))
+        return rows
+
+    def _insert(self, table: str, row: Dict[str, Any]) -> Dict[str, Any]:
+        params = self.tables[table].params(row)
+        with self._connection:
+            self._connection.execute(self.tables[table].upsert_sql, params)
+        return json.loads(params[-1])
+
+    def _update(self, table: str, row_id: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        sql_table = self.tables[table]
+        with self._connection:
+            current = self._get(table, row_id)
+            if current is None:
+                return None
+            current.update(data)
+            params = sql_table.params(current)
+            self._connection.execute(sql_table.replace_sql, (*params[1:], row_id))
+        return json.loads(params[-1])
+
+    def _delete(self, table: str, row_id: str) -> bool:
+        with self._connection:
+            cursor = self._connection.execute(self.tables[table].delete_sql, (row_id,))
+        return cursor.rowcount > 0
+
+    def _clear(self, table: str) -> None:
+        with self._connection:
+            self._connection.execute(self.tables[table].clear_sql)
+
+    def _delete_batch(self, table: str, limit: int) -> int:
+        with self._connection:
+            cursor = self._connection.execute(self.tables[table].delete_batch_sql, (limit,))
+        return cursor.rowcount
+
+    def _bulk_write(self, table: str, rows: List[Dict[str, Any]], upsert: bool) -> List[Optional[str]]:
+        sql_table = self.tables[table]
+        sql = sql_table.upsert_sql if upsert else sql_table.insert_sql
+        errors: List[Optional[str]] = []
+        with self._connection:
+            for row in rows:
+                try:
+                    self._connection.execute(sql, sql_table.params(row))
+                    errors.append(None)
+                except sqlite3.IntegrityError:
+                    errors.append(f"{table[:-1]} {row['id']} already exists")
+        return errors
+
+    def _count_by(self, table: str, column: str) -> Dict[Any, int]:
+        expr = self.tables[table].column_expr(column)
+        sql = f"SELECT {expr}, COUNT(*) FROM {table} GROUP BY {expr}"
+        return dict(self._connection.execute(sql).fetchall())
+
+    def _query(self, table: str, spec: QuerySpec) -> QueryResult:
+        sql, params, count_sql, count_params = self.tables[table].query_sql(spec)
+        rows = [json.loads(data) for (data,) in self._connection.execute(sql, params)]
+        total = self._connection.execute(count_sql, count_params).fetchone()[0]
+        page = [spec.project(row) for row in rows[:spec.limit]]
+        if spec.after is not None:
+            return QueryResult(rows=page, total=total, more=len(rows) > spec.limit)
+        return QueryResult(rows=page, total=total, offset=spec.offset)
+
+    async def insert(self, table: str, row: Dict[str, Any]) -> Dict[str, Any]:
+        """Insert or replace a row."""
+        return await self._run(self._insert, table, row)
+
+    async def get(self, table: str, row_id: str) -> Optional[Dict[str, Any]]:
+        """Get a row by id."""
+        return await self._run(self._get, table, row_id)
+
+    async def get_many(self, table: str, ids: List[str]) -> List[Dict[str, Any]]:
+        """Get the rows that exist for the given ids (unordered)."""
+        return await self._run(self._get_many, table, ids)
+
+    async def update(self, table: str, row_id: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Update columns of an existing row."""
+        return await self._run(self._update, table, row_id, data)
+
+    async def delete(self, table: str, row_id: str) -> bool:
+        """Delete a row by id."""
+        return await self._run(self._delete, table, row_id)
+
+    async def clear(self, table: str) -> None:
+        """Delete all rows."""
+        await self._run(self._clear, table)
+
+    async def delete_batch(self, table: str, limit: int) -> int:
+        """Delete up to limit rows in one transaction; returns how many were deleted."""
+        return await self._run(self._delete_batch, table, limit)
+
+    async def bulk_write(self, table: str, rows: List[Dict[str, Any]], upsert: bool = False) -> List[Optional[str]]:
+        """Insert (or upsert) many rows in one transaction; one error or None per row."""
+        return await self._run(self._bulk_write, table, rows, upsert)
+
+    async def count_by(self, table: str, column: str) -> Dict[Any, int]:
+        """Count rows per value of a column (GROUP BY on its index)."""
+        return await self._run(self._count_by, table, column)
+
+    async def query(self, table: str, spec: QuerySpec) -> QueryResult:
+        """Run a filtered, ordered, paginated query."""
+        return await self._run(self._query, table, spec)
+
+    def close(self) -> None:
+        """Close the connection and stop the database thread."""
+        if self._connection is not None:
+            self._executor.submit(self._connection.close).result()
+            self._connection = None
+        self._executor.shutdown(wait=True)
+
+    def status(self) -> Dict[str, Any]:
+        """Get store details for health endpoints."""
+        return {"name": "sqlite", "connected": self._connection is not None, "path": self.path}
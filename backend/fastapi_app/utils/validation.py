@@ -169,12 +169,22 @@ def validate_file_content(content: str, max_size: int = 1024 * 1024) -> str:
     if not content:
         raise ValueError("File content cannot be empty")
 
-    if len(content.encode('utf-8')) > max_size:
-        raise ValueError(f"File content cannot exceed {max_size // 1024}KB")
+    validate_file_size(len(content.encode('utf-8')), max_size)
 
     return content
 
 
+def validate_file_size(size: int, max_size: int = 1024 * 1024) -> int:
+    """Validate a file size in bytes (checked as uploads are read)."""
+    if size <= 0:
+        raise ValueError("File content cannot be empty")
+
+    if size > max_size:
+        raise ValueError(f"File content cannot exceed {max_size // 1024}KB")
+
+    return size
+
+
 def validate_pagination_params(skip: int, limit: int) -> tuple[int, int]:
     """Validate pagination parameters."""
     if skip < 0:
@@ -142,7 +142,7 @@ function Dashboard() {
       console.log('🔄 Starting data fetch...')
       const [agentsRes, prdsRes] = await Promise.all([
         fetch('/api/v1/agents'),
-        fetch('/api/v1/prds')
+        fetch('/api/v1/prds?view=summary')
       ])
       
       console.log('📡 API responses received:', {
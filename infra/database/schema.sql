@@ -56,6 +56,8 @@ CREATE TABLE IF NOT EXISTS prds (
     -- File upload fields
     original_filename VARCHAR(255),
     file_content TEXT,
+    content_hash VARCHAR(64),
+    section_index JSONB,
     
     -- Indexes for performance
     CONSTRAINT prds_title_not_empty CHECK (length(trim(title)) > 0),
@@ -133,12 +135,18 @@ CREATE TABLE IF NOT EXISTS system_metrics (
     timestamp TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
+-- Columns added since the tables were first created: CREATE TABLE IF NOT EXISTS
+-- leaves an existing table alone, so databases created earlier get them here
+ALTER TABLE prds ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64);
+ALTER TABLE prds ADD COLUMN IF NOT EXISTS section_index JSONB;
+
 -- Create indexes for performance optimization
 CREATE INDEX IF NOT EXISTS idx_prds_status ON prds(status);
 CREATE INDEX IF NOT EXISTS idx_prds_type ON prds(prd_type);
 CREATE INDEX IF NOT EXISTS idx_prds_priority ON prds(priority);
 CREATE INDEX IF NOT EXISTS idx_prds_created_at ON prds(created_at);
 CREATE INDEX IF NOT EXISTS idx_prds_updated_at ON prds(updated_at);
+CREATE INDEX IF NOT EXISTS idx_prds_content_hash ON prds(content_hash);
 CREATE INDEX IF NOT EXISTS idx_prds_requirements ON prds USING GIN(requirements);
 CREATE INDEX IF NOT EXISTS idx_prds_target_users ON prds USING GIN(target_users);
 CREATE INDEX IF NOT EXISTS idx_prds_user_stories ON prds USING GIN(user_stories);
@@ -186,14 +194,30 @@ CREATE TRIGGER update_devin_tasks_updated_at BEFORE UPDATE ON devin_tasks
 -- Create audit trigger function
 CREATE OR REPLACE FUNCTION audit_trigger_function()
 RETURNS TRIGGER AS $$
+DECLARE
+    old_changed JSONB;
+    new_changed JSONB;
 BEGIN
+    -- Bulk purges may switch auditing off for their own transaction
+    IF current_setting('app.skip_audit', true) = 'on' THEN
+        RETURN COALESCE(NEW, OLD);
+    END IF;
+
     IF TG_OP = 'INSERT' THEN
         INSERT INTO audit_logs (table_name, record_id, action, new_values, timestamp)
         VALUES (TG_TABLE_NAME, NEW.id, 'INSERT', to_jsonb(NEW), NOW());
         RETURN NEW;
     ELSIF TG_OP = 'UPDATE' THEN
-        INSERT INTO audit_logs (table_name, record_id, action, old_values, new_values, timestamp)
-        VALUES (TG_TABLE_NAME, NEW.id, 'UPDATE', to_jsonb(OLD), to_jsonb(NEW), NOW());
+        -- Only the columns that changed, so small edits log small rows
+        SELECT jsonb_object_agg(o.key, o.value), jsonb_object_agg(n.key, n.value)
+        INTO old_changed, new_changed
+        FROM jsonb_each(to_jsonb(OLD)) o
+        JOIN jsonb_each(to_jsonb(NEW)) n USING (key)
+        WHERE o.value IS DISTINCT FROM n.value;
+        IF old_changed IS NOT NULL THEN
+            INSERT INTO audit_logs (table_name, record_id, action, old_values, new_values, timestamp)
+            VALUES (TG_TABLE_NAME, NEW.id, 'UPDATE', old_changed, new_changed, NOW());
+        END IF;
         RETURN NEW;
     ELSIF TG_OP = 'DELETE' THEN
         INSERT INTO audit_logs (table_name, record_id, action, old_values, timestamp)
@@ -217,6 +241,30 @@ CREATE TRIGGER audit_devin_tasks_trigger
     AFTER INSERT OR UPDATE OR DELETE ON devin_tasks
     FOR EACH ROW EXECUTE FUNCTION audit_trigger_function();
 
+-- Delete one batch of rows from a table, optionally without auditing.
+-- Called by the purge jobs behind DELETE /api/v1/clear-all and POST /api/v1/purge.
+-- Runs as its owner, so only the service role may execute it (PostgREST would
+-- otherwise expose it to the anon key at /rpc/purge_batch).
+CREATE OR REPLACE FUNCTION purge_batch(p_table TEXT, p_limit INTEGER, p_skip_audit BOOLEAN DEFAULT false)
+RETURNS INTEGER AS $$
+DECLARE
+    deleted INTEGER;
+BEGIN
+    IF p_table NOT IN ('prds', 'agents', 'devin_tasks', 'audit_logs', 'system_metrics') THEN
+        RAISE EXCEPTION 'purge_batch: table % is not purgeable', p_table;
+    END IF;
+    IF p_skip_audit THEN
+        PERFORM set_config('app.skip_audit', 'on', true);
+    END IF;
+    EXECUTE format('DELETE FROM %I WHERE id IN (SELECT id FROM %I LIMIT %s)', p_table, p_table, p_limit);
+    GET DIAGNOSTICS deleted = ROW_COUNT;
+    RETURN deleted;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+REVOKE EXECUTE ON FUNCTION purge_batch(TEXT, INTEGER, BOOLEAN) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION purge_batch(TEXT, INTEGER, BOOLEAN) TO service_role;
+
 -- Row Level Security (RLS) policies
 ALTER TABLE prds ENABLE ROW LEVEL SECURITY;
 ALTER TABLE agents ENABLE ROW LEVEL SECURITY;
@@ -405,19 +405,22 @@ SAMPLE_PRDS = [
 ]
 
 def create_sample_prds():
-    """Create sample PRDs via API"""
+    """Create sample PRDs via the bulk API (one request, batched database writes)"""
     base_url = "http://localhost:8000"
     
-    for prd_data in SAMPLE_PRDS:
-        try:
-            response = requests.post(f"{base_url}/api/v1/prds", json=prd_data)
-            if response.status_code == 200:
-                prd = response.json()
-                print(f"✅ Created PRD: {prd['title']} (ID: {prd['id']})")
+    try:
+        response = requests.post(f"{base_url}/api/v1/prds/bulk", json={"prds": SAMPLE_PRDS})
+        if response.status_code != 200:
+            print(f"❌ Bulk PRD creation failed - {response.status_code}: {response.text}")
+            return
+        for result in response.json()["results"]:
+            title = SAMPLE_PRDS[result["index"]]["title"]
+            if result["error"]:
+                print(f"❌ Failed to create PRD: {title} - {result['error']}")
             else:
-                print(f"❌ Failed to create PRD: {prd_data['title']} - {response.status_code}: {response.text}")
-        except Exception as e:
-            print(f"❌ Error creating PRD: {prd_data['title']} - {str(e)}")
+                print(f"✅ Created PRD: {title} (ID: {result['id']})")
+    except Exception as e:
+        print(f"❌ Error creating PRDs: {str(e)}")
 
 if __name__ == "__main__":
     print("Creating sample PRDs for improvement suggestions...")
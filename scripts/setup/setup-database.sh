@@ -53,7 +53,7 @@ import asyncio
 
 async def test_connection():
     try:
-        if db_manager.is_connected():
+        if await db_manager.test_connection():
             print('✅ Database connection successful')
             return True
         else:
@@ -89,7 +89,7 @@ python3 -c "
 import os
 import sys
 sys.path.append('$CURRENT_DIR/backend')
-from fastapi_app.utils.database import db_manager
+from fastapi_app.utils.db_pool import shared_client
 import asyncio
 
 async def check_tables():
@@ -98,7 +98,7 @@ async def check_tables():
         tables = ['prds', 'agents', 'devin_tasks']
         for table in tables:
             try:
-                result = db_manager.client.table(table).select('id').limit(1).execute()
+                result = shared_client().table(table).select('id').limit(1).execute()
                 print(f'✅ Table {table} exists')
             except Exception as e:
                 print(f'❌ Table {table} does not exist or is not accessible: {e}')
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark event-loop behaviour of database calls under concurrency.
+
+Compares calling a blocking PostgREST-style ``.execute()`` directly from
+async code (the old data manager behaviour) against running it on the
+bounded ``DatabaseExecutor``. A simulated query sleeps for a fixed latency
+so the numbers do not depend on network conditions.
+
+Usage:
+    python scripts/testing/benchmark-db-concurrency.py
+    python scripts/testing/benchmark-db-concurrency.py --concurrency 200 --latency-ms 20 --pool-size 16
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'backend'))
+
+from fastapi_app.utils.db_pool import DatabaseExecutor
+
+
+class SimulatedQuery:
+    """Stand-in for a PostgREST query builder with a blocking execute()."""
+
+    def __init__(self, latency_s: float):
+        self.latency_s = latency_s
+
+    def execute(self):
+        time.sleep(self.latency_s)
+        return {"data": []}
+
+
+def percentile(values, pct):
+    """Return the pct-th percentile of values (nearest-rank)."""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+async def _measure_loop_lag(stop: asyncio.Event, lags: list):
+    """Record how late a 5ms heartbeat fires - i.e. how long the loop stalls."""
+    interval = 0.005
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - start - interval)
+
+
+async def run_scenario(name, call, concurrency, latency_s):
+    """Fire `concurrency` simultaneous requests and collect latencies."""
+    latencies = []
+    lags = []
+    stop = asyncio.Event()
+    heartbeat = asyncio.create_task(_measure_loop_lag(stop, lags))
+    await asyncio.sleep(0)
+
+    # All requests arrive together, so latency is measured from the common
+    # arrival time - queueing behind a blocked loop counts against it.
+    wall_start = time.perf_counter()
+
+    async def request():
+        await call(SimulatedQuery(latency_s))
+        latencies.append(time.perf_counter() - wall_start)
+
+    await asyncio.gather(*(request() for _ in range(concurrency)))
+    wall = time.perf_counter() - wall_start
+
+    stop.set()
+    await heartbeat
+
+    print(f"\n📊 {name}")
+    print(f"  Requests:        {concurrency}")
+    print(f"  Wall time:       {wall * 1000:.1f} ms")
+    print(f"  p50 latency:     {percentile(latencies, 50) * 1000:.1f} ms")
+    print(f"  p99 latency:     {percentile(latencies, 99) * 1000:.1f} ms")
+    print(f"  Max loop stall:  {max(lags, default=0) * 1000:.1f} ms")
+    print(f"  Mean loop stall: {statistics.mean(lags) * 1000 if lags else 0:.1f} ms")
+    return latencies
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--pool-size", type=int, default=16)
+    args = parser.parse_args()
+    latency_s = args.latency_ms / 1000
+
+    print("🧪 Database concurrency benchmark")
+    print("=" * 50)
+    print(f"Simulated query latency: {args.latency_ms} ms, pool size: {args.pool_size}")
+
+    async def blocking_call(query):
+        return query.execute()
+
+    executor = DatabaseExecutor(max_workers=args.pool_size)
+
+    async def executor_call(query):
+        return await executor.execute(query)
+
+    await run_scenario("Blocking execute() on the event loop", blocking_call, args.concurrency, latency_s)
+    await run_scenario("DatabaseExecutor (thread pool)", executor_call, args.concurrency, latency_s)
+    executor.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Benchmark near-duplicate PRD detection.
+
+Signs synthetic PRD documents into the MinHash/LSH index behind the
+duplicate check on POST /prds and POST /prds/upload, then queries it with
+edited copies of stored documents (a share of their words replaced) and
+reports, per edit rate, the true Jaccard similarity of the copies, how
+often the original is found, and query time against a linear scan over
+every stored signature. Documents unrelated to any stored one are timed
+as well, since that is what most uploads look like.
+
+Usage:
+    python scripts/testing/benchmark-prd-duplicates.py
+    python scripts/testing/benchmark-prd-duplicates.py --prds 50000 --queries 200 --threshold 0.8
+"""
+
+import argparse
+import os
+import random
+import resource
+import statistics
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
+sys.path.append(os.path.join(ROOT, 'backend'))
+
+from fastapi_app.utils.minhash import LSHIndex, shingles, signature, similarity
+
+
+def document(rng, words, length):
+    return ' '.join(rng.choices(words, k=length))
+
+
+def edit(rng, text, rate, words):
+    """Copy of text with a share of its words replaced."""
+    tokens = text.split(' ')
+    for position in rng.sample(range(len(tokens)), int(len(tokens) * rate)):
+        tokens[position] = rng.choice(words)
+    return ' '.join(tokens)
+
+
+def jaccard(first, second):
+    return len(first & second) / len(first | second)
+
+
+def report(name, timings):
+    timings = sorted(timings)
+    p95 = timings[int(len(timings) * 0.95) - 1] if len(timings) > 1 else timings[0]
+    print(f"  {name:<24} median {statistics.median(timings) * 1000:8.3f} ms   p95 {p95 * 1000:8.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--prds", type=int, default=20000)
+    parser.add_argument("--words", type=int, default=600, help="Words per document")
+    parser.add_argument("--vocabulary", type=int, default=20000)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--threshold", type=float, default=0.7)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    words = [f"w{i}" for i in range(args.vocabulary)]
+    documents = [document(rng, words, args.words) for _ in range(args.prds)]
+    index = LSHIndex(args.threshold)
+
+    print("🧪 PRD duplicate detection benchmark")
+    print("=" * 50)
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    for prd_id, text in enumerate(documents):
+        index.add(prd_id, signature(shingles(text)))
+    load_s = time.perf_counter() - start
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    stats = index.stats()
+    print(f"📦 {stats['signatures']} PRDs of {args.words} words signed in {load_s:.1f} s "
+          f"({load_s / args.prds * 1000:.2f} ms each), peak RSS +{(rss_after - rss_before) / 1024:.0f} MB")
+    print(f"   threshold {args.threshold}: {stats['bands']} bands x {stats['rows_per_band']} rows")
+
+    signatures = index._signatures
+
+    def linear_scan(sig):
+        return [key for key, stored in signatures.items() if similarity(sig, stored) >= args.threshold]
+
+    print(f"\n🔎 Edited copies ({args.queries} each)")
+    print(f"  {'words replaced':<16}{'true Jaccard':>14}{'found':>9}")
+    lsh_timings, scan_timings = [], []
+    for rate in (0.0, 0.02, 0.05, 0.08, 0.12, 0.2):
+        found, similarities = 0, []
+        for _ in range(args.queries):
+            prd_id = rng.randrange(args.prds)
+            copy = edit(rng, documents[prd_id], rate, words)
+            copy_shingles = shingles(copy)
+            similarities.append(jaccard(copy_shingles, shingles(documents[prd_id])))
+            sig = signature(copy_shingles)
+            start = time.perf_counter()
+            matches = index.query(sig)
+            lsh_timings.append(time.perf_counter() - start)
+            found += any(key == prd_id for key, _ in matches)
+        print(f"  {rate:<16.0%}{statistics.mean(similarities):>14.3f}{found / args.queries:>9.0%}")
+
+    unrelated_timings = []
+    for _ in range(args.queries):
+        sig = signature(shingles(document(rng, words, args.words)))
+        start = time.perf_counter()
+        index.query(sig)
+        unrelated_timings.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        linear_scan(sig)
+        scan_timings.append(time.perf_counter() - start)
+
+    print("\n⏱️  Query time")
+    report('LSH, edited copy', lsh_timings)
+    report('LSH, unrelated PRD', unrelated_timings)
+    report('linear scan', scan_timings)
+
+    timings = []
+    for _ in range(args.queries):
+        text = document(rng, words, args.words)
+        start = time.perf_counter()
+        signature(shingles(text))
+        timings.append(time.perf_counter() - start)
+    report('signing one PRD', timings)
+
+
+if __name__ == "__main__":
+    main()
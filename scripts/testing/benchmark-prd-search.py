@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Benchmark PRD full-text search.
+
+Indexes synthetic PRD rows (words drawn from a Zipf-distributed
+vocabulary, so common terms have long posting lists like real text) into
+the ``SearchIndex`` behind GET /prds/search, then times queries of one to
+four terms across the frequency range, a filtered query, and single
+updates and deletes. Terms are grouped by the share of PRDs containing
+them; queries made only of terms found in most PRDs behave like stopword
+queries (flat scores, so the threshold algorithm reads most postings) and
+are reported separately as the worst case. Each query set's first result
+list is checked against a brute-force BM25 score over every document.
+
+Usage:
+    python scripts/testing/benchmark-prd-search.py
+    python scripts/testing/benchmark-prd-search.py --prds 50000 --queries 200
+"""
+
+import argparse
+import math
+import os
+import random
+import resource
+import statistics
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
+sys.path.append(os.path.join(ROOT, 'backend'))
+
+from fastapi_app.services.prd_search_service import PRDSearchService
+from fastapi_app.utils.search_index import query_terms
+
+SYLLABLES = ('ka', 'lo', 'mi', 'ne', 'ru', 'sa', 'ti', 'vo', 'xe', 'zu', 'ba', 'de', 'fi', 'go', 'hu')
+
+
+def vocabulary(size, rng):
+    """Distinct pseudo-words, most frequent first."""
+    words = set()
+    while len(words) < size:
+        words.add(''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))))
+    return sorted(words, key=lambda word: (len(word), word))
+
+
+class Corpus:
+    """Seeded generator of PRD rows."""
+
+    def __init__(self, vocabulary_size, seed):
+        self.rng = random.Random(seed)
+        self.words = vocabulary(vocabulary_size, self.rng)
+        self.weights = [1 / (rank + 1) for rank in range(len(self.words))]
+        self.cumulative = []
+        total = 0.0
+        for weight in self.weights:
+            total += weight
+            self.cumulative.append(total)
+
+    def text(self, low, high):
+        count = self.rng.randint(low, high)
+        return ' '.join(self.rng.choices(self.words, cum_weights=self.cumulative, k=count))
+
+    def row(self, prd_id):
+        return {
+            'id': prd_id,
+            'title': self.text(3, 8),
+            'description': self.text(15, 40),
+            'problem_statement': self.text(15, 40),
+            'requirements': [self.text(6, 14) for _ in range(self.rng.randint(3, 8))],
+            'user_stories': [self.text(10, 20) for _ in range(self.rng.randint(1, 4))],
+            'acceptance_criteria': [self.text(6, 12) for _ in range(self.rng.randint(1, 4))],
+            'prd_type': self.rng.choice(('agent', 'platform')),
+        }
+
+
+def brute_force(index, query, limit):
+    """Score every document directly, as a check on the threshold algorithm."""
+    postings = index._live.postings
+    terms = [term for term in query_terms(query) if term in postings]
+    count = len(index)
+    idfs = {term: math.log(1 + (count - len(postings[term]) + 0.5) / (len(postings[term]) + 0.5))
+            for term in terms}
+    scores = []
+    for doc_id, (doc_terms, doc_frequencies, length) in index._docs.items():
+        frequencies = dict(zip(doc_terms, doc_frequencies))
+        norm = index._live.norm(length)
+        score = sum(idfs[term] * frequencies[term] * (index.k1 + 1) / (frequencies[term] + norm)
+                    for term in terms if term in frequencies)
+        if score:
+            scores.append((-score, doc_id))
+    return [(doc_id, -score) for score, doc_id in sorted(scores)[:limit]]
+
+
+def report(name, timings):
+    timings = sorted(timings)
+    p95 = timings[int(len(timings) * 0.95) - 1] if len(timings) > 1 else timings[0]
+    print(f"  {name:<26} median {statistics.median(timings) * 1000:7.3f} ms   p95 {p95 * 1000:7.3f} ms   max {timings[-1] * 1000:7.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--prds", type=int, default=50000)
+    parser.add_argument("--vocabulary", type=int, default=20000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-check", action="store_true", help="Skip the brute-force result check")
+    args = parser.parse_args()
+
+    corpus = Corpus(args.vocabulary, args.seed)
+    rows = [corpus.row(f"prd-{i}") for i in range(args.prds)]
+    service = PRDSearchService()
+    index = service.index
+
+    print("🧪 PRD search benchmark")
+    print("=" * 50)
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    with index.bulk_load():
+        for row in rows:
+            service._add(row)
+    load_s = time.perf_counter() - start
+    # The reweight after a load runs in steps the service yields to the event loop between
+    steps = []
+    step_start = time.perf_counter()
+    for _ in index.reweight_steps():
+        now = time.perf_counter()
+        steps.append(now - step_start)
+        step_start = now
+    steps.append(time.perf_counter() - step_start)
+    load_s += sum(steps)
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    stats = index.stats()
+    print(f"📦 {stats['documents']} PRDs, {stats['terms']} terms, {stats['postings']} postings")
+    print(f"   loaded in {load_s:.1f} s, peak RSS +{(rss_after - rss_before) / 1024:.0f} MB")
+    print(f"   reweight: {sum(steps):.1f} s in {len(steps)} steps, longest step {max(steps) * 1000:.0f} ms")
+
+    rng = random.Random(args.seed + 1)
+    count = len(index)
+    bands = {'stopword-like': [], 'common': [], 'mid': [], 'rare': []}
+    for word in corpus.words:
+        share = len(index._live.postings.get(word, ())) / count
+        if share > 0.5:
+            bands['stopword-like'].append(word)
+        elif share > 0.05:
+            bands['common'].append(word)
+        elif share > 0.005:
+            bands['mid'].append(word)
+        elif share:
+            bands['rare'].append(word)
+    print("   terms in >50% / 5-50% / 0.5-5% / <0.5% of PRDs: "
+          + " / ".join(str(len(words)) for words in bands.values()))
+
+    query_sets = {
+        '1 term, common': lambda: rng.choice(bands['common']),
+        '1 term, rare': lambda: rng.choice(bands['rare']),
+        '2 terms, common': lambda: ' '.join(rng.sample(bands['common'], 2)),
+        '2 terms, common+mid': lambda: f"{rng.choice(bands['common'])} {rng.choice(bands['mid'])}",
+        '3 terms, mixed': lambda: ' '.join((rng.choice(bands['common']), rng.choice(bands['mid']), rng.choice(bands['rare']))),
+        '4 terms, common': lambda: ' '.join(rng.sample(bands['common'], 4)),
+        '4 terms, mixed': lambda: ' '.join(rng.sample(bands['common'], 2) + rng.sample(bands['mid'], 2)),
+        '3 terms, stopword-like': lambda: ' '.join(rng.sample(bands['stopword-like'], 3)),
+    }
+
+    print(f"\n🔎 Queries (limit {args.limit}, {args.queries} each)")
+    mismatches = 0
+    for name, make_query in query_sets.items():
+        queries = [make_query() for _ in range(args.queries)]
+        for query in queries[:5]:
+            service.search(query, args.limit)  # build the sorted lists once
+        timings = []
+        for query in queries:
+            start = time.perf_counter()
+            results = service.search(query, args.limit)
+            timings.append(time.perf_counter() - start)
+            if not args.no_check and query is queries[0]:
+                expected = brute_force(index, query, args.limit)
+                if [round(score, 9) for _, score in results] != [round(score, 9) for _, score in expected]:
+                    mismatches += 1
+                    print(f"  ❌ {query!r}: results differ from brute force")
+        report(name, timings)
+
+    timings = []
+    for _ in range(args.queries):
+        query = ' '.join(rng.sample(bands['common'], 2))
+        start = time.perf_counter()
+        service.search(query, args.limit, 'platform')
+        timings.append(time.perf_counter() - start)
+    report('2 terms, prd_type filter', timings)
+
+    print("\n✏️  Writes")
+    timings = []
+    for i in range(args.queries):
+        row = corpus.row(f"prd-{rng.randrange(args.prds)}")
+        start = time.perf_counter()
+        service.index_prd(row)
+        timings.append(time.perf_counter() - start)
+    report('update one PRD', timings)
+    timings = []
+    for i in range(args.queries):
+        start = time.perf_counter()
+        service.remove_prd(f"prd-{i}")
+        timings.append(time.perf_counter() - start)
+    report('delete one PRD', timings)
+    print(f"   reweights: {index.reweights}")
+
+    if mismatches:
+        print(f"\n❌ {mismatches} query result(s) differ from brute force")
+        sys.exit(1)
+    if not args.no_check:
+        print("\n✅ Results match brute-force BM25")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark PRD section-header detection.
+
+Compares the old ``PRDParser._identify_sections`` loop - every line tried
+against each of ``section_patterns`` with ``re.match(pattern, line,
+re.IGNORECASE)`` - against the single compiled matcher. First checks that
+both find identical sections for every PRD in tests/samples and
+prds/templates, then times section detection and the full parse on
+multi-megabyte PRDs built by repeating the templates.
+
+Usage:
+    python scripts/testing/benchmark-prd-sections.py
+    python scripts/testing/benchmark-prd-sections.py --sizes 1 4 16 --repeat 5
+"""
+
+import argparse
+import glob
+import os
+import re
+import statistics
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
+sys.path.append(os.path.join(ROOT, 'backend'))
+
+from fastapi_app.services.prd_parser import PRDParser
+
+
+def legacy_identify_sections(parser, lines):
+    """The per-pattern loop this benchmark replaces."""
+    sections = {}
+    current_section = None
+    current_content = []
+    for line in lines:
+        line_stripped = line.strip()
+        section_found = None
+        for section_name, pattern in parser.section_patterns.items():
+            if re.match(pattern, line_stripped, re.IGNORECASE):
+                section_found = section_name
+                break
+        if section_found:
+            if current_section and current_content:
+                sections[current_section] = current_content
+            current_section = section_found
+            current_content = []
+        elif current_section and line_stripped:
+            current_content.append(line)
+    if current_section and current_content:
+        sections[current_section] = current_content
+    return sections
+
+
+def sample_files():
+    """PRDs the outputs are compared on."""
+    return sorted(glob.glob(os.path.join(ROOT, 'tests', 'samples', '*.md')) +
+                  glob.glob(os.path.join(ROOT, 'prds', 'templates', 'prd-template-*.md')))
+
+
+def check_identical(parser):
+    """Both versions must find the same sections in every sample."""
+    print("🔍 Comparing outputs")
+    ok = True
+    for path in sample_files():
+        with open(path, encoding='utf-8') as f:
+            content = f.read()
+        lines = content.split('\n')
+        same = parser._identify_sections(lines) == legacy_identify_sections(parser, lines)
+        ok = ok and same
+        print(f"  {'✅' if same else '❌'} {os.path.relpath(path, ROOT)}")
+    return ok
+
+
+def make_document(size_mb):
+    """A PRD of about size_mb megabytes made by repeating the templates."""
+    parts = []
+    for path in glob.glob(os.path.join(ROOT, 'prds', 'templates', 'prd-template-*.md')):
+        with open(path, encoding='utf-8') as f:
+            parts.append(f.read())
+    block = '\n'.join(parts)
+    copies = max(1, int(size_mb * 1024 * 1024 / len(block.encode('utf-8'))))
+    return '\n'.join([block] * copies)
+
+
+def bench(name, func, size_bytes, repeat):
+    """Median time of func, reported with throughput."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    median = statistics.median(timings)
+    print(f"  {name:<28} {median * 1000:9.1f} ms  ({size_bytes / median / 1e6:6.1f} MB/s)")
+    return median
+
+
+def main():
+    parser_args = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser_args.add_argument("--sizes", type=float, nargs="+", default=[1, 4, 8], help="Document sizes in MB")
+    parser_args.add_argument("--repeat", type=int, default=5)
+    args = parser_args.parse_args()
+
+    parser = PRDParser()
+
+    print("🧪 PRD section-header benchmark")
+    print("=" * 50)
+    if not check_identical(parser):
+        print("❌ Outputs differ - not benchmarking")
+        sys.exit(1)
+
+    for size_mb in args.sizes:
+        content = make_document(size_mb)
+        size_bytes = len(content.encode('utf-8'))
+        lines = content.split('\n')
+        print(f"\n📊 {size_bytes / 1e6:.1f} MB, {len(lines)} lines (median of {args.repeat})")
+        old = bench("per-pattern re.match", lambda: legacy_identify_sections(parser, lines), size_bytes, args.repeat)
+        new = bench("compiled matcher", lambda: parser._identify_sections(lines), size_bytes, args.repeat)
+        print(f"  Section detection speed-up:  {old / new:.2f}x")
+        bench("parse_prd_content", lambda: parser.parse_prd_content(content), size_bytes, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Benchmark PRD type classification.
+
+Upload used to detect the type twice: ``PRDParser._determine_prd_type``
+during the parse, then ``PRDService._detect_prd_type`` over the same
+content, each with its own keyword list. Both are reproduced here and
+compared with ``classify_prd``, which does the one pass both now share.
+A pure-Python Aho-Corasick automaton and a regex alternation over the same
+vocabulary are timed as references for the matching strategy. Lists the
+samples whose type changed against the old upload result, then times all
+of them on multi-megabyte PRDs built by repeating the templates.
+
+Usage:
+    python scripts/testing/benchmark-prd-type.py
+    python scripts/testing/benchmark-prd-type.py --sizes 1 4 --repeat 5
+"""
+
+import argparse
+import glob
+import os
+import re
+import statistics
+import sys
+import time
+from collections import deque
+
+ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
+sys.path.append(os.path.join(ROOT, 'backend'))
+
+from fastapi_app.services.prd_classifier import VOCABULARY, classify_prd
+
+LEGACY_PARSER_PLATFORM = (
+    'platform', 'infrastructure', 'system', 'deployment',
+    'scalability', 'monitoring', 'operational'
+)
+LEGACY_PARSER_AGENT = (
+    'ai agent', 'agent', 'artificial intelligence', 'machine learning',
+    'automation', 'chatbot', 'assistant', 'intelligent'
+)
+LEGACY_SERVICE_PLATFORM = (
+    'platform', 'factory', 'infrastructure', 'system', 'architecture',
+    'framework', 'core', 'base', 'foundation', 'engine', 'orchestrator',
+    'deployment', 'ci/cd', 'pipeline', 'monitoring', 'logging',
+    'authentication', 'authorization', 'database', 'api', 'backend',
+    'frontend', 'ui', 'ux', 'dashboard', 'admin', 'management'
+)
+LEGACY_SERVICE_AGENT = (
+    'agent', 'bot', 'assistant', 'automation', 'workflow', 'task',
+    'process', 'execution', 'ai', 'ml', 'model', 'prediction',
+    'analysis', 'recommendation', 'chat', 'conversation', 'nlp',
+    'openai', 'anthropic', 'claude'
+)
+
+
+def legacy_parser_type(content, filename=None):
+    """The parser's old indicator count."""
+    if filename:
+        if 'platform' in filename.lower():
+            return 'platform'
+        if 'agent' in filename.lower():
+            return 'agent'
+    content_lower = content.lower()
+    platform = sum(1 for keyword in LEGACY_PARSER_PLATFORM if keyword in content_lower)
+    agent = sum(1 for keyword in LEGACY_PARSER_AGENT if keyword in content_lower)
+    return 'platform' if platform > agent else 'agent'
+
+
+def legacy_service_type(content):
+    """The service's old detection - the type uploads were stored with."""
+    content_lower = content.lower()
+    platform = sum(1 for keyword in LEGACY_SERVICE_PLATFORM if keyword in content_lower)
+    agent = sum(1 for keyword in LEGACY_SERVICE_AGENT if keyword in content_lower)
+    if any(pattern in content_lower for pattern in ['prd type', 'platform prd', 'agent prd', 'type:', 'category:']):
+        if 'platform' in content_lower:
+            return 'platform'
+        elif 'agent' in content_lower:
+            return 'agent'
+    if 'create agent' in content_lower or 'build agent' in content_lower:
+        return 'agent'
+    if 'improve platform' in content_lower or 'enhance system' in content_lower:
+        return 'platform'
+    return 'platform' if platform > agent else 'agent'
+
+
+def legacy_upload(content, filename):
+    """Both passes, as upload ran them."""
+    legacy_parser_type(content, filename)
+    return legacy_service_type(content)
+
+
+def build_automaton(terms):
+    """Aho-Corasick goto/fail/output tables."""
+    goto, fail, output = [{}], [0], [set()]
+    for term in terms:
+        state = 0
+        for char in term:
+            if char not in goto[state]:
+                goto.append({})
+                fail.append(0)
+                output.append(set())
+                goto[state][char] = len(goto) - 1
+            state = goto[state][char]
+        output[state].add(term)
+    queue = deque(goto[0].values())
+    while queue:
+        current = queue.popleft()
+        for char, state in goto[current].items():
+            queue.append(state)
+            fallback = fail[current]
+            while fallback and char not in goto[fallback]:
+                fallback = fail[fallback]
+            fail[state] = goto[fallback].get(char, 0) if current else 0
+            output[state] |= output[fail[state]]
+    return goto, fail, output
+
+
+def aho_corasick_terms(automaton, text):
+    """Terms found by walking the automaton over the text."""
+    goto, fail, output = automaton
+    state = 0
+    found = set()
+    for char in text.lower():
+        while state and char not in goto[state]:
+            state = fail[state]
+        state = goto[state].get(char, 0)
+        if output[state]:
+            found |= output[state]
+    return found
+
+
+def regex_terms(pattern, text):
+    """Terms found by an overlapping regex alternation."""
+    return {match.group(1) for match in pattern.finditer(text.lower())}
+
+
+def sample_files():
+    """PRDs the results are compared on."""
+    return sorted(glob.glob(os.path.join(ROOT, 'tests', 'samples', '*.md')) +
+                  glob.glob(os.path.join(ROOT, 'prds', '**', '*.md'), recursive=True))
+
+
+def compare_types():
+    """Report samples whose stored type changes with the unified classifier."""
+    print("🔍 Comparing types with the old upload result")
+    changed = 0
+    files = sample_files()
+    for path in files:
+        with open(path, encoding='utf-8') as f:
+            content = f.read()
+        filename = os.path.basename(path)
+        old = legacy_upload(content, filename)
+        new = classify_prd(content, filename)
+        if old != new.prd_type:
+            changed += 1
+            print(f"  🔁 {os.path.relpath(path, ROOT)}: {old} -> {new.prd_type} ({new.reason}, scores {new.scores})")
+    print(f"  {len(files) - changed}/{len(files)} unchanged")
+
+
+def make_document(size_mb):
+    """A PRD of about size_mb megabytes made by repeating the templates."""
+    parts = []
+    for path in glob.glob(os.path.join(ROOT, 'prds', 'templates', 'prd-template-*.md')):
+        with open(path, encoding='utf-8') as f:
+            parts.append(f.read())
+    block = '\n'.join(parts)
+    copies = max(1, int(size_mb * 1024 * 1024 / len(block.encode('utf-8'))))
+    return '\n'.join([block] * copies)
+
+
+def bench(name, func, size_bytes, repeat):
+    """Median time of func, reported with throughput."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    median = statistics.median(timings)
+    print(f"  {name:<28} {median * 1000:9.1f} ms  ({size_bytes / median / 1e6:6.1f} MB/s)")
+    return median
+
+
+def main():
+    parser_args = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser_args.add_argument("--sizes", type=float, nargs="+", default=[1, 4], help="Document sizes in MB")
+    parser_args.add_argument("--repeat", type=int, default=5)
+    args = parser_args.parse_args()
+
+    automaton = build_automaton(VOCABULARY)
+    alternation = '|'.join(re.escape(term) for term in sorted(VOCABULARY, key=len, reverse=True))
+    pattern = re.compile(f'(?=({alternation}))')
+
+    print("🧪 PRD type classification benchmark")
+    print("=" * 50)
+    compare_types()
+
+    for size_mb in args.sizes:
+        content = make_document(size_mb)
+        size_bytes = len(content.encode('utf-8'))
+        print(f"\n📊 {size_bytes / 1e6:.1f} MB (median of {args.repeat})")
+        old = bench("old parser + service passes", lambda: legacy_upload(content, None), size_bytes, args.repeat)
+        new = bench("classify_prd", lambda: classify_prd(content), size_bytes, args.repeat)
+        bench("Aho-Corasick (reference)", lambda: aho_corasick_terms(automaton, content), size_bytes, args.repeat)
+        bench("regex alternation (reference)", lambda: regex_terms(pattern, content), size_bytes, args.repeat)
+        print(f"  Speed-up over both passes:   {old / new:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Benchmark decoding stored rows into response models.
+
+Compares the old service code path - ``datetime.fromisoformat(x.replace('Z',
+'+00:00'))`` per timestamp column followed by a validating ``Model(**row)``
+- against ``row_decoder.decode_rows``, which leaves ISO parsing to the
+model's pydantic-core validator. ``model_construct`` is timed as well, as
+the reference for why trusted rows are not built without validation.
+Rows are synthetic but shaped like Supabase output: ISO timestamps with
+microseconds and a trailing "Z".
+
+Usage:
+    python scripts/testing/benchmark-row-decoding.py
+    python scripts/testing/benchmark-row-decoding.py --rows 1000 --repeat 20
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'backend'))
+
+from fastapi_app.models.agent import AgentResponse
+from fastapi_app.models.prd import PRDResponse
+from fastapi_app.utils.row_decoder import decode_rows
+
+
+def _timestamp(offset_s: int) -> str:
+    return (datetime(2025, 1, 1) + timedelta(seconds=offset_s, microseconds=123456)).isoformat() + "Z"
+
+
+def make_prd_rows(count):
+    """Synthetic PRD rows as the database returns them."""
+    return [{
+        "id": str(uuid.uuid4()),
+        "title": f"PRD {i}",
+        "description": "A synthetic PRD used for benchmarking. " * 4,
+        "requirements": [f"Requirement {n}" for n in range(8)],
+        "prd_type": "agent",
+        "status": "queue",
+        "github_repo_url": None,
+        "created_at": _timestamp(i),
+        "updated_at": _timestamp(i + 60),
+        "problem_statement": "Problem statement text.",
+        "target_users": ["developers", "operators"],
+        "user_stories": [f"As a user I want {n}" for n in range(5)],
+        "acceptance_criteria": [f"Criterion {n}" for n in range(5)],
+        "technical_requirements": [f"Tech {n}" for n in range(5)],
+        "priority": "high",
+        "file_content": "# PRD\n" + "Body line.\n" * 50,
+    } for i in range(count)]
+
+
+def make_agent_rows(count):
+    """Synthetic agent rows as the database returns them."""
+    return [{
+        "id": str(uuid.uuid4()),
+        "name": f"agent-{i}",
+        "description": "Synthetic agent",
+        "purpose": "Benchmarking",
+        "version": "1.0.0",
+        "tools": ["http", "redis"],
+        "status": "active",
+        "capabilities": ["caching", "reporting"],
+        "configuration": {"replicas": 2},
+        "last_health_check": _timestamp(i + 120),
+        "health_status": "healthy",
+        "created_at": _timestamp(i),
+        "updated_at": _timestamp(i + 60),
+    } for i in range(count)]
+
+
+def legacy_decode(model, rows, columns):
+    """The per-service code this benchmark replaces."""
+    result = []
+    for row in rows:
+        for column in columns:
+            if row.get(column):
+                row[column] = datetime.fromisoformat(row[column].replace('Z', '+00:00'))
+        result.append(model(**row))
+    return result
+
+
+def bench(name, make_rows, func, count, repeat):
+    """Time func over fresh copies of the rows (the old path mutates them)."""
+    timings = []
+    for _ in range(repeat):
+        rows = make_rows(count)
+        start = time.perf_counter()
+        func(rows)
+        timings.append(time.perf_counter() - start)
+    median = statistics.median(timings)
+    print(f"  {name:<28} {median * 1000:8.2f} ms  ({median / count * 1e6:.1f} µs/row)")
+    return median
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print("🧪 Row decoding benchmark")
+    print("=" * 50)
+    cases = [
+        ("PRDs", PRDResponse, make_prd_rows, ("created_at", "updated_at")),
+        ("Agents", AgentResponse, make_agent_rows, ("created_at", "updated_at", "last_health_check")),
+    ]
+    for label, model, make_rows, columns in cases:
+        print(f"\n📊 {label} ({args.rows} rows, median of {args.repeat})")
+        old = bench("fromisoformat + Model(**row)", make_rows,
+                    lambda rows: legacy_decode(model, rows, columns), args.rows, args.repeat)
+        new = bench("decode_rows", make_rows,
+                    lambda rows: decode_rows(model, rows), args.rows, args.repeat)
+        bench("model_construct (reference)", make_rows,
+              lambda rows: [model.model_construct(**row) for row in rows], args.rows, args.repeat)
+        print(f"  Speed-up:                    {old / new:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+"""
+PRD parser benchmark suite.
+
+Generates synthetic PRDs of a chosen size and section mix from the agent
+and platform templates in prds/templates, then times each stage an upload
+or export runs them through: ``PRDParser.parse_prd_content``,
+``validate_prd_structure``, type classification and
+``PRDService._generate_prd_markdown``. Results can be saved as a JSON
+baseline and later runs compared against it.
+
+Usage (from scripts/testing):
+    python -m prd_benchmark
+    python -m prd_benchmark --sizes 0.1 1 4 --repeat 5 --save main
+    python -m prd_benchmark --sections description requirements risks --compare main
+    python -m prd_benchmark --write-corpus /tmp/prd-corpus
+"""
+
+import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+sys.path.append(os.path.join(ROOT, 'backend'))
+
+# The markdown stage needs PRDService; keep it on the in-memory store
+os.environ.setdefault("ENVIRONMENT", "development")
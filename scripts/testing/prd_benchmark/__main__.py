@@ -0,0 +1,84 @@
+"""Command-line entry point: python -m prd_benchmark (from scripts/testing)."""
+
+import argparse
+import sys
+
+from . import __doc__ as package_doc
+from .baseline import compare, load_baseline, save_baseline
+from .corpus import TEMPLATES, build_corpus, load_template, write_corpus
+from .stages import STAGES, run_document
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(prog='prd_benchmark', description=package_doc.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=float, nargs="+", default=[0.1, 1, 4], help="Document sizes in MB")
+    parser.add_argument("--templates", nargs="+", choices=TEMPLATES, default=list(TEMPLATES))
+    parser.add_argument("--sections", nargs="+", help="Section keys to include, e.g. description requirements (default all)")
+    parser.add_argument("--grow", nargs="+", help="Section keys whose list items fill the size (default all included)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", metavar="NAME", help="Save results as baseline NAME (or a .json path)")
+    parser.add_argument("--compare", metavar="NAME", help="Compare against baseline NAME (or a .json path)")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="Slowdown counted as a regression (default 0.10)")
+    parser.add_argument("--min-ms", type=float, default=1.0, help="Ignore regressions in stages faster than this in the baseline")
+    parser.add_argument("--write-corpus", metavar="DIR", help="Only write the generated PRDs to DIR")
+    parser.add_argument("--list-sections", action="store_true", help="List the template section keys and exit")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    if args.list_sections:
+        for name in args.templates:
+            print(f"{name}: {' '.join(load_template(name).section_keys)}")
+        return
+
+    try:
+        documents = build_corpus(args.sizes, args.templates, args.sections, args.grow, args.seed)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(2)
+
+    if args.write_corpus:
+        for path in write_corpus(documents, args.write_corpus):
+            print(path)
+        return
+
+    print("🧪 PRD parser benchmark")
+    print("=" * 50)
+    results = {}
+    for document in documents:
+        size_mb = document.size_bytes / 1e6
+        print(f"\n📊 {document.name}: {size_mb:.2f} MB, {document.content.count(chr(10)) + 1} lines (median of {args.repeat})")
+        results[document.name] = timings = run_document(document, args.repeat)
+        for stage in STAGES:
+            timing = timings[stage]
+            print(f"  {stage:<10} {timing['median_ms']:9.1f} ms  ({timing['mb_per_s']:7.1f} MB/s)")
+        total_ms = sum(timing['median_ms'] for timing in timings.values())
+        print(f"  {'total':<10} {total_ms:9.1f} ms  ({size_mb / (total_ms / 1000):7.1f} MB/s)")
+
+    settings = {
+        'sizes_mb': args.sizes, 'templates': args.templates, 'sections': args.sections,
+        'grow': args.grow, 'seed': args.seed, 'repeat': args.repeat,
+    }
+    if args.save:
+        print(f"\n💾 Baseline saved to {save_baseline(args.save, results, settings)}")
+
+    if args.compare:
+        baseline = load_baseline(args.compare)
+        differing = [key for key in ('templates', 'sections', 'grow', 'seed')
+                     if baseline.get('settings', {}).get(key) != settings[key]]
+        if differing:
+            print(f"\n⚠️  Baseline corpus differs in: {', '.join(differing)}")
+        lines, regressions = compare(baseline, results, args.tolerance, args.min_ms)
+        print(f"\n📈 Against baseline {args.compare} (tolerance {args.tolerance:.0%})")
+        print('\n'.join(lines))
+        if regressions:
+            print(f"\n❌ {len(regressions)} stage(s) regressed")
+            sys.exit(1)
+        print("\n✅ No regressions")
+
+
+if __name__ == "__main__":
+    main()
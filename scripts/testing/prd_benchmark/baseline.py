@@ -0,0 +1,77 @@
+"""
+JSON baselines for local regression comparison.
+
+Baselines are machine-specific, so they are kept out of git in
+prd_benchmark/baselines/<name>.json unless a path is given.
+"""
+
+import json
+import os
+import platform
+import sys
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+BASELINE_DIR = os.path.join(os.path.dirname(__file__), 'baselines')
+
+
+def baseline_path(name: str) -> str:
+    """A bare name lives in BASELINE_DIR; anything with a path or .json is used as given."""
+    if os.sep in name or name.endswith('.json'):
+        return name
+    return os.path.join(BASELINE_DIR, f'{name}.json')
+
+
+def save_baseline(name: str, results: Dict[str, Dict], settings: Dict) -> str:
+    """Write a run's results with enough context to judge later comparisons."""
+    path = baseline_path(name)
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    data = {
+        'created_at': datetime.utcnow().isoformat() + 'Z',
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'settings': settings,
+        'documents': results,
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+    return path
+
+
+def load_baseline(name: str) -> Dict:
+    """Read a saved baseline."""
+    with open(baseline_path(name), encoding='utf-8') as f:
+        return json.load(f)
+
+
+def compare(baseline: Dict, results: Dict[str, Dict], tolerance: float,
+            min_ms: float = 1.0) -> Tuple[List[str], List[str]]:
+    """
+    Compare a run against a baseline by median time.
+
+    Returns:
+        (report lines, regressions) where a regression is a stage more than
+        tolerance (a fraction) slower than its baseline; stages faster than
+        min_ms in the baseline are reported but never counted, as their
+        timings are mostly noise
+    """
+    lines, regressions = [], []
+    for document, stages in results.items():
+        base_stages = baseline['documents'].get(document)
+        if base_stages is None:
+            lines.append(f"  {document:<22} not in baseline")
+            continue
+        for stage, timing in stages.items():
+            base = base_stages.get(stage)
+            if not base:
+                continue
+            change = timing['median_ms'] / base['median_ms'] - 1 if base['median_ms'] else 0.0
+            measurable = base['median_ms'] >= min_ms
+            regressed = measurable and change > tolerance
+            marker = '❌' if regressed else ('✅' if measurable and change < -tolerance else '  ')
+            label = f"{document} {stage}"
+            lines.append(f"  {marker} {label:<30} {base['median_ms']:9.1f} -> {timing['median_ms']:9.1f} ms  ({change:+.1%})")
+            if regressed:
+                regressions.append(label)
+    return lines, regressions
@@ -0,0 +1,190 @@
+"""
+Synthetic PRD corpus generator.
+
+A template is split into its "## " sections. Every "[placeholder]" is
+replaced with seeded filler words, and the list items of the chosen
+sections are repeated (with fresh filler) until the document reaches the
+requested size, so large PRDs keep the template's structure rather than
+being copies of a whole document.
+"""
+
+import os
+import random
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+from . import ROOT
+
+TEMPLATE_DIR = os.path.join(ROOT, 'prds', 'templates')
+TEMPLATES = ('agent', 'platform')
+
+PLACEHOLDER = re.compile(r'\[(?! \])([^\]\n]+)\]')
+LIST_ITEM = re.compile(r'^\s*(?:[\*\-\+]|\d+\.)\s')
+HEADER_MARKUP = re.compile(r'[^a-z0-9]+')
+
+WORDS = (
+    'agent', 'platform', 'latency', 'request', 'queue', 'cache', 'user',
+    'report', 'model', 'service', 'deploy', 'metric', 'token', 'schema',
+    'retry', 'index', 'stream', 'audit', 'budget', 'session', 'policy',
+    'search', 'review', 'export', 'upload', 'workflow', 'dashboard',
+    'throughput', 'failover', 'migration', 'release', 'capacity'
+)
+
+
+@dataclass
+class Section:
+    """One '## ' section of a template."""
+    key: str
+    header: str
+    lines: List[str] = field(default_factory=list)
+
+    @property
+    def list_items(self) -> List[int]:
+        """Indexes of the section's list-item lines."""
+        return [i for i, line in enumerate(self.lines) if LIST_ITEM.match(line)]
+
+
+@dataclass
+class Template:
+    """A PRD template split into a preamble and its sections."""
+    name: str
+    preamble: List[str]
+    sections: List[Section]
+
+    @property
+    def section_keys(self) -> List[str]:
+        return [section.key for section in self.sections]
+
+
+def section_key(header: str) -> str:
+    """'## **Problem Statement**' -> 'problem-statement'."""
+    return HEADER_MARKUP.sub('-', header.lstrip('#').lower()).strip('-')
+
+
+def load_template(name: str) -> Template:
+    """Load prds/templates/prd-template-<name>.md."""
+    with open(os.path.join(TEMPLATE_DIR, f'prd-template-{name}.md'), encoding='utf-8') as f:
+        lines = f.read().split('\n')
+
+    preamble: List[str] = []
+    sections: List[Section] = []
+    for line in lines:
+        if line.startswith('## '):
+            sections.append(Section(section_key(line), line))
+        elif sections:
+            sections[-1].lines.append(line)
+        else:
+            preamble.append(line)
+    return Template(name, preamble, sections)
+
+
+def _filler(rng: random.Random, placeholder: str) -> str:
+    """Seeded words of about the placeholder's length."""
+    count = max(1, len(placeholder.split()))
+    return ' '.join(rng.choice(WORDS) for _ in range(count))
+
+
+def fill(line: str, rng: random.Random) -> str:
+    """Replace a line's placeholders with filler, keeping '[ ]' checkboxes."""
+    return PLACEHOLDER.sub(lambda match: _filler(rng, match.group(1)), line)
+
+
+def generate_prd(template: Template, size_bytes: int = 0, sections: Optional[Iterable[str]] = None,
+                 grow: Optional[Iterable[str]] = None, seed: int = 0) -> str:
+    """
+    Build a synthetic PRD.
+
+    Args:
+        template: Template to build from
+        size_bytes: Approximate target size; list items are repeated to reach it
+        sections: Section keys to include (default all)
+        grow: Included section keys whose list items are repeated (default all)
+        seed: Filler seed; the same arguments always give the same document
+    """
+    rng = random.Random(seed)
+    wanted = set(sections) if sections is not None else None
+    unknown = (wanted or set()) - set(template.section_keys)
+    if unknown:
+        raise ValueError(f"Unknown sections for {template.name} template: {', '.join(sorted(unknown))}")
+    included = [section for section in template.sections if wanted is None or section.key in wanted]
+    growing = set(grow) if grow is not None else {section.key for section in included}
+
+    head = [fill(line, rng) for line in template.preamble]
+    bodies: Dict[str, List[str]] = {
+        section.key: [fill(line, rng) for line in section.lines] for section in included
+    }
+    size = sum(len(line) + 1 for line in head) + sum(
+        len(section.header) + 1 + sum(len(line) + 1 for line in bodies[section.key])
+        for section in included)
+
+    # Extra list items per section, inserted after the section's last item
+    extras: Dict[str, List[str]] = {section.key: [] for section in included}
+    sources = [(section.key, section.lines[i]) for section in included
+               if section.key in growing for i in section.list_items]
+    while sources and size < size_bytes:
+        for key, line in sources:
+            item = fill(line, rng)
+            extras[key].append(item)
+            size += len(item) + 1
+            if size >= size_bytes:
+                break
+
+    out = list(head)
+    for section in included:
+        out.append(section.header)
+        body = bodies[section.key]
+        items = section.list_items
+        insert_at = items[-1] + 1 if items else len(body)
+        out.extend(body[:insert_at])
+        out.extend(extras[section.key])
+        out.extend(body[insert_at:])
+    return '\n'.join(out)
+
+
+@dataclass
+class CorpusDocument:
+    """One generated benchmark document."""
+    name: str
+    filename: str
+    content: str
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self.content.encode('utf-8'))
+
+
+def build_corpus(sizes_mb: Iterable[float], templates: Iterable[str] = TEMPLATES,
+                 sections: Optional[Iterable[str]] = None, grow: Optional[Iterable[str]] = None,
+                 seed: int = 0) -> List[CorpusDocument]:
+    """One document per template and size."""
+    sections = list(sections) if sections is not None else None
+    grow = list(grow) if grow is not None else None
+    loaded = [load_template(name) for name in templates]
+    known = {key for template in loaded for key in template.section_keys}
+    unknown = (set(sections or ()) | set(grow or ())) - known
+    if unknown:
+        raise ValueError(f"Unknown sections: {', '.join(sorted(unknown))}")
+
+    documents = []
+    for template in loaded:
+        name = template.name
+        # Section names differ between templates; keep the ones this template has
+        template_sections = None if sections is None else [k for k in sections if k in template.section_keys]
+        for size_mb in sizes_mb:
+            content = generate_prd(template, int(size_mb * 1024 * 1024), template_sections, grow, seed)
+            label = f'{name}-{size_mb:g}mb'
+            documents.append(CorpusDocument(label, f'benchmark-{label}.md', content))
+    return documents
+
+
+def write_corpus(documents: Iterable[CorpusDocument], directory: str) -> List[str]:
+    """Write the documents as .md files, e.g. for batch upload testing."""
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for document in documents:
+        path = os.path.join(directory, document.filename)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(document.content)
+        paths.append(path)
+    return paths
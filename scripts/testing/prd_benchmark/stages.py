@@ -0,0 +1,75 @@
+"""
+Timed pipeline stages.
+
+Each stage is timed on its own input, prepared outside the timed region:
+the parse gets the raw content, validation the parse result, and the
+markdown export a PRDResponse built from the parse result the way an
+upload stores it.
+"""
+
+import statistics
+import time
+import uuid
+from datetime import datetime
+from typing import Callable, Dict, List
+
+from fastapi_app.models.prd import PRDResponse
+from fastapi_app.services.prd_classifier import classify_prd
+from fastapi_app.services.prd_parser import PRDParser
+from fastapi_app.services.prd_service import PRDService
+
+from .corpus import CorpusDocument
+
+STAGES = ('parse', 'validate', 'type', 'markdown')
+
+
+def _time(func: Callable[[], object], repeat: int) -> List[float]:
+    """Wall-clock seconds of each of repeat calls."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _stored_prd(service: PRDService, parsed: Dict, document: CorpusDocument) -> PRDResponse:
+    """The PRD an upload of this document would store."""
+    prd_data = service._prd_from_parsed(parsed, document.filename, document.content)
+    row = service._build_prd_dict(str(uuid.uuid4()), prd_data, datetime.utcnow())
+    return PRDResponse(**row)
+
+
+def run_document(document: CorpusDocument, repeat: int, parser: PRDParser = None,
+                 service: PRDService = None) -> Dict[str, Dict[str, float]]:
+    """
+    Time every stage on one document.
+
+    Returns:
+        {stage: {"median_ms", "min_ms", "mb_per_s"}} with throughput taken
+        over the document's size for each stage
+    """
+    parser = parser or PRDParser()
+    service = service or PRDService()
+    content, filename = document.content, document.filename
+
+    parsed = parser.parse_prd_content(content, filename)
+    prd = _stored_prd(service, parsed, document)
+    calls = {
+        'parse': lambda: parser.parse_prd_content(content, filename),
+        'validate': lambda: parser.validate_prd_structure(parsed),
+        'type': lambda: classify_prd(content, filename),
+        'markdown': lambda: service._generate_prd_markdown(prd),
+    }
+
+    results = {}
+    size_mb = document.size_bytes / 1e6
+    for stage in STAGES:
+        timings = _time(calls[stage], repeat)
+        median = statistics.median(timings)
+        results[stage] = {
+            'median_ms': round(median * 1000, 3),
+            'min_ms': round(min(timings) * 1000, 3),
+            'mb_per_s': round(size_mb / median, 2) if median else None,
+        }
+    return results
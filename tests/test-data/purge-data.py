@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Clear all data through the server-side purge job.
+
+Starts a purge with POST /api/v1/purge and polls its progress until it
+finishes. Rows are deleted in bounded batches on the server, and the
+services' in-memory fallback storage is cleared too, so no backend restart
+is needed.
+
+Usage:
+    python tests/test-data/purge-data.py
+    python tests/test-data/purge-data.py --skip-audit --batch-size 5000
+    python tests/test-data/purge-data.py --tables agents prds
+"""
+
+import argparse
+import sys
+import time
+
+import requests
+
+# API base URL
+BASE_URL = "http://localhost:8000/api/v1"
+
+
+def purge(tables, batch_size, skip_audit, poll_interval):
+    """Start a purge job and print its progress until it finishes."""
+    payload = {"skip_audit": skip_audit}
+    if tables:
+        payload["tables"] = tables
+    if batch_size:
+        payload["batch_size"] = batch_size
+
+    response = requests.post(f"{BASE_URL}/purge", json=payload)
+    if response.status_code != 202:
+        print(f"❌ Failed to start purge: {response.status_code} {response.text}")
+        return False
+
+    job = response.json()
+    print(f"🧹 Purge {job['job_id']} started: {', '.join(job['tables'])}")
+    while job["status"] in ("pending", "running"):
+        time.sleep(poll_interval)
+        job = requests.get(f"{BASE_URL}/purge/{job['job_id']}").json()
+        current = job.get("current_table") or "-"
+        print(f"   ⏳ {job['total_deleted']} rows deleted in {job['batches']} batches (now: {current})")
+
+    if job["status"] == "failed":
+        print(f"❌ Purge failed: {job['error']}")
+        return False
+
+    for table, count in job["deleted"].items():
+        print(f"✅ {table}: {count} rows deleted")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tables", nargs="+", help="Tables to clear (default: agents devin_tasks prds)")
+    parser.add_argument("--batch-size", type=int, help="Rows deleted per request")
+    parser.add_argument("--skip-audit", action="store_true", help="Do not audit each deleted row")
+    parser.add_argument("--poll-interval", type=float, default=0.5)
+    args = parser.parse_args()
+
+    try:
+        ok = purge(args.tables, args.batch_size, args.skip_audit, args.poll_interval)
+    except requests.ConnectionError:
+        print(f"❌ Backend not reachable at {BASE_URL}")
+        ok = False
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()